@@ -0,0 +1,45 @@
+"""
+Benchmark of polling the aggregations of a growing DataFrame. Each poll appends a batch of rows and then asks for the
+sum, mean, min, max and std of the column. Without running_stats each aggregation is a pass over the column, with
+running_stats the stats are updated as the rows are appended and each poll is O(1).
+
+Usage: python benchmarks/bench_aggregate.py [rows] [polls]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+AGGREGATIONS = ['sum', 'mean', 'min', 'max', 'std']
+
+
+def run(rows, polls, running_stats):
+    random.seed(0)
+    df = rc.DataFrame({'a': [random.random() for _ in range(rows)]}, running_stats=running_stats)
+    batch = 10
+    new_rows = [[random.random() for _ in range(batch)] for _ in range(polls)]
+
+    def poll():
+        for p, values in enumerate(new_rows):
+            df.append_rows(list(range(rows + p * batch, rows + (p + 1) * batch)), {'a': values})
+            for name in AGGREGATIONS:
+                getattr(df, name)('a')
+
+    return timeit.timeit(poll, number=1) / polls
+
+
+def main(rows, polls):
+    results = rc.DataFrame(columns=['seconds per poll'], index_name='method', sort=False)
+    results.set_cell('single pass', 'seconds per poll', run(rows, polls, False))
+    results.set_cell('running_stats', 'seconds per poll', run(rows, polls, True))
+    print('rows: %d  polls: %d' % (rows, polls))
+    results.print(floatfmt='.6f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 20)
@@ -0,0 +1,38 @@
+"""
+Benchmark of "as of" lookups on a sorted DataFrame. The get_asof() method finds the row with a binary search, compared
+to taking the last row of get_slice(None, t) which copies the whole prefix. The get_asof_many() method finds all of the
+rows in one forward pass over the index.
+
+Usage: python benchmarks/bench_asof.py [rows] [lookups]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def main(rows, lookups):
+    random.seed(0)
+    df = rc.DataFrame({'a': list(range(rows))}, index=list(range(0, rows * 2, 2)), sort=True)
+    keys = sorted([random.randrange(rows * 2) for _ in range(lookups)])
+
+    slice_time = timeit.timeit(lambda: [df.get_slice(None, t, ['a'], as_dict=True)[1]['a'][-1] for t in keys],
+                               number=1)
+    asof_time = timeit.timeit(lambda: [df.get_asof(t, 'a') for t in keys], number=1)
+    many_time = timeit.timeit(lambda: df.get_asof_many(keys, 'a', as_list=True), number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('get_slice last row', 'seconds', slice_time)
+    results.set_cell('get_asof', 'seconds', asof_time)
+    results.set_cell('get_asof_many', 'seconds', many_time)
+    print('rows: %d  lookups: %d' % (rows, lookups))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 100000, args[1] if len(args) > 1 else 1000)
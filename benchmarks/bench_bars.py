@@ -0,0 +1,64 @@
+"""
+Benchmark of building one minute OHLC bars from ticks appended one at a time to a sorted DataFrame. A BarBuilder
+attached with bars() updates the open bar on each append_row(), compared to appending the ticks and then resampling
+all of the ticks each time a bar is finished.
+
+Usage: python benchmarks/bench_bars.py [ticks]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+AGGREGATIONS = {'price': ['first', 'max', 'min', 'last'], 'size': 'sum'}
+
+
+def main(ticks):
+    random.seed(0)
+    start = datetime(2020, 1, 1)
+    index = [start + timedelta(seconds=i * 0.5) for i in range(ticks)]
+    rows = [{'price': random.random(), 'size': random.randint(1, 100)} for _ in range(ticks)]
+    width = timedelta(minutes=1)
+
+    def builder():
+        df = rc.DataFrame(columns=['price', 'size'], sort=True)
+        df.bars(width, 'price', volume='size')
+        for i in range(ticks):
+            df.append_row(index[i], rows[i])
+
+    attached = timeit.timeit(builder, number=1)
+
+    def rescan():
+        df = rc.DataFrame(columns=['price', 'size'], sort=True)
+        bar = start
+        for i in range(ticks):
+            if index[i] >= bar + width:
+                df.resample(width).agg(AGGREGATIONS)
+                bar = index[i]
+            df.append_row(index[i], rows[i])
+
+    rebuilt = timeit.timeit(rescan, number=1)
+
+    def append_only():
+        df = rc.DataFrame(columns=['price', 'size'], sort=True)
+        for i in range(ticks):
+            df.append_row(index[i], rows[i])
+
+    baseline = timeit.timeit(append_only, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('append_row with bars', 'seconds', attached)
+    results.set_cell('resample per bar', 'seconds', rebuilt)
+    results.set_cell('append_row only', 'seconds', baseline)
+    print('ticks: %d  bars: %d' % (ticks, ticks // 120))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 100000)
@@ -0,0 +1,68 @@
+"""
+Benchmark of range, equality and top n queries on a value column. With create_index() the queries are a binary search
+of the secondary index, compared to a scan of the column. Also times keeping the index in sync through set_cell().
+
+Usage: python benchmarks/bench_column_index.py [rows] [queries]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def make_frame(rows):
+    return rc.DataFrame({'price': [random.random() * 100 for _ in range(rows)]}, columns=['price'], sort=True)
+
+
+def main(rows, queries):
+    random.seed(0)
+    df = make_frame(rows)
+    starts = [random.random() * 99 for _ in range(queries)]
+
+    def scan():
+        index = df.index
+        prices = df.get_entire_column('price', as_list=True)
+        for start in starts:
+            [index[i] for i, x in enumerate(prices) if start <= x <= start + 0.01]
+        [index[i] for i in sorted(range(len(prices)), key=prices.__getitem__, reverse=True)[:10]]
+
+    scanned = timeit.timeit(scan, number=1)
+
+    created = timeit.timeit(lambda: df.create_index('price'), number=1)
+
+    def find():
+        for start in starts:
+            df.find_range('price', start, start + 0.01)
+        df.find_top('price', 10)
+
+    indexed = timeit.timeit(find, number=1)
+
+    locations = [random.randrange(rows) for _ in range(queries)]
+    values = [random.random() * 100 for _ in range(queries)]
+    index = df.index
+
+    def set_cells():
+        for i, value in zip(locations, values):
+            df.set_cell(index[i], 'price', value)
+
+    with_index = timeit.timeit(set_cells, number=1)
+    df.drop_index('price')
+    without_index = timeit.timeit(set_cells, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('scan queries', 'seconds', scanned)
+    results.set_cell('create_index', 'seconds', created)
+    results.set_cell('indexed queries', 'seconds', indexed)
+    results.set_cell('set_cell with index', 'seconds', with_index)
+    results.set_cell('set_cell without index', 'seconds', without_index)
+    print('rows: %d  queries: %d' % (rows, queries))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 100)
@@ -0,0 +1,56 @@
+"""
+Benchmark of the ChunkedList container against list for inserts, deletes and item access at random locations. The
+list insert and delete costs grow linearly with the length while the ChunkedList costs stay close to flat.
+
+Usage: python benchmarks/bench_containers.py [sizes...]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+from raccoon.containers import ChunkedList  # noqa: E402
+
+OPERATIONS = 1000
+
+
+def run(rows, container):
+    random.seed(0)
+    values = container(range(rows))
+    locations = [random.randrange(rows) for _ in range(OPERATIONS)]
+
+    def inserts():
+        for i in locations:
+            values.insert(i, None)
+
+    def deletes():
+        for i in locations:
+            del values[i]
+
+    def gets():
+        for i in locations:
+            values[i]
+
+    result = dict()
+    for name, func in [('insert', inserts), ('delete', deletes), ('get', gets)]:
+        result[name] = timeit.timeit(func, number=1) / OPERATIONS * 1e6
+    return result
+
+
+def main(sizes):
+    columns = ['%s %s us' % (container, operation) for operation in ['insert', 'delete', 'get']
+               for container in ['list', 'chunked']]
+    results = rc.DataFrame(columns=columns, index_name='rows', sort=True)
+    for rows in sizes:
+        for name, container in [('list', list), ('chunked', ChunkedList)]:
+            result = run(rows, container)
+            for operation in result:
+                results.set_cell(rows, '%s %s us' % (name, operation), result[operation])
+    results.print(floatfmt='.3f')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
@@ -0,0 +1,55 @@
+"""
+Benchmark of deleting many rows from a DataFrame. The delete_rows() method compacts each column in one pass, compared
+to deleting the rows one at a time from each column list.
+
+Usage: python benchmarks/bench_delete.py [rows] [deletes]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c']
+
+
+def make_frame(rows):
+    return rc.DataFrame({c: list(range(rows)) for c in COLUMNS}, columns=COLUMNS, sort=False)
+
+
+def main(rows, deletes):
+    random.seed(0)
+    mask = [False] * rows
+    for i in random.sample(range(rows), deletes):
+        mask[i] = True
+
+    df = make_frame(rows)
+    compaction = timeit.timeit(lambda: df.delete_rows(mask), number=1)
+
+    df = make_frame(rows)
+    data = df.data
+    index = df.index
+    locations = sorted([i for i, x in enumerate(mask) if x], reverse=True)
+
+    def one_at_a_time():
+        for column in data:
+            for i in locations:
+                del column[i]
+        for i in locations:
+            del index[i]
+
+    single = timeit.timeit(one_at_a_time, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('delete_rows compaction', 'seconds', compaction)
+    results.set_cell('del per row', 'seconds', single)
+    print('rows: %d  deletes: %d  columns: %d' % (rows, deletes, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 100000)
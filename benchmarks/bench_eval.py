@@ -0,0 +1,43 @@
+"""
+Benchmark of building a derived column with eval() in one fused pass compared to chaining the math helper methods,
+which builds an intermediate list for each operation. With NumPy installed the float dtype columns are evaluated as one
+vectorized kernel.
+
+Usage: python benchmarks/bench_eval.py [rows]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c']
+
+
+def make_frame(rows, dtypes=None):
+    random.seed(0)
+    return rc.DataFrame({c: [random.random() for _ in range(rows)] for c in COLUMNS}, columns=COLUMNS, dtypes=dtypes)
+
+
+def chained(df):
+    df['bc'] = df.multiply('b', 'c')
+    df['d'] = df.add('a', 'bc')
+
+
+def main(rows):
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    df = make_frame(rows)
+    results.set_cell('chained helpers', 'seconds', timeit.timeit(lambda: chained(df), number=1))
+    results.set_cell('eval list', 'seconds', timeit.timeit(lambda: df.eval('a + b * c', 'd'), number=1))
+    df = make_frame(rows, {c: 'd' for c in COLUMNS})
+    results.set_cell('eval dtype', 'seconds', timeit.timeit(lambda: df.eval('a + b * c', 'd'), number=1))
+    print('rows: %d' % rows)
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,57 @@
+"""
+Benchmark of writing a DataFrame to a file and reading it back. to_file() writes the columns with a dtype as fixed width
+blocks that from_file() reads through a memory map with no copy, compared to the JSON methods that decode every value.
+The sum of a column after the open shows the cost of loading the pages on demand.
+
+Usage: python benchmarks/bench_file.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c', 'd']
+
+
+def main(rows):
+    df = rc.DataFrame({column: [x / (c + 1) for x in range(rows)] for c, column in enumerate(COLUMNS)},
+                      columns=COLUMNS, sort=True, dtypes={column: 'd' for column in COLUMNS})
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, 'bench.json')
+    path = os.path.join(directory, 'bench.rc')
+
+    def write_json():
+        with open(json_path, 'w') as file:
+            df.to_json_file(file)
+
+    def read_json():
+        with open(json_path) as file:
+            return rc.DataFrame.from_json_file(file)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('to_json_file', 'seconds', timeit.timeit(write_json, number=1))
+    results.set_cell('to_file', 'seconds', timeit.timeit(lambda: df.to_file(path), number=1))
+    results.set_cell('from_json_file', 'seconds', timeit.timeit(read_json, number=1))
+    results.set_cell('from_file no memory map', 'seconds',
+                     timeit.timeit(lambda: rc.DataFrame.from_file(path, memory_map=False), number=1))
+    results.set_cell('from_file', 'seconds', timeit.timeit(lambda: rc.DataFrame.from_file(path), number=1))
+    mapped = rc.DataFrame.from_file(path)
+    results.set_cell('sum of column after from_file', 'seconds', timeit.timeit(lambda: mapped.sum('a'), number=1))
+    batch = df.tail(1000)
+    batch.index = [x + rows for x in batch.index]
+    results.set_cell('to_file append 1000 rows', 'seconds',
+                     timeit.timeit(lambda: batch.to_file(path, append=True), number=1))
+    for name in [json_path, path]:
+        os.remove(name)
+    print('rows: %d  columns: %d' % (rows, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,38 @@
+"""
+Benchmark of grouping a DataFrame by a key column and summing a value column. The groupby() method builds the group
+row locations in one pass over the key column and aggregates each column directly, compared to grouping by hand with a
+dict of lists built from iterrows().
+
+Usage: python benchmarks/bench_groupby.py [rows] [groups]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def by_hand(df):
+    groups = dict()
+    for row in df.iterrows(index=False):
+        groups.setdefault(row['k'], []).append(row['v'])
+    return {key: sum(values) for key, values in groups.items()}
+
+
+def main(rows, groups):
+    random.seed(0)
+    df = rc.DataFrame({'k': [random.randrange(groups) for _ in range(rows)],
+                       'v': [random.random() for _ in range(rows)], 'w': list(range(rows))}, columns=['k', 'v', 'w'])
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('iterrows dict', 'seconds', timeit.timeit(lambda: by_hand(df), number=1))
+    results.set_cell('groupby agg', 'seconds', timeit.timeit(lambda: df.groupby('k').agg({'v': 'sum'}), number=1))
+    print('rows: %d  groups: %d' % (rows, groups))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 1000)
@@ -0,0 +1,47 @@
+"""
+Benchmark of index value lookups on unsorted DataFrames with and without the hash index. With the hash index the cost
+of a lookup should stay flat as the DataFrame grows, without it the cost grows linearly with the number of rows.
+
+Usage: python benchmarks/bench_index.py [sizes...]
+"""
+
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+LOOKUPS = 1000
+
+
+def make_frame(rows, hash_index):
+    index = ['row_%d' % x for x in range(rows)]
+    return rc.DataFrame({'a': list(range(rows)), 'b': list(range(rows))}, index=index, columns=['a', 'b'],
+                        sort=False, hash_index=hash_index)
+
+
+def run(rows):
+    targets = ['row_%d' % (rows * x // LOOKUPS) for x in range(LOOKUPS)]
+    result = dict()
+    for hash_index in [False, True]:
+        df = make_frame(rows, hash_index)
+
+        def lookups():
+            for x in targets:
+                df.get_cell(x, 'b')
+
+        result[hash_index] = min(timeit.repeat(lookups, number=1, repeat=3)) / LOOKUPS * 1e6
+    return result
+
+
+def main(sizes):
+    results = rc.DataFrame(columns=['list us/lookup', 'hash us/lookup'], index_name='rows', sort=True)
+    for rows in sizes:
+        result = run(rows)
+        results.set_row(rows, {'list us/lookup': result[False], 'hash us/lookup': result[True]})
+    results.print(floatfmt='.3f')
+
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [1000, 10000, 100000, 500000])
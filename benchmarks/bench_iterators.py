@@ -0,0 +1,60 @@
+"""
+Benchmark of iterating over the rows of a DataFrame. iterrows() and itertuples() zip over the column lists, with the
+namedtuple class cached and plain tuples with name=None, and iterbatches() slices the lists into batches. Compared to
+building the dictionary of each row with a loop over the columns, as the methods did before.
+
+Usage: python benchmarks/bench_iterators.py [rows]
+"""
+
+import sys
+import timeit
+from collections import namedtuple
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c', 'd', 'e']
+
+
+def main(rows):
+    df = rc.DataFrame({c: list(range(rows)) for c in COLUMNS}, columns=COLUMNS, sort=False)
+
+    def dict_rows():
+        for i in range(len(df.index)):
+            row = {df.index_name: df.index[i]}
+            for c, col in enumerate(df.columns):
+                row[col] = df.data[c][i]
+            yield row
+
+    def row_loop():
+        for _ in dict_rows():
+            pass
+
+    def namedtuple_loop():
+        row_tuple = namedtuple('Raccoon', [df.index_name] + df.columns)
+        for row in dict_rows():
+            row_tuple(**row)
+
+    def consume(iterator):
+        for _ in iterator:
+            pass
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('dict per row loop', 'seconds', timeit.timeit(row_loop, number=1))
+    results.set_cell('iterrows', 'seconds', timeit.timeit(lambda: consume(df.iterrows()), number=1))
+    results.set_cell('namedtuple per row loop', 'seconds', timeit.timeit(namedtuple_loop, number=1))
+    results.set_cell('itertuples', 'seconds', timeit.timeit(lambda: consume(df.itertuples()), number=1))
+    results.set_cell('itertuples plain', 'seconds', timeit.timeit(lambda: consume(df.itertuples(name=None)),
+                                                                  number=1))
+    results.set_cell('itertuples 2 columns', 'seconds',
+                     timeit.timeit(lambda: consume(df.itertuples(index=False, name=None, columns=['a', 'b'])),
+                                   number=1))
+    results.set_cell('iterbatches 10000', 'seconds', timeit.timeit(lambda: consume(df.iterbatches(10000)), number=1))
+    print('rows: %d  columns: %d' % (rows, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,48 @@
+"""
+Benchmark of joining two DataFrames on the index. When both are sorted the indexes are merged in one linear pass,
+otherwise the right side is hashed. Compared to building the joined DataFrame by looking up each index value of the
+left side in the right side with get().
+
+Usage: python benchmarks/bench_join.py [rows]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def make_frame(rows, column, sort):
+    index = sorted(random.sample(range(rows * 2), rows))
+    if not sort:
+        random.shuffle(index)
+    return rc.DataFrame({column: list(range(rows))}, index=index, sort=sort)
+
+
+def by_lookup(left, right):
+    right_index = set(right.index)
+    index = [x for x in left.index if x in right_index]
+    return rc.DataFrame({'a': left.get_rows(index, 'a', as_list=True), 'b': right.get_rows(index, 'b', as_list=True)},
+                        index=index, columns=['a', 'b'], sort=left.sort)
+
+
+def main(rows):
+    random.seed(0)
+    results = rc.DataFrame(columns=['sorted', 'unsorted'], index_name='method', sort=False)
+    for sort, name in [(True, 'sorted'), (False, 'unsorted')]:
+        left = make_frame(rows, 'a', sort)
+        right = make_frame(rows, 'b', sort)
+        for how in ['inner', 'left', 'outer']:
+            results.set_cell('join %s' % how, name, timeit.timeit(lambda: left.join(right, how), number=1))
+        if rows <= 100000 or sort:
+            results.set_cell('get_rows lookup inner', name, timeit.timeit(lambda: by_lookup(left, right), number=1))
+    print('rows: %d x %d  seconds' % (rows, rows))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
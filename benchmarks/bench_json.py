@@ -0,0 +1,63 @@
+"""
+Benchmark of writing a DataFrame to a JSON file and reading it back. to_json_file() and from_json_file() write and
+read the file incrementally in chunks, compared to to_json() and from_json() that hold the entire JSON string in
+memory. The peak memory is measured with tracemalloc in a separate run from the time.
+
+Usage: python benchmarks/bench_json.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c', 'd']
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main(rows):
+    df = rc.DataFrame({'a': list(range(rows)), 'b': [x / 3 for x in range(rows)], 'c': [str(x) for x in range(rows)],
+                       'd': [x % 2 == 0 for x in range(rows)]}, columns=COLUMNS, sort=False)
+    path = os.path.join(tempfile.mkdtemp(), 'bench.json')
+
+    def write_string():
+        with open(path, 'w') as file:
+            file.write(df.to_json())
+
+    def write_file():
+        with open(path, 'w') as file:
+            df.to_json_file(file)
+
+    def read_string():
+        with open(path) as file:
+            return rc.DataFrame.from_json(file.read())
+
+    def read_file():
+        with open(path) as file:
+            return rc.DataFrame.from_json_file(file)
+
+    results = rc.DataFrame(columns=['seconds', 'peak MB'], index_name='method', sort=False)
+    for name, function in [('to_json', write_string), ('to_json_file', write_file), ('from_json', read_string),
+                           ('from_json_file', read_file)]:
+        results.set_cell(name, 'seconds', timeit.timeit(function, number=1))
+        results.set_cell(name, 'peak MB', peak_memory(function))
+    os.remove(path)
+    print('rows: %d  columns: %d' % (rows, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,46 @@
+"""
+Benchmark of select_index() with a tuple wildcard compare on a DataFrame with a tuple index. With level_index=True the
+rows are found by intersecting the location sets of each level, compared to scanning every index tuple. Also times
+inserting rows before the end of a sorted DataFrame, which marks the level maps to be rebuilt on the next lookup.
+
+Usage: python benchmarks/bench_level_index.py [symbols] [dates]
+"""
+
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+VENUES = ['X', 'Y', 'Z']
+QUERIES = 10
+INSERTS = 1000
+
+
+def main(symbols, dates):
+    index = [('S%d' % s, d, v) for s in range(symbols) for d in range(dates) for v in VENUES]
+    data = {'a': list(range(len(index)))}
+    compares = [('S%d' % (s % symbols), None, 'X') for s in range(QUERIES)]
+
+    scan = rc.DataFrame(data, index=index, index_name=('symbol', 'date', 'venue'), sort=False)
+    scan_time = timeit.timeit(lambda: [scan.select_index(x) for x in compares], number=1)
+
+    level = rc.DataFrame(data, index=index, index_name=('symbol', 'date', 'venue'), sort=False, level_index=True)
+    level_time = timeit.timeit(lambda: [level.select_index(x) for x in compares], number=1)
+
+    inserts = [('S%d' % (s % symbols), -s, 'X') for s in range(INSERTS)]
+    level = rc.DataFrame(data, index=index, index_name=('symbol', 'date', 'venue'), sort=True, level_index=True)
+    insert_time = timeit.timeit(lambda: [level.set_cell(x, 'a', 0) for x in inserts], number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('scan', 'seconds', scan_time)
+    results.set_cell('level_index', 'seconds', level_time)
+    results.set_cell('sorted inserts', 'seconds', insert_time)
+    print('rows: %d  queries: %d  inserts: %d' % (len(index), QUERIES, INSERTS))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 500, args[1] if len(args) > 1 else 200)
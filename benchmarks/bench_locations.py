@@ -0,0 +1,51 @@
+"""
+Benchmark of positional access on a large unsorted DataFrame. head(), tail(), get_locations() and set_locations()
+read and set the lists directly by location, compared to building a boolean list of every row for head() and tail()
+and looking up the index value of each location with get() and set().
+
+Usage: python benchmarks/bench_locations.py [rows] [repeats]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c']
+LOCATIONS = 100
+
+
+def main(rows, repeats):
+    random.seed(0)
+    df = rc.DataFrame({c: list(range(rows)) for c in COLUMNS}, columns=COLUMNS, index=list(range(rows))[::-1],
+                      sort=False)
+    locations = sorted(random.sample(range(rows), LOCATIONS))
+    values = list(range(LOCATIONS))
+
+    def boolean_tail():
+        df.get(indexes=[False] * (rows - LOCATIONS) + [True] * LOCATIONS)
+
+    def by_index_values():
+        df.get([df.index[x] for x in locations], COLUMNS)
+        df.set([df.index[x] for x in locations], 'a', values)
+
+    def by_locations():
+        df.get_locations(locations, COLUMNS)
+        df.set_locations(locations, 'a', values)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('boolean list tail', 'seconds', timeit.timeit(boolean_tail, number=repeats))
+    results.set_cell('tail', 'seconds', timeit.timeit(lambda: df.tail(LOCATIONS), number=repeats))
+    results.set_cell('get and set by index values', 'seconds', timeit.timeit(by_index_values, number=repeats))
+    results.set_cell('get and set by locations', 'seconds', timeit.timeit(by_locations, number=repeats))
+    results.set_cell('iloc slice', 'seconds', timeit.timeit(lambda: df.iloc[-LOCATIONS:], number=repeats))
+    print('rows: %d  locations: %d  repeats: %d' % (rows, LOCATIONS, repeats))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 100000, args[1] if len(args) > 1 else 10)
@@ -0,0 +1,43 @@
+"""
+Benchmark of selecting rows with a boolean list compared to a Mask. A Mask from equality() or isin() skips the check
+that every value is a boolean, and combining two selections with & is done on the whole Mask at once.
+
+Usage: python benchmarks/bench_mask.py [rows]
+"""
+
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+REPEAT = 10
+
+
+def main(rows):
+    df = rc.DataFrame({'a': [x % 10 for x in range(rows)], 'b': [x % 7 for x in range(rows)]}, columns=['a', 'b'],
+                      sort=False)
+    left = df.equality('a', value=1)
+    right = df.isin('b', [2, 3])
+    left_list = left.to_list()
+    right_list = right.to_list()
+
+    list_and = timeit.timeit(lambda: [x and y for x, y in zip(left_list, right_list)], number=REPEAT) / REPEAT
+    mask_and = timeit.timeit(lambda: left & right, number=REPEAT) / REPEAT
+    list_get = timeit.timeit(lambda: df.get(left_list, 'a', as_list=True), number=REPEAT) / REPEAT
+    mask_get = timeit.timeit(lambda: df.get(left, 'a', as_list=True), number=REPEAT) / REPEAT
+    list_count = timeit.timeit(lambda: left_list.count(True), number=REPEAT) / REPEAT
+    mask_count = timeit.timeit(lambda: left.popcount(), number=REPEAT) / REPEAT
+
+    results = rc.DataFrame(columns=['list seconds', 'Mask seconds'], index_name='operation', sort=False)
+    results.set_row('and', {'list seconds': list_and, 'Mask seconds': mask_and})
+    results.set_row('get rows', {'list seconds': list_get, 'Mask seconds': mask_get})
+    results.set_row('count True', {'list seconds': list_count, 'Mask seconds': mask_count})
+    print('rows: %d' % rows)
+    results.print(floatfmt='.5f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,48 @@
+"""
+Benchmark of the DataFrame math helper methods with the NumPy vectorized path compared to the python list comprehension
+path, for list columns and for columns with a dtype. NumPy must be installed, the python path is timed by hiding it.
+
+Usage: python benchmarks/bench_math.py [rows]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+from raccoon import math_utils  # noqa: E402
+
+NUMPY = math_utils.np
+METHODS = [('add', lambda df: df.add('a', 'b')),
+           ('add as_array', lambda df: df.add('a', 'b', as_array=True)),
+           ('divide', lambda df: df.divide('a', 'b')),
+           ('equality', lambda df: df.equality('a', value=0.5)),
+           ('isin', lambda df: df.isin('a', [0.25, 0.5, 0.75]))]
+
+
+def main(rows):
+    if NUMPY is None:
+        print('numpy is not installed')
+        return
+    random.seed(0)
+    data = {'a': [random.random() for _ in range(rows)], 'b': [random.random() + 1 for _ in range(rows)]}
+    columns = ['python list', 'numpy list', 'numpy dtype']
+    results = rc.DataFrame(columns=columns, index_name='method', sort=False)
+    for column, numpy, dtypes in [('python list', None, None), ('numpy list', NUMPY, None),
+                                  ('numpy dtype', NUMPY, {'a': 'd', 'b': 'd'})]:
+        math_utils.np = numpy
+        df = rc.DataFrame(data, columns=['a', 'b'], dtypes=dtypes)
+        for name, func in METHODS:
+            if name == 'add as_array' and numpy is None:
+                continue
+            results.set_cell(name, column, timeit.timeit(lambda: func(df), number=1))
+    math_utils.np = NUMPY
+    print('rows: %d  seconds' % rows)
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,62 @@
+"""
+Benchmark of resampling a sorted DataFrame of ticks on a datetime index into one minute OHLC bars. The resample()
+method walks the index once and aggregates slices of the columns, compared to a get_slice() per bar and to a
+groupby() on a column of the bar start of each row.
+
+Usage: python benchmarks/bench_resample.py [rows]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+AGGREGATIONS = {'price': ['first', 'max', 'min', 'last'], 'size': 'sum'}
+
+
+def main(rows):
+    random.seed(0)
+    start = datetime(2020, 1, 1)
+    index = [start + timedelta(seconds=i * 0.5) for i in range(rows)]
+    prices = [random.random() for _ in range(rows)]
+    sizes = [random.randint(1, 100) for _ in range(rows)]
+    df = rc.DataFrame({'price': prices, 'size': sizes}, columns=['price', 'size'], index=index, sort=True)
+    width = timedelta(minutes=1)
+
+    resample = timeit.timeit(lambda: df.resample(width).agg(AGGREGATIONS), number=1)
+
+    def per_bar():
+        bars = rc.DataFrame(columns=['open', 'high', 'low', 'close', 'size'], sort=True)
+        bar = start
+        end = df.index[-1]
+        while bar <= end:
+            rows = df.get_slice(bar, bar + width - timedelta(microseconds=1), as_dict=True)[1]
+            if rows['price']:
+                prices = rows['price']
+                bars.append_row(bar, {'open': prices[0], 'high': max(prices), 'low': min(prices), 'close': prices[-1],
+                                      'size': sum(rows['size'])})
+            bar += width
+
+    slices = timeit.timeit(per_bar, number=1)
+
+    def groupby():
+        df['bar'] = [start + ((x - start) // width) * width for x in df.index]
+        return df.groupby('bar').agg(AGGREGATIONS)
+
+    hashed = timeit.timeit(groupby, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('resample agg', 'seconds', resample)
+    results.set_cell('get_slice per bar', 'seconds', slices)
+    results.set_cell('groupby bar column', 'seconds', hashed)
+    print('rows: %d  bars: %d' % (rows, len(df.resample(width))))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
@@ -0,0 +1,49 @@
+"""
+Benchmark of keeping the last N rows of a stream. The RollingDataFrame evicts the oldest row in O(1) when a row is
+appended, compared to append_row() followed by delete_rows() of the oldest row on a DataFrame which shifts every
+column list.
+
+Usage: python benchmarks/bench_rolling.py [capacity] [appends]
+"""
+
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c']
+
+
+def main(capacity, appends):
+    row = {c: 1.0 for c in COLUMNS}
+    start = {c: [1.0] * capacity for c in COLUMNS}
+
+    df = rc.RollingDataFrame(start, columns=COLUMNS, capacity=capacity, sort=True)
+
+    def rolling():
+        for x in range(capacity, capacity + appends):
+            df.append_row(x, row)
+
+    rolling_time = timeit.timeit(rolling, number=1)
+
+    df = rc.DataFrame(start, columns=COLUMNS, sort=True)
+
+    def append_delete():
+        for x in range(capacity, capacity + appends):
+            df.append_row(x, row)
+            df.delete_rows(df.index[0])
+
+    append_delete_time = timeit.timeit(append_delete, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('RollingDataFrame append_row', 'seconds', rolling_time)
+    results.set_cell('DataFrame append_row + delete_rows', 'seconds', append_delete_time)
+    print('capacity: %d  appends: %d  columns: %d' % (capacity, appends, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 100000, args[1] if len(args) > 1 else 10000)
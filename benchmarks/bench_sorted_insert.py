@@ -0,0 +1,49 @@
+"""
+Benchmark of inserting a batch of new rows into a sorted DataFrame. The set_column() method merges the whole batch in
+one pass, compared to inserting the rows one at a time with set_cell().
+
+Usage: python benchmarks/bench_sorted_insert.py [rows] [batch]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c', 'd', 'e']
+
+
+def make_frame(rows):
+    index = list(range(0, rows * 2, 2))
+    return rc.DataFrame({c: list(range(rows)) for c in COLUMNS}, index=index, columns=COLUMNS, sort=True)
+
+
+def main(rows, batch):
+    random.seed(0)
+    new_index = random.sample(range(1, rows * 2, 2), batch)
+    values = list(range(batch))
+
+    df = make_frame(rows)
+    bulk = timeit.timeit(lambda: df.set_column(new_index, 'a', values), number=1)
+
+    df = make_frame(rows)
+
+    def one_at_a_time():
+        for x, value in zip(new_index, values):
+            df.set_cell(x, 'a', value)
+
+    single = timeit.timeit(one_at_a_time, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('set_column bulk merge', 'seconds', bulk)
+    results.set_cell('set_cell per row', 'seconds', single)
+    print('rows: %d  batch: %d  columns: %d' % (rows, batch, len(COLUMNS)))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 5000)
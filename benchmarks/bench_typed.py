@@ -0,0 +1,40 @@
+"""
+Benchmark of the memory used by a numeric DataFrame column stored as a list of python floats compared to a column with
+a dtype stored as a TypedList backed by an array.array, and the time to sort the DataFrame by the index.
+
+Usage: python benchmarks/bench_typed.py [rows]
+"""
+
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def make_frame(rows, dtypes):
+    random.seed(0)
+    index = random.sample(range(rows), rows)
+    tracemalloc.start()
+    df = rc.DataFrame({'a': [random.random() for _ in range(rows)]}, index=index, sort=False, dtypes=dtypes)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return df, memory
+
+
+def main(rows):
+    results = rc.DataFrame(columns=['MB', 'sort seconds'], index_name='method', sort=False)
+    for name, dtypes in [('list', None), ("dtype 'd'", {'a': 'd'})]:
+        df, memory = make_frame(rows, dtypes)
+        results.set_cell(name, 'MB', memory / 2 ** 20)
+        results.set_cell(name, 'sort seconds', timeit.timeit(df.sort_index, number=1))
+    print('rows: %d' % rows)
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000)
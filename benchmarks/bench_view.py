@@ -0,0 +1,54 @@
+"""
+Benchmark of taking many small windows of rows from a large sorted DataFrame and reading the last row of each. A
+ViewDataFrame from get_slice(as_view=True) or view() does not copy the data, compared to get_slice() and get() that
+copy the rows into a new DataFrame.
+
+Usage: python benchmarks/bench_view.py [rows] [windows]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+COLUMNS = ['a', 'b', 'c', 'd']
+WINDOW = 100
+
+
+def main(rows, windows):
+    random.seed(0)
+    df = rc.DataFrame({c: list(range(rows)) for c in COLUMNS}, columns=COLUMNS, sort=True)
+    starts = [random.randrange(rows - WINDOW) for _ in range(windows)]
+
+    def copies():
+        for start in starts:
+            df.get_slice(start, start + WINDOW - 1, ['a', 'b']).get_location(-1, 'a')
+
+    copied = timeit.timeit(copies, number=1)
+
+    def slice_views():
+        for start in starts:
+            df.get_slice(start, start + WINDOW - 1, ['a', 'b'], as_view=True).get_location(-1, 'a')
+
+    sliced = timeit.timeit(slice_views, number=1)
+
+    def location_views():
+        for start in starts:
+            df.view(start, start + WINDOW, ['a', 'b']).get_location(-1, 'a')
+
+    located = timeit.timeit(location_views, number=1)
+
+    results = rc.DataFrame(columns=['seconds'], index_name='method', sort=False)
+    results.set_cell('get_slice copy', 'seconds', copied)
+    results.set_cell('get_slice as_view', 'seconds', sliced)
+    results.set_cell('view', 'seconds', located)
+    print('rows: %d  windows: %d  window rows: %d' % (rows, windows, WINDOW))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 1000000, args[1] if len(args) > 1 else 10000)
@@ -0,0 +1,42 @@
+"""
+Benchmark of rolling window calculations on a sorted Series. The rolling() methods walk the data once with running
+totals and a monotonic deque for the min and max, compared to calling get_slice() for every window, which copies each
+window.
+
+Usage: python benchmarks/bench_window.py [rows] [window]
+"""
+
+import random
+import sys
+import timeit
+
+sys.path.insert(0, '.')
+
+import raccoon as rc  # noqa: E402
+
+
+def by_slice(srs, window, func):
+    index = srs.index
+    result = list()
+    for i in range(len(index)):
+        values = srs.get_slice(index[max(0, i - window + 1)], index[i], as_list=True)[1]
+        result.append(func(values))
+    return result
+
+
+def main(rows, window):
+    random.seed(0)
+    srs = rc.Series([random.random() for _ in range(rows)], index=list(range(rows)), sort=True)
+    results = rc.DataFrame(columns=['rolling', 'get_slice'], index_name='method', sort=False)
+    for name, func in [('sum', sum), ('mean', lambda x: sum(x) / len(x)), ('min', min), ('max', max)]:
+        rolling = srs.rolling(window, min_periods=1)
+        results.set_cell(name, 'rolling', timeit.timeit(getattr(rolling, name), number=1))
+        results.set_cell(name, 'get_slice', timeit.timeit(lambda: by_slice(srs, window, func), number=1))
+    results.set_cell('std', 'rolling', timeit.timeit(srs.rolling(window).std, number=1))
+    print('rows: %d  window: %d  seconds' % (rows, window))
+    results.print(floatfmt='.4f')
+
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    main(args[0] if args else 100000, args[1] if len(args) > 1 else 100)
@@ -1,6 +1,6 @@
 import pkg_resources
 
-from .dataframe import DataFrame
+from .dataframe import DataFrame, RollingDataFrame, ViewDataFrame
 from .series import Series, ViewSeries
 
 # if running in development there may not be a package
@@ -9,4 +9,4 @@ try:
 except pkg_resources.DistributionNotFound:
     __version__ = 'development'
 
-__all__ = ['DataFrame', 'Series', 'ViewSeries']
+__all__ = ['DataFrame', 'RollingDataFrame', 'ViewDataFrame', 'Series', 'ViewSeries']
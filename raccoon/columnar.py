@@ -0,0 +1,294 @@
+"""
+Binary columnar file format for DataFrame.to_file() and DataFrame.from_file()
+
+The file is a header followed by one or more batches of rows. The header has the columns, index_name, sort, dtypes and
+byte order. Each batch has a descriptor with the number of rows and the size of each block, then one block for the index
+and one block for each column. A column with a dtype is a block of the fixed width values in the machine format of the
+array type code, followed by a block of the None locations if there are None values. The index and the other columns
+are a pickle of the list of values, so tuples, datetimes and other python objects keep their type. Every block starts
+on an 8 byte boundary so the fixed width blocks can be read through a memory map without a copy.
+
+Writing with append=True adds a batch to the end of an existing file. Reading a file with one batch reads the fixed
+width columns straight from the memory map, so the pages are only loaded when the values are used. With more than one
+batch the blocks of each column are joined into one buffer.
+
+The pickle blocks are loaded with pickle, so only read files from a trusted source.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from operator import lt
+
+from raccoon.containers import TypedList
+
+MAGIC = b'RACCOON\x01'
+_LENGTH = struct.Struct('<Q')
+
+
+def _padding(size):
+    """
+    Return the padding bytes to move from size to the next 8 byte boundary
+
+    :param size: number of bytes
+    :return: bytes
+    """
+    return bytes(-size % 8)
+
+
+def _object_block(values):
+    """
+    Return the block of a list of python objects
+
+    :param values: list
+    :return: tuple of (type code or None, values bytes, nulls bytes)
+    """
+    return None, pickle.dumps(values if type(values) is list else list(values), pickle.HIGHEST_PROTOCOL), b''
+
+
+def _typed_block(values, typecode):
+    """
+    Return the fixed width block of a list of numbers
+
+    :param values: list or TypedList
+    :param typecode: array type code
+    :return: tuple of (type code, values bytes, nulls bytes)
+    """
+    if not (isinstance(values, TypedList) and values.typecode == typecode):
+        values = TypedList(typecode, values)
+    buffer, nulls = values.buffers()
+    return typecode, buffer, nulls if nulls is not None else b''
+
+
+def _index_block(index):
+    """
+    Return the block of the index, fixed width if all the values are int or all are float so the index is decoded in
+    one step when read
+
+    :param index: list of index values
+    :return: tuple of (type code or None, values bytes, nulls bytes)
+    """
+    types = set(map(type, index))
+    if types == {int} or types == {float}:
+        try:
+            return _typed_block(index, 'q' if types == {int} else 'd')
+        except OverflowError:
+            pass
+    return _object_block(index)
+
+
+def _write_batch(file, dataframe, header):
+    """
+    Write one batch of all the rows of the DataFrame
+
+    :param file: file object open for writing bytes
+    :param dataframe: DataFrame
+    :param header: dictionary of the header of the file
+    :return: nothing
+    """
+    index = dataframe.index
+    dtypes = header['dtypes']
+    blocks = [_index_block(index)]
+    for column in header['columns']:
+        values = dataframe.get_entire_column(column, as_list=True)
+        blocks.append(_typed_block(values, dtypes[column]) if column in dtypes else _object_block(values))
+    descriptor = pickle.dumps({'rows': len(index), 'last': index[-1],
+                               'blocks': [(typecode, len(values), len(nulls)) for typecode, values, nulls in blocks]},
+                              pickle.HIGHEST_PROTOCOL)
+    file.write(_LENGTH.pack(len(descriptor)))
+    file.write(descriptor)
+    file.write(_padding(_LENGTH.size + len(descriptor)))
+    for _, values, nulls in blocks:
+        for buffer in (values, nulls):
+            file.write(buffer)
+            file.write(_padding(len(buffer)))
+
+
+def _read_header(view):
+    """
+    Read the header at the start of the file
+
+    :param view: memoryview of the file
+    :return: tuple of (header dictionary, location of the first batch)
+    """
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise ValueError('not a raccoon file')
+    return _read_pickle(view, len(MAGIC))
+
+
+def _read_pickle(view, location):
+    """
+    Read the length and pickle at a location in the file
+
+    :param view: memoryview of the file
+    :param location: location in the file
+    :return: tuple of (object, location after the pickle and padding)
+    """
+    start = location + _LENGTH.size
+    length = _LENGTH.unpack_from(view, location)[0]
+    if start + length > len(view):
+        raise ValueError('file is truncated')
+    return pickle.loads(view[start:start + length]), start + length + len(_padding(start + length))
+
+
+def _read_batches(view, location):
+    """
+    Iterate over the batches of the file
+
+    :param view: memoryview of the file
+    :param location: location of the first batch
+    :return: iterator of tuple of (descriptor dictionary, list of tuple of (values memoryview, nulls memoryview))
+    """
+    while location < len(view):
+        descriptor, location = _read_pickle(view, location)
+        blocks = list()
+        for _, size, null_size in descriptor['blocks']:
+            values = view[location:location + size]
+            location += size + len(_padding(size))
+            nulls = view[location:location + null_size]
+            location += null_size + len(_padding(null_size))
+            blocks.append((values, nulls))
+        if location > len(view):
+            raise ValueError('file is truncated')
+        yield descriptor, blocks
+
+
+def _typed_list(typecode, parts, byteorder):
+    """
+    Return the TypedList of the blocks of a column. One block is read from the buffer with no copy.
+
+    :param typecode: array type code
+    :param parts: list of tuple of (number of rows, values memoryview, nulls memoryview) for each batch
+    :param byteorder: byte order of the file
+    :return: TypedList
+    """
+    values = parts[0][1] if len(parts) == 1 else b''.join(part[1] for part in parts)
+    if byteorder != sys.byteorder:
+        swapped = array(typecode)
+        swapped.frombytes(values)
+        swapped.byteswap()
+        values = swapped
+    nulls = None
+    if any(len(part[2]) for part in parts):
+        nulls = bytearray().join(part[2] if len(part[2]) else bytes(part[0]) for part in parts)
+    typed = TypedList.from_buffer(typecode, values, nulls)
+    if len(typed) != sum(part[0] for part in parts):
+        raise ValueError('file is corrupted, the column length does not match the number of rows')
+    return typed
+
+
+def _open(path, memory_map):
+    """
+    Return a memoryview of the file
+
+    :param path: path of the file
+    :param memory_map: if True a memory map of the file, otherwise the file is read into memory
+    :return: memoryview
+    """
+    with open(path, 'rb') as file:
+        if memory_map:
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return memoryview(file.read())
+
+
+def write_file(dataframe, path, append=False):
+    """
+    Write the DataFrame to a file. With append=True and an existing file, the rows are added to the end of the file as
+    a new batch. The DataFrame must have the same columns as the file, the dtypes of the file are used for the columns,
+    and for a sorted file the index values must be greater than the last index value of the file.
+
+    :param dataframe: DataFrame
+    :param path: path of the file
+    :param append: if True add the rows to the end of an existing file
+    :return: nothing
+    """
+    if append and os.path.exists(path):
+        # the memory map is closed before the file is opened to append, so it is not left open on the file
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            with memoryview(memory) as view:
+                header, location = _read_header(view)
+                if header['columns'] != dataframe.columns:
+                    raise ValueError('columns must be the same as the columns of the file: %s' % header['columns'])
+                last = list()
+                for descriptor, blocks in _read_batches(view, location):
+                    last = [descriptor['last']]
+                    for values, nulls in blocks:
+                        values.release()
+                        nulls.release()
+        index = last + list(dataframe.index)
+        if header['sort'] and not all(map(lt, index, index[1:])):
+            raise ValueError('index must be sorted and after the last index value of the file')
+        if not len(dataframe):
+            return
+        with open(path, 'ab') as file:
+            _write_batch(file, dataframe, header)
+        return
+
+    header = {'index_name': dataframe.index_name, 'columns': dataframe.columns, 'sort': dataframe.sort,
+              'dtypes': dataframe.dtypes, 'byteorder': sys.byteorder}
+    encoded = pickle.dumps(header, pickle.HIGHEST_PROTOCOL)
+    # write to a new file and replace the path, so a DataFrame that reads the old file through a memory map, which may
+    # be this DataFrame, is not changed
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(MAGIC)
+        file.write(_LENGTH.pack(len(encoded)))
+        file.write(encoded)
+        file.write(_padding(len(MAGIC) + _LENGTH.size + len(encoded)))
+        if len(dataframe):
+            _write_batch(file, dataframe, header)
+    os.replace(temporary, path)
+
+
+def read_file(path, columns=None, memory_map=True):
+    """
+    Read a file written by write_file()
+
+    :param path: path of the file
+    :param columns: list of column names to read, or None for all columns
+    :param memory_map: if True read the file through a memory map so the fixed width columns are not read until they
+        are used, otherwise read the entire file into memory
+    :return: tuple of (header dictionary, list of index values, list of the lists of values of the columns)
+    """
+    view = _open(path, memory_map)
+    header, location = _read_header(view)
+    byteorder = header['byteorder']
+    dtypes = header['dtypes']
+    all_columns = header['columns']
+    columns = all_columns if columns is None else list(columns)
+    missing = [column for column in columns if column not in all_columns]
+    if missing:
+        raise ValueError('columns must be in the columns of the file: %s' % missing)
+
+    # the index is decoded batch by batch as the block of each batch can be fixed width or a pickle
+    index = list()
+    parts = {column: list() for column in columns}
+    locations = [all_columns.index(column) + 1 for column in columns]
+    for descriptor, blocks in _read_batches(view, location):
+        rows = descriptor['rows']
+        typecode = descriptor['blocks'][0][0]
+        if typecode is None:
+            index.extend(pickle.loads(blocks[0][0]))
+        else:
+            index.extend(_typed_list(typecode, [(rows,) + blocks[0]], byteorder)[:])
+        for column, c in zip(columns, locations):
+            parts[column].append((rows,) + blocks[c])
+
+    data = list()
+    for column in columns:
+        if not parts[column]:
+            data.append(TypedList(dtypes[column]) if column in dtypes else list())
+        elif column in dtypes:
+            data.append(_typed_list(dtypes[column], parts[column], byteorder))
+        else:
+            values = list()
+            for _, block, _ in parts[column]:
+                values.extend(pickle.loads(block))
+            if len(values) != len(index):
+                raise ValueError('file is corrupted, the column length does not match the number of rows')
+            data.append(values)
+    header['columns'] = columns
+    return header, index, data
@@ -0,0 +1,1013 @@
+"""
+Pure python list containers. ChunkedList is a drop-in replacement for list that can be used as the dropin parameter of
+the DataFrame and Series, RingBuffer is the fixed capacity list used by the RollingDataFrame, Mask is the compact
+list of booleans used to select rows and TypedList is the compact numeric list used for DataFrame columns with a dtype
+"""
+
+from array import array
+from collections.abc import MutableSequence
+from itertools import chain
+from operator import itemgetter
+
+
+class ChunkedList(MutableSequence):
+    """
+    ChunkedList is a drop-in replacement for list that stores the values in a list of smaller lists (chunks). Inserting
+    or deleting a value in the middle of the list only shifts the values of a single chunk and not the entire list, and
+    the chunk holding a location is found with a Fenwick tree of the chunk lengths. This makes insert and delete
+    O(sqrt n) or better as opposed to O(n) for list, at the cost of slower O(log n) item access.
+
+    Use this as the dropin for sorted DataFrames and Series with many out of order inserts. To use a different chunk
+    size as a dropin, subclass and override DEFAULT_LOAD.
+    """
+    __slots__ = ['_lists', '_tree', '_top', '_len', '_load']
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, iterable=None, load=None):
+        """
+        :param iterable: (optional) values to initialize the list with
+        :param load: target number of values in each chunk, chunks are split when twice this size. If None then
+        DEFAULT_LOAD is used
+        """
+        load = self.DEFAULT_LOAD if load is None else load
+        if load < 2:
+            raise ValueError('load must be at least 2')
+        self._load = load
+        self._reset(list(iterable) if iterable is not None else list())
+
+    def _reset(self, values):
+        """
+        Replace all of the values in the list by rebuilding the chunks
+
+        :param values: list of values
+        :return: nothing
+        """
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._len = len(values)
+        self._tree = None
+
+    def _build_tree(self):
+        """
+        Build the Fenwick tree of the chunk lengths. The tree is 1-based so element zero is not used.
+
+        :return: nothing
+        """
+        tree = [0]
+        tree.extend([len(x) for x in self._lists])
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            j = i + (i & -i)
+            if j <= size:
+                tree[j] += tree[i]
+        self._tree = tree
+        top = 1
+        while top * 2 <= size:
+            top *= 2
+        self._top = top
+
+    def _update_tree(self, k, delta):
+        """
+        Update the length of chunk k in the Fenwick tree. The length of the last chunk is never read from the tree
+        as locations in the last chunk are found directly, so it does not need to be kept current.
+
+        :param k: chunk number
+        :param delta: change in length
+        :return: nothing
+        """
+        tree = self._tree
+        if tree is not None and k < len(self._lists) - 1:
+            size = len(tree) - 1
+            i = k + 1
+            while i <= size:
+                tree[i] += delta
+                i += i & -i
+
+    def _locate(self, i):
+        """
+        Find the chunk and the location in that chunk for location i
+
+        :param i: location, can be negative
+        :return: tuple of (chunk number, location in chunk)
+        """
+        length = self._len
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError('list index out of range')
+        lists = self._lists
+        last_start = length - len(lists[-1])
+        if i >= last_start:
+            return len(lists) - 1, i - last_start
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        size = len(tree) - 1
+        k = 0
+        bit = self._top
+        while bit:
+            t = k + bit
+            if t <= size and tree[t] <= i:
+                i -= tree[t]
+                k = t
+            bit >>= 1
+        return k, i
+
+    def _split(self, k):
+        """
+        Split chunk k in half if it is larger than twice the load
+
+        :param k: chunk number
+        :return: nothing
+        """
+        chunk = self._lists[k]
+        if len(chunk) > 2 * self._load:
+            half = len(chunk) // 2
+            self._lists.insert(k + 1, chunk[half:])
+            del chunk[half:]
+            self._tree = None
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        for chunk in reversed(self._lists):
+            yield from reversed(chunk)
+
+    def __contains__(self, value):
+        return any(value in chunk for chunk in self._lists)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._len)
+            if step != 1:
+                return self.__class__([self[x] for x in range(start, stop, step)], self._load)
+            values = list()
+            if start < stop:
+                k, j = self._locate(start)
+                remaining = stop - start
+                while remaining:
+                    part = self._lists[k][j:j + remaining]
+                    values.extend(part)
+                    remaining -= len(part)
+                    k += 1
+                    j = 0
+            return self.__class__(values, self._load)
+        k, j = self._locate(i)
+        return self._lists[k][j]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            values = list(self)
+            values[i] = value
+            self._reset(values)
+        else:
+            k, j = self._locate(i)
+            self._lists[k][j] = value
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._len)
+            if start == 0 and stop >= self._len and step == 1:
+                self.clear()
+            else:
+                values = list(self)
+                del values[i]
+                self._reset(values)
+            return
+        k, j = self._locate(i)
+        lists = self._lists
+        chunk = lists[k]
+        del chunk[j]
+        self._len -= 1
+        if not chunk:
+            del lists[k]
+            self._tree = None
+        elif len(chunk) < self._load // 4 and k > 0:  # merge small chunks into the previous chunk
+            lists[k - 1].extend(chunk)
+            del lists[k]
+            self._tree = None
+            self._split(k - 1)
+        else:
+            self._update_tree(k, -1)
+
+    def insert(self, i, value):
+        """
+        Insert value before location i
+
+        :param i: location
+        :param value: value to insert
+        :return: nothing
+        """
+        if i < 0:
+            i = max(0, i + self._len)
+        if i >= self._len:
+            self.append(value)
+            return
+        k, j = self._locate(i)
+        self._lists[k].insert(j, value)
+        self._len += 1
+        if len(self._lists[k]) > 2 * self._load:
+            self._split(k)
+        else:
+            self._update_tree(k, 1)
+
+    def append(self, value):
+        """
+        Append value to the end of the list
+
+        :param value: value to append
+        :return: nothing
+        """
+        lists = self._lists
+        if not lists:
+            lists.append([value])
+            self._tree = None
+        else:
+            lists[-1].append(value)
+            if len(lists[-1]) > 2 * self._load:
+                self._split(len(lists) - 1)
+        self._len += 1
+
+    def extend(self, values):
+        """
+        Extend the list by appending all the values from the iterable
+
+        :param values: iterable of values
+        :return: nothing
+        """
+        values = list(values)
+        if not values:
+            return
+        lists = self._lists
+        if not lists:
+            lists.append(list())
+            self._tree = None
+        last = lists[-1]
+        last.extend(values)
+        self._len += len(values)
+        if len(last) > 2 * self._load:
+            load = self._load
+            lists[-1:] = [last[i:i + load] for i in range(0, len(last), load)]
+            self._tree = None
+
+    def clear(self):
+        """
+        Remove all the values from the list
+
+        :return: nothing
+        """
+        self._lists = list()
+        self._len = 0
+        self._tree = None
+
+    def index(self, value, start=0, stop=None):
+        """
+        Return the first location of value. Raises ValueError if the value is not present.
+
+        :param value: value to find
+        :param start: location to start the search
+        :param stop: location to stop the search
+        :return: integer location
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+        offset = 0
+        for chunk in self._lists:
+            end = offset + len(chunk)
+            if end > start and offset < stop:
+                try:
+                    return chunk.index(value, max(start - offset, 0), stop - offset) + offset
+                except ValueError:
+                    pass
+            offset = end
+        raise ValueError('%s is not in list' % repr(value))
+
+    def count(self, value):
+        """
+        Return the number of occurrences of value
+
+        :param value: value to count
+        :return: integer count
+        """
+        return sum(chunk.count(value) for chunk in self._lists)
+
+    def copy(self):
+        """
+        Return a shallow copy of the list
+
+        :return: ChunkedList
+        """
+        new = self.__class__(load=self._load)
+        new._lists = [chunk.copy() for chunk in self._lists]
+        new._len = self._len
+        return new
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place. The key and reverse parameters have the same meaning as for the built-in sort()
+        function.
+
+        :return: nothing
+        """
+        self._reset(sorted(self, key=key, reverse=reverse))
+
+    def reverse(self):
+        """
+        Reverse the list in place
+
+        :return: nothing
+        """
+        self._reset(list(reversed(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, ChunkedList):
+            return self._len == other._len and list(self) == list(other)
+        if isinstance(other, list):
+            return self._len == len(other) and list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        new = self.copy()
+        new.extend(other)
+        return new
+
+    def __radd__(self, other):
+        new = self.__class__(other, self._load)
+        new.extend(self)
+        return new
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self._load)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, repr(list(self)))
+
+
+class RingBuffer(MutableSequence):
+    """
+    RingBuffer is a fixed capacity list stored in a circular buffer. Appending to a full RingBuffer overwrites the
+    oldest value, the value at location zero, in O(1) without shifting any of the other values. Item access is O(1).
+    Inserting or deleting in the middle of the list is O(n) as for list, and inserting before the end of a full
+    RingBuffer raises an IndexError as there is no room for the value. Slices return a list.
+
+    This is the container used for the index and columns of the RollingDataFrame.
+    """
+    __slots__ = ['_buffer', '_start', '_len', '_capacity']
+
+    def __init__(self, iterable=None, capacity=None):
+        """
+        :param iterable: (optional) values to initialize the list with. If longer than the capacity then only the last
+        capacity values are kept
+        :param capacity: maximum number of values. If None then the length of the iterable is used
+        """
+        values = list(iterable) if iterable is not None else list()
+        capacity = max(len(values), 1) if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self._capacity = capacity
+        self._reset(values)
+
+    def _reset(self, values):
+        """
+        Replace all of the values in the buffer, keeping only the last capacity values
+
+        :param values: list of values
+        :return: nothing
+        """
+        values = values[-self._capacity:]
+        self._len = len(values)
+        self._buffer = values + [None] * (self._capacity - self._len)
+        self._start = 0
+
+    def _location(self, i):
+        """
+        Convert a location in the list to a location in the buffer
+
+        :param i: location, can be negative
+        :return: buffer location
+        """
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('list index out of range')
+        return (self._start + i) % self._capacity
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def full(self):
+        """
+        :return: True if the next append will overwrite the oldest value
+        """
+        return self._len == self._capacity
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        end = self._start + self._len
+        if end <= self._capacity:
+            return iter(self._buffer[self._start:end])
+        return chain(self._buffer[self._start:], self._buffer[:end - self._capacity])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._len)
+            if step != 1:
+                return list(self)[i]
+            # read the slice from the buffer in at most two parts without copying the rest of the values
+            start = min(start, stop)
+            begin = self._start + start
+            end = self._start + stop
+            if begin >= self._capacity:
+                return self._buffer[begin - self._capacity:end - self._capacity]
+            if end <= self._capacity:
+                return self._buffer[begin:end]
+            return self._buffer[begin:] + self._buffer[:end - self._capacity]
+        return self._buffer[self._location(i)]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            values = list(self)
+            values[i] = value
+            self._reset(values)
+        else:
+            self._buffer[self._location(i)] = value
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            values = list(self)
+            del values[i]
+            self._reset(values)
+        elif i == 0 or i == -self._len:  # the oldest value is removed by moving the start
+            j = self._location(i)
+            self._buffer[j] = None
+            self._start = (j + 1) % self._capacity
+            self._len -= 1
+        else:
+            self._location(i)  # raises IndexError if out of range
+            values = list(self)
+            del values[i]
+            self._reset(values)
+
+    def insert(self, i, value):
+        """
+        Insert value before location i. Inserting at or after the end is the same as append(). Raises IndexError if
+        the RingBuffer is full and the location is before the end.
+
+        :param i: location
+        :param value: value to insert
+        :return: nothing
+        """
+        if i < 0:
+            i = max(0, i + self._len)
+        if i >= self._len:
+            self.append(value)
+            return
+        if self.full:
+            raise IndexError('cannot insert before the end of a full RingBuffer')
+        values = list(self)
+        values.insert(i, value)
+        self._reset(values)
+
+    def append(self, value):
+        """
+        Append value to the end of the list. If the RingBuffer is full the oldest value is overwritten.
+
+        :param value: value to append
+        :return: nothing
+        """
+        if self._len == self._capacity:
+            self._buffer[self._start] = value
+            self._start = (self._start + 1) % self._capacity
+        else:
+            self._buffer[(self._start + self._len) % self._capacity] = value
+            self._len += 1
+
+    def extend(self, values):
+        """
+        Extend the list by appending all the values from the iterable, overwriting the oldest values when full
+
+        :param values: iterable of values
+        :return: nothing
+        """
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        """
+        Remove all the values from the list
+
+        :return: nothing
+        """
+        self._reset(list())
+
+    def index(self, value, start=0, stop=None):
+        """
+        Return the first location of value. Raises ValueError if the value is not present.
+
+        :param value: value to find
+        :param start: location to start the search
+        :param stop: location to stop the search
+        :return: integer location
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+        return list(self).index(value, start, stop)
+
+    def count(self, value):
+        """
+        Return the number of occurrences of value
+
+        :param value: value to count
+        :return: integer count
+        """
+        return list(self).count(value)
+
+    def copy(self):
+        """
+        Return a shallow copy of the list
+
+        :return: RingBuffer
+        """
+        return self.__class__(self, self._capacity)
+
+    def __eq__(self, other):
+        if isinstance(other, RingBuffer):
+            return self._len == other._len and list(self) == list(other)
+        if isinstance(other, list):
+            return self._len == len(other) and list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self._capacity)
+
+    def __repr__(self):
+        return '%s(%s, capacity=%d)' % (self.__class__.__name__, repr(list(self)), self._capacity)
+
+
+class Mask(object):
+    """
+    Mask is a compact list of booleans stored as one byte per value in a bytearray. It is returned by the equality(),
+    isin() and select_index() methods of the DataFrame and Series, and can be used anywhere a list of booleans is
+    accepted to select rows or columns. Because the type is known the values do not need to be checked one by one.
+
+    The & (and), | (or), ^ (xor) and ~ (not) operators work on the entire Mask at once, and popcount() returns the
+    number of True values without iterating in python. Iterating or indexing returns bool values and a Mask compares
+    equal to a list of the same booleans.
+    """
+    __slots__ = ['_bytes']
+
+    def __init__(self, iterable=None):
+        """
+        :param iterable: (optional) booleans or values that are converted to booleans
+        """
+        if iterable is None:
+            self._bytes = bytearray()
+        elif isinstance(iterable, Mask):
+            self._bytes = bytearray(iterable._bytes)
+        else:
+            self._bytes = bytearray(map(bool, iterable))
+
+    @classmethod
+    def from_locations(cls, length, locations):
+        """
+        Create a Mask that is True at the locations and False everywhere else
+
+        :param length: length of the Mask
+        :param locations: iterable of integer locations
+        :return: Mask
+        """
+        mask = cls()
+        mask._bytes = bytearray(length)
+        for i in locations:
+            mask._bytes[i] = 1
+        return mask
+
+    @classmethod
+    def _from_bytes(cls, data):
+        mask = cls()
+        mask._bytes = bytearray(data)
+        return mask
+
+    @classmethod
+    def _from_int(cls, value, length):
+        mask = cls()
+        mask._bytes = bytearray(value.to_bytes(length, 'little'))
+        return mask
+
+    def _to_int(self):
+        return int.from_bytes(self._bytes, 'little')
+
+    def _other_int(self, other):
+        """
+        Return the other operand as an integer of the bytes, checking the length
+
+        :param other: Mask or list of booleans
+        :return: integer
+        """
+        if not isinstance(other, Mask):
+            other = Mask(other)
+        if len(other._bytes) != len(self._bytes):
+            raise ValueError('Masks must be the same length')
+        return other._to_int()
+
+    def __len__(self):
+        return len(self._bytes)
+
+    def __iter__(self):
+        return map(bool, self._bytes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            mask = self.__class__()
+            mask._bytes = self._bytes[i]
+            return mask
+        return bool(self._bytes[i])
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            self._bytes[i] = Mask(value)._bytes
+        else:
+            self._bytes[i] = 1 if value else 0
+
+    def __and__(self, other):
+        return self._from_int(self._to_int() & self._other_int(other), len(self._bytes))
+
+    def __or__(self, other):
+        return self._from_int(self._to_int() | self._other_int(other), len(self._bytes))
+
+    def __xor__(self, other):
+        return self._from_int(self._to_int() ^ self._other_int(other), len(self._bytes))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self):
+        ones = int.from_bytes(b'\x01' * len(self._bytes), 'little')
+        return self._from_int(self._to_int() ^ ones, len(self._bytes))
+
+    def popcount(self):
+        """
+        Return the number of True values
+
+        :return: integer
+        """
+        return self._bytes.count(1)
+
+    def count(self, value):
+        """
+        Return the number of occurrences of value, the same as list.count()
+
+        :param value: True or False
+        :return: integer count
+        """
+        if value is True or value == 1:
+            return self.popcount()
+        if value is False or value == 0:
+            return len(self._bytes) - self.popcount()
+        return 0
+
+    def locations(self):
+        """
+        Return the locations of the True values
+
+        :return: list of integers
+        """
+        result = list()
+        find = self._bytes.find
+        i = find(1)
+        while i >= 0:
+            result.append(i)
+            i = find(1, i + 1)
+        return result
+
+    def to_list(self):
+        """
+        Return the Mask as a list of booleans
+
+        :return: list
+        """
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, Mask):
+            return self._bytes == other._bytes
+        if isinstance(other, list):
+            return len(self._bytes) == len(other) and list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, repr(list(self)))
+
+
+def is_bool_list(values):
+    """
+    Returns True if values is a Mask or a list of all booleans. A Mask needs no check of the values and for any other
+    list the check stops at the first value that is not a boolean.
+
+    :param values: list or Mask
+    :return: boolean
+    """
+    return isinstance(values, Mask) or all(isinstance(x, bool) for x in values)
+
+
+def take(values, locations):
+    """
+    Returns a new list of the values at a list of locations or a slice of locations. A slice is copied from the list in
+    one step, O(k) for k values, and a list of locations is read with itemgetter.
+
+    :param values: list
+    :param locations: list of locations or slice
+    :return: list
+    """
+    if isinstance(locations, slice):
+        values = values[locations]
+        return values if type(values) is list else list(values)
+    if len(locations) > 1:
+        return list(itemgetter(*locations)(values))
+    return [values[i] for i in locations]
+
+
+class TypedList(MutableSequence):
+    """
+    TypedList is a list of numbers of a single type stored in an array.array, so each value uses the size of the type
+    (8 bytes for 'd' or 'q') and not a python object. None values are allowed and are tracked in a separate bytearray
+    that is only created once there is a None. Slices return a list.
+
+    The array property is the underlying array.array, which supports the buffer protocol so other libraries can read
+    the values without a copy, for example with memoryview(typed_list.array). Locations that are None hold zero in the
+    array, use null_mask() to find them.
+
+    A TypedList made with from_buffer() reads the values from a memoryview of the buffer, such as a memory map of a
+    file, with no copy. The values are copied into an array.array on the first change.
+    """
+    __slots__ = ['_array', '_nulls']
+
+    TYPECODES = 'bBhHiIlLqQfd'
+
+    def __init__(self, typecode, iterable=None):
+        """
+        :param typecode: array.array type code of the values, one of TYPECODES. For example 'd' for float, 'q' for
+        64 bit integer or 'b' for 8 bit integer
+        :param iterable: (optional) values to initialize the list with
+        """
+        if typecode not in self.TYPECODES:
+            raise ValueError('typecode must be one of: %s' % ', '.join(self.TYPECODES))
+        self._array = array(typecode)
+        self._nulls = None  # bytearray with 1 at the locations of None values, None if there are no None values
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_buffer(cls, typecode, buffer, nulls=None):
+        """
+        Return a TypedList of the values in a buffer without a copy. The buffer holds the values in the machine format
+        of the typecode, as returned by buffers().
+
+        :param typecode: array.array type code of the values, one of TYPECODES
+        :param buffer: bytes-like object of the values
+        :param nulls: (optional) bytearray with 1 at the locations of None values
+        :return: TypedList
+        """
+        typed = cls(typecode)
+        values = memoryview(buffer).cast('B')
+        if len(values) % typed._array.itemsize:
+            raise ValueError('buffer length must be a multiple of the size of the typecode')
+        typed._array = values.cast(typecode)
+        if nulls is not None and len(nulls) != len(typed._array):
+            raise ValueError('nulls must be the same length as the values')
+        typed._nulls = nulls
+        return typed
+
+    def buffers(self):
+        """
+        Return the values and the None locations as bytes-like objects without a copy, for writing to a file and
+        reading back with from_buffer()
+
+        :return: tuple of (memoryview of the values as bytes, bytearray of the nulls or None if no None values)
+        """
+        nulls = self._nulls if self._nulls is not None and 1 in self._nulls else None
+        return memoryview(self._array).cast('B'), nulls
+
+    def _writable(self):
+        """
+        Copy the values into an array.array if they are read from a buffer
+
+        :return: array.array
+        """
+        if not isinstance(self._array, array):
+            values = array(self._array.format)
+            values.frombytes(self._array.cast('B'))
+            self._array = values
+        return self._array
+
+    @property
+    def typecode(self):
+        return self._array.typecode if isinstance(self._array, array) else self._array.format
+
+    @property
+    def array(self):
+        """
+        Return the underlying array.array, or the memoryview of the buffer for a TypedList made with from_buffer(). This
+        is a view so any change to it will corrupt the TypedList.
+
+        :return: array.array or memoryview
+        """
+        return self._array
+
+    def __buffer__(self, flags):
+        return memoryview(self._array)
+
+    def null_mask(self):
+        """
+        Return a Mask that is True at the locations of the None values
+
+        :return: Mask
+        """
+        mask = Mask()
+        mask._bytes = bytearray(self._nulls) if self._nulls is not None else bytearray(len(self._array))
+        return mask
+
+    def _make_nulls(self):
+        if self._nulls is None:
+            self._nulls = bytearray(len(self._array))
+        return self._nulls
+
+    def __len__(self):
+        return len(self._array)
+
+    def __iter__(self):
+        if self._nulls is None or not self._nulls.count(1):
+            return iter(self._array)
+        return (None if n else x for x, n in zip(self._array, self._nulls))
+
+    def __contains__(self, value):
+        if value is None:
+            return self._nulls is not None and 1 in self._nulls
+        if self._nulls is None or 1 not in self._nulls:
+            return value in self._array
+        return value in list(self)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            values = self._array[i].tolist()
+            if self._nulls is not None:
+                values = [None if null else x for x, null in zip(values, self._nulls[i])]
+            return values
+        if self._nulls is not None and self._nulls[i]:
+            return None
+        return self._array[i]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self._array))
+            value = value if isinstance(value, list) else list(value)
+            if step == 1 and len(value) == max(stop - start, 0) and None not in value:
+                # same length with no None values, so the values are replaced in place
+                self._writable()[start:stop] = array(self.typecode, value)
+                if self._nulls is not None:
+                    self._nulls[start:stop] = bytes(len(value))
+                return
+            values = list(self)
+            values[i] = value
+            self.clear()
+            self.extend(values)
+        elif value is None:
+            self._writable()[i] = 0
+            self._make_nulls()[i] = 1
+        else:
+            self._writable()[i] = value
+            if self._nulls is not None:
+                self._nulls[i] = 0
+
+    def __delitem__(self, i):
+        del self._writable()[i]
+        if self._nulls is not None:
+            del self._nulls[i]
+
+    def insert(self, i, value):
+        """
+        Insert value before location i
+
+        :param i: location
+        :param value: value to insert
+        :return: nothing
+        """
+        if value is None:
+            nulls = self._make_nulls()
+            self._writable().insert(i, 0)
+            nulls.insert(i, 1)
+        else:
+            self._writable().insert(i, value)
+            if self._nulls is not None:
+                self._nulls.insert(i, 0)
+
+    def append(self, value):
+        """
+        Append value to the end of the list
+
+        :param value: value to append
+        :return: nothing
+        """
+        if value is None:
+            nulls = self._make_nulls()
+            self._writable().append(0)
+            nulls.append(1)
+        else:
+            try:
+                self._array.append(value)
+            except AttributeError:  # memoryview of a buffer
+                self._writable().append(value)
+            if self._nulls is not None:
+                self._nulls.append(0)
+
+    def extend(self, values):
+        """
+        Extend the list by appending all the values from the iterable
+
+        :param values: iterable of values
+        :return: nothing
+        """
+        values = values if isinstance(values, list) else list(values)
+        if None in values:
+            nulls = self._make_nulls()
+            self._writable().extend([0 if x is None else x for x in values])
+            nulls.extend([x is None for x in values])
+        else:
+            self._writable().extend(values)
+            if self._nulls is not None:
+                self._nulls.extend(bytes(len(values)))
+
+    def clear(self):
+        """
+        Remove all the values from the list
+
+        :return: nothing
+        """
+        self._array = array(self.typecode)
+        self._nulls = None
+
+    def index(self, value, start=0, stop=None):
+        """
+        Return the first location of value. Raises ValueError if the value is not present.
+
+        :param value: value to find
+        :param start: location to start the search
+        :param stop: location to stop the search
+        :return: integer location
+        """
+        start, stop, _ = slice(start, stop).indices(len(self._array))
+        return list(self).index(value, start, stop)
+
+    def count(self, value):
+        """
+        Return the number of occurrences of value
+
+        :param value: value to count
+        :return: integer count
+        """
+        if value is None:
+            return self._nulls.count(1) if self._nulls is not None else 0
+        return list(self).count(value)
+
+    def copy(self):
+        """
+        Return a copy of the list
+
+        :return: TypedList
+        """
+        new = self.__class__(self.typecode)
+        new._array = array(self.typecode)
+        new._array.frombytes(memoryview(self._array).cast('B'))
+        new._nulls = bytearray(self._nulls) if self._nulls is not None else None
+        return new
+
+    def __eq__(self, other):
+        if isinstance(other, (TypedList, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return self.__class__, (self.typecode, list(self))
+
+    def __repr__(self):
+        return '%s(%s, %s)' % (self.__class__.__name__, repr(self.typecode), repr(list(self)))
@@ -5,11 +5,19 @@ DataFrame class
 import json
 from bisect import bisect_left, bisect_right
 from collections import OrderedDict, namedtuple
-from itertools import compress
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import compress, repeat
+from numbers import Integral
+from operator import itemgetter
 
 from tabulate import tabulate
 
-from raccoon.sort_utils import sorted_exists, sorted_index, sorted_list_indexes
+from raccoon import columnar, math_utils
+from raccoon.containers import Mask, RingBuffer, TypedList, is_bool_list, take
+from raccoon.sort_utils import ColumnIndex, is_increasing, sorted_asof, sorted_asof_locations, sorted_exists, \
+    sorted_index, sorted_insert_locations, sorted_list_indexes, sorted_merge_locations, splice_values
+from raccoon.window import RollingWindow
 
 
 class DataFrame(object):
@@ -23,9 +31,11 @@ class DataFrame(object):
     index remains sort.
     """
     # Define slots to make object faster
-    __slots__ = ['_data', '_index', '_index_name', '_columns', '_sort', '_dropin']
+    __slots__ = ['_data', '_index', '_index_name', '_columns', '_sort', '_dropin', '_index_map', '_column_map',
+                 '_level_map', '_stats', '_bars', '_value_indexes', '_unordered', '_level_stale']
 
-    def __init__(self, data=None, columns=None, index=None, index_name='index', sort=None, dropin=None):
+    def __init__(self, data=None, columns=None, index=None, index_name='index', sort=None, dropin=None,
+                 hash_index=False, level_index=False, dtypes=None, running_stats=False):
         """
         :param data: (optional) dictionary of lists. The keys of the dictionary will be used for the column names and\
         the lists will be used for the column data.
@@ -34,12 +44,28 @@ class DataFrame(object):
         :param index_name: (optional) name for the index. Default is "index"
         :param sort: if True then DataFrame will keep the index sort. If True all index values must be of same type
         :param dropin: if supplied the drop-in replacement for list that will be used
+        :param hash_index: if True then maintain a dictionary of index value to location so that lookups by index value
+        are O(1) and not a linear scan of the index
+        :param level_index: if True then maintain a dictionary for each level of tuple index values so that
+        select_index() with a tuple compare does not scan the index. Requires the index values to be tuples
+        :param dtypes: (optional) dictionary of column name to array type code, for example 'd' for float or 'q' for
+        integer. These columns are stored as a TypedList. See set_dtypes()
+        :param running_stats: if True then maintain the count, sum, mean, std, min and max of the columns as rows are
+        added, set and deleted, so the aggregation methods are O(1)
         """
         # standard variable setup
         self._index = None
         self._index_name = index_name
         self._columns = None
+        self._column_map = None
         self._dropin = dropin
+        self._index_map = dict() if hash_index else None
+        self._level_map = list() if level_index else None
+        self._stats = dict() if running_stats else None
+        self._bars = None
+        self._value_indexes = None
+        self._unordered = False  # True if appending has left a sorted index out of order
+        self._level_stale = False  # True if the level maps must be rebuilt before the next lookup
 
         # quality checks
         if (index is not None) and not (self._check_list(index) or isinstance(index, list)):
@@ -96,6 +122,10 @@ class DataFrame(object):
             else:
                 self.sort = True
 
+        # setup the typed columns
+        if dtypes:
+            self.set_dtypes(dtypes)
+
     def __repr__(self):
         return 'object id: %s\ncolumns:\n%s\ndata:\n%s\nindex:\n%s\n' % (id(self), self._columns,
                                                                          self._data, self._index)
@@ -104,7 +134,7 @@ class DataFrame(object):
         return self._make_table()
 
     def _check_list(self, x):
-        return type(x) == (self._dropin if self._dropin else list)
+        return type(x) == (self._dropin if self._dropin else list) or isinstance(x, Mask)
 
     def _make_table(self, index=True, **kwargs):
         kwargs['headers'] = 'keys' if 'headers' not in kwargs.keys() else kwargs['headers']
@@ -128,14 +158,15 @@ class DataFrame(object):
         :param columns_list: list of column names. Must include all column names
         :return: nothing
         """
-        if not (all([x in columns_list for x in self._columns]) and all([x in self._columns for x in columns_list])):
+        if set(columns_list) != set(self._columns):
             raise ValueError(
                 'columns_list must be all in current columns, and all current columns must be in columns_list')
-        new_sort = [self._columns.index(x) for x in columns_list]
+        new_sort = [self._column_map[x] for x in columns_list]
         self._data = self._dropin([self._data[x] for x in new_sort]) if self._dropin \
             else [self._data[x] for x in new_sort]
         self._columns = self._dropin([self._columns[x] for x in new_sort]) if self._dropin \
             else [self._columns[x] for x in new_sort]
+        self._rebuild_column_map()
 
     def _pad_data(self, max_len=None):
         """
@@ -164,6 +195,29 @@ class DataFrame(object):
     def columns(self, columns_list):
         self._validate_columns(columns_list)
         self._columns = self._dropin(columns_list) if self._dropin else list(columns_list)
+        self._rebuild_column_map()
+        self._reset_stats()
+        self._rebuild_value_indexes()
+
+    def _rebuild_column_map(self):
+        """
+        Rebuild the column name to location map from the columns.
+
+        :return: nothing
+        """
+        self._column_map = {x: i for i, x in enumerate(self._columns)}
+
+    def _column_location(self, column):
+        """
+        Return the location of a column name in the columns and data.
+
+        :param column: column name
+        :return: integer location. Raises ValueError if the column is not in the columns
+        """
+        try:
+            return self._column_map[column]
+        except KeyError:
+            raise ValueError('%s is not in columns' % repr(column))
 
     @property
     def index(self):
@@ -179,6 +233,9 @@ class DataFrame(object):
     def index(self, index_list):
         self._validate_index(index_list)
         self._index = self._dropin(index_list) if self._dropin else list(index_list)
+        self._unordered = len(self._index) > 1
+        self._rebuild_index_map()
+        self._rebuild_value_indexes()
 
     @property
     def index_name(self):
@@ -192,6 +249,351 @@ class DataFrame(object):
     def dropin(self):
         return self._dropin
 
+    @property
+    def dtypes(self):
+        """
+        Return a dictionary of the column names that have a data type to the array type code of that column.
+
+        :return: dict
+        """
+        return {column: self._data[c].typecode for c, column in enumerate(self._columns)
+                if isinstance(self._data[c], TypedList)}
+
+    def set_dtypes(self, dtypes):
+        """
+        Set the data type of columns. A column with a data type is stored as a TypedList, which keeps the values in an
+        array.array so each value uses only the size of the type and not a python object, and None values are tracked
+        separately. The array is available to other libraries through the buffer protocol with
+        memoryview(df.get_entire_column(column, as_list=True).array). Setting a value that is not of the type raises
+        TypeError.
+
+        :param dictionary of column name to array type code, for example 'd' for float, 'q' for 64 bit integer or
+            'b' for 8 bit integer. A type code of None converts the column back to a list
+        :return: nothing
+        """
+        self._reset_stats(dtypes.keys())
+        for column, typecode in dtypes.items():
+            c = self._column_location(column)
+            if typecode is None:
+                if isinstance(self._data[c], TypedList):
+                    self._data[c] = self._dropin(self._data[c]) if self._dropin else list(self._data[c])
+            else:
+                self._data[c] = TypedList(typecode, self._data[c])
+
+    def _retype(self, c, values):
+        """
+        Return the list of values as the same type of list as the column at location c.
+
+        :param c: column location
+        :param values: list of values
+        :return: TypedList if the column has a data type, otherwise the dropin or list
+        """
+        if isinstance(self._data[c], TypedList):
+            return TypedList(self._data[c].typecode, values)
+        return self._dropin(values) if self._dropin else values
+
+    @property
+    def hash_index(self):
+        """
+        If True then the DataFrame maintains a dictionary of index value to location. This makes lookups by index value
+        O(1) for unsorted DataFrames at the cost of additional memory. Because the map is kept in sync by the DataFrame
+        methods, do not modify the list returned by the index property directly when this is True.
+
+        :return: boolean
+        """
+        return self._index_map is not None
+
+    @hash_index.setter
+    def hash_index(self, boolean):
+        self._index_map = dict() if boolean else None
+        self._rebuild_index_map()
+
+    def _rebuild_index_map(self):
+        """
+        Rebuild the index value to location map from the index, if the hash index is being maintained, and the level
+        maps if the level index is being maintained.
+
+        :return: nothing
+        """
+        if self._index_map is not None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        if self._level_map is not None:
+            self._rebuild_level_map()
+
+    @property
+    def level_index(self):
+        """
+        If True then the DataFrame maintains a dictionary for each level of the tuple index values from the value of
+        that level to the set of locations of the rows with that value. A select_index() with a tuple compare is then
+        the intersection of the location sets for the levels that are not None, and not a scan of every index tuple.
+        All of the index values must be tuples. Because the maps are kept in sync by the DataFrame methods, do not
+        modify the list returned by the index property directly when this is True.
+
+        :return: boolean
+        """
+        return self._level_map is not None
+
+    @level_index.setter
+    def level_index(self, boolean):
+        self._level_map = list() if boolean else None
+        self._rebuild_index_map()
+
+    def _rebuild_level_map(self):
+        """
+        Rebuild the level maps from the index.
+
+        :return: nothing
+        """
+        self._level_map = list()
+        self._level_stale = False
+        self._add_level_locations(self._index, 0)
+
+    @staticmethod
+    def _check_level_indexes(indexes):
+        """
+        Raise a TypeError if any of the index values are not tuples. Called before any change is made to the object so
+        a bad index value does not leave the index and the level maps out of sync.
+
+        :param indexes: list of index values
+        :return: nothing
+        """
+        if not all(isinstance(index, tuple) for index in indexes):
+            raise TypeError('level_index requires all index values to be tuples')
+
+    def _add_level_locations(self, indexes, start):
+        """
+        Add new rows to the level maps.
+
+        :param indexes: list of tuple index values of the new rows
+        :param start: location of the first new row
+        :return: nothing
+        """
+        if self._level_stale:  # the new rows are added when the level maps are rebuilt
+            return
+        level_map = self._level_map
+        for i, index in enumerate(indexes, start):
+            if not isinstance(index, tuple):
+                raise TypeError('level_index requires all index values to be tuples')
+            for level, value in enumerate(index):
+                if level == len(level_map):
+                    level_map.append(dict())
+                level_map[level].setdefault(value, set()).add(i)
+
+    def _level_locations(self, compare):
+        """
+        Return the locations of the rows that match a tuple compare using the level maps. None in any field of the
+        tuple matches all values.
+
+        :param compare: tuple
+        :return: set or range of locations
+        """
+        if self._level_stale:
+            self._rebuild_level_map()
+        sets = list()
+        for level, value in enumerate(compare):
+            if value is not None:
+                if level >= len(self._level_map):
+                    return set()
+                sets.append(self._level_map[level].get(value, set()))
+        if not sets:
+            return range(len(self._index))
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    @property
+    def running_stats(self):
+        """
+        If True then the DataFrame maintains a RunningStats of the count, sum, mean, std, min and max for each column
+        that has been aggregated. The stats are updated in O(1) by append_row(), append_rows(), set_cell() and the
+        delete methods, so the aggregation methods are O(1) and do not iterate the column. Other methods that change
+        the values of a column reset the stats of that column, which are then recalculated on the next aggregation.
+        Because the stats are kept in sync by the DataFrame methods, do not modify the lists returned by the data
+        property directly when this is True.
+
+        :return: boolean
+        """
+        return self._stats is not None
+
+    @running_stats.setter
+    def running_stats(self, boolean):
+        self._stats = dict() if boolean else None
+
+    def _reset_stats(self, columns=None):
+        """
+        Remove the running stats of the columns so that they are recalculated on the next aggregation.
+
+        :param columns: list of column names, if None then all columns
+        :return: nothing
+        """
+        if self._stats is not None:
+            if columns is None:
+                self._stats.clear()
+            else:
+                for column in columns:
+                    self._stats.pop(column, None)
+
+    def _update_stats(self, column, removed=None, added=None):
+        """
+        Update the running stats of a column, if they are being maintained, for values removed from and added to the
+        column.
+
+        :param column: column name
+        :param removed: list of values removed from the column
+        :param added: list of values added to the column
+        :return: nothing
+        """
+        stats = self._stats.get(column) if self._stats is not None else None
+        if stats is None:
+            return
+        try:
+            for value in removed or []:
+                stats.remove(value)
+            for value in added or []:
+                stats.add(value)
+        except TypeError:  # not a number, the stats cannot be maintained
+            del self._stats[column]
+
+    @property
+    def indexed_columns(self):
+        """
+        The columns with a secondary index, see create_index()
+
+        :return: list of column names
+        """
+        return list(self._value_indexes.keys()) if self._value_indexes else []
+
+    def create_index(self, column):
+        """
+        Create a secondary index on the values of a column so that find(), find_range() and find_top() are a binary
+        search, O(log n + k) for k rows, and not a scan of the column. The index is a ColumnIndex of the values sorted
+        with the index value of their row, and is kept in sync by the set, append and delete methods. None values are
+        not in the index, all other values must be comparable with each other. Because the index is kept in sync by the
+        DataFrame methods, do not modify the lists returned by the data property directly for an indexed column.
+
+        :param column: column name
+        :return: nothing
+        """
+        c = self._column_location(column)
+        if self._value_indexes is None:
+            self._value_indexes = dict()
+        self._value_indexes[column] = ColumnIndex(self._data[c], self._index)
+
+    def drop_index(self, column):
+        """
+        Remove the secondary index of a column
+
+        :param column: column name
+        :return: nothing
+        """
+        if column not in self.indexed_columns:
+            raise ValueError('%s is not indexed' % repr(column))
+        del self._value_indexes[column]
+
+    def _rebuild_value_indexes(self, columns=None):
+        """
+        Rebuild the secondary indexes of the columns from the values, and remove the indexes of columns that no longer
+        exist.
+
+        :param columns: list of column names, if None then all indexed columns
+        :return: nothing
+        """
+        if self._value_indexes:
+            for column in (self.indexed_columns if columns is None else columns):
+                if column in self._value_indexes:
+                    if column in self._column_map:
+                        self.create_index(column)
+                    else:
+                        del self._value_indexes[column]
+
+    def _update_value_index(self, column, locations, values):
+        """
+        Update the secondary index of a column, if there is one, for new values set at existing locations. Must be
+        called before the values are set so the current values are still in the column.
+
+        :param column: column name
+        :param locations: list of locations
+        :param values: list of new values
+        :return: nothing
+        """
+        value_index = self._value_indexes.get(column) if self._value_indexes else None
+        if value_index is None:
+            return
+        current = self._data[self._column_map[column]]
+        for i, value in zip(locations, values):
+            value_index.replace(current[i], value, self._index[i])
+
+    def _value_index(self, column):
+        """
+        Return the secondary index of a column
+
+        :param column: column name
+        :return: ColumnIndex
+        """
+        try:
+            return self._value_indexes[column]
+        except (KeyError, TypeError):
+            raise ValueError('%s is not indexed, use create_index()' % repr(column))
+
+    def find(self, column, value):
+        """
+        Return the index values of the rows where the indexed column is equal to the value. See create_index()
+
+        :param column: column name
+        :param value: value to find
+        :return: list of index values
+        """
+        return self._value_index(column).equal(value)
+
+    def find_range(self, column, start=None, stop=None):
+        """
+        Return the index values of the rows where the indexed column is greater than or equal to the start and less
+        than or equal to the stop, in order of the values. See create_index()
+
+        :param column: column name
+        :param start: lowest value to include, or None for no lower limit
+        :param stop: highest value to include, or None for no upper limit
+        :return: list of index values
+        """
+        return self._value_index(column).between(start, stop)
+
+    def find_top(self, column, n, largest=True):
+        """
+        Return the index values of the rows with the n largest values of the indexed column, largest first, or the n
+        smallest values, smallest first. See create_index()
+
+        :param column: column name
+        :param n: number of rows
+        :param largest: if True the largest values, otherwise the smallest
+        :return: list of index values
+        """
+        return self._value_index(column).top(n, largest)
+
+    def _index_location(self, index):
+        """
+        Return the location of an index value using the fastest method available: the hash index if maintained, a
+        binary search if the DataFrame is sorted, or a linear scan otherwise.
+
+        :param index: index value
+        :return: integer location. Raises ValueError if the index value is not in the index
+        """
+        if self._index_map is not None:
+            try:
+                return self._index_map[index]
+            except KeyError:
+                raise ValueError('%s is not in index' % repr(index))
+        return sorted_index(self._index, index) if self._sort else self._index.index(index)
+
+    def _index_exists(self, index):
+        """
+        Returns True if the index value is in the index.
+
+        :param index: index value
+        :return: boolean
+        """
+        if self._index_map is not None:
+            return index in self._index_map
+        return sorted_exists(self._index, index)[0] if self._sort else index in self._index
+
     @property
     def sort(self):
         return self._sort
@@ -210,19 +612,17 @@ class DataFrame(object):
         values.
 
         :param compare: value to compare as a singleton or tuple
-        :param result: 'boolean' = returns a list of booleans, 'value' = returns a list of index values that match
-        :return: list of booleans or values
+        :param result: 'boolean' = returns a Mask of booleans, 'value' = returns a list of index values that match
+        :return: Mask or list of values
         """
-        if isinstance(compare, tuple):
+        if isinstance(compare, tuple) and self._level_map is not None:
+            booleans = Mask.from_locations(len(self._index), self._level_locations(compare))
+        elif isinstance(compare, tuple):
             # this crazy list comprehension will match all the tuples in the list with None being an * wildcard
-            booleans = [all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
-                        for x, v in enumerate(self._index)]
+            booleans = Mask([all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
+                             for x, v in enumerate(self._index)])
         else:
-            booleans = [False] * len(self._index)
-            if self._sort:
-                booleans[sorted_index(self._index, compare)] = True
-            else:
-                booleans[self._index.index(compare)] = True
+            booleans = Mask.from_locations(len(self._index), [self._index_location(compare)])
         if result == 'boolean':
             return booleans
         elif result == 'value':
@@ -269,8 +669,8 @@ class DataFrame(object):
         :param column: column name
         :return: value
         """
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
-        c = self._columns.index(column)
+        i = self._index_location(index)
+        c = self._column_location(column)
         return self._data[c][i]
 
     def get_rows(self, indexes, column, as_list=False):
@@ -282,8 +682,8 @@ class DataFrame(object):
         :param as_list: if True return a list, if False return DataFrame
         :return: DataFrame is as_list if False, a list if as_list is True
         """
-        c = self._columns.index(column)
-        if all([isinstance(i, bool) for i in indexes]):  # boolean list
+        c = self._column_location(column)
+        if is_bool_list(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError('boolean index list must be same size of existing index')
             if all(indexes):  # the entire column
@@ -293,12 +693,13 @@ class DataFrame(object):
                 data = list(compress(self._data[c], indexes))
                 index = list(compress(self._index, indexes))
         else:  # index values list
-            locations = [sorted_index(self._index, x) for x in indexes] if self._sort \
-                else [self._index.index(x) for x in indexes]
+            locations = [self._index_location(x) for x in indexes]
             data = [self._data[c][i] for i in locations]
             index = [self._index[i] for i in locations]
-        return data if as_list else DataFrame(data={column: data}, index=index, index_name=self._index_name,
-                                              sort=self._sort)
+        if as_list:
+            return data
+        # copy so the new DataFrame does not share the lists with this DataFrame, and dropin lists are converted
+        return DataFrame(data={column: list(data)}, index=list(index), index_name=self._index_name, sort=self._sort)
 
     def get_columns(self, index, columns=None, as_dict=False):
         """
@@ -310,7 +711,7 @@ class DataFrame(object):
         :param as_dict: if True then return the result as a dictionary
         :return: DataFrame or dictionary
         """
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
+        i = self._index_location(index)
         return self.get_location(i, columns, as_dict)
 
     def get_entire_column(self, column, as_list=False):
@@ -322,10 +723,13 @@ class DataFrame(object):
         :param as_list: if True return a list, if False return DataFrame
         :return: DataFrame is as_list if False, a list if as_list is True
         """
-        c = self._columns.index(column)
+        c = self._column_location(column)
         data = self._data[c]
-        return data if as_list else DataFrame(data={column: data}, index=self._index, index_name=self._index_name,
-                                              sort=self._sort)
+        if as_list:
+            return data
+        # copy so the new DataFrame does not share the lists with this DataFrame, and dropin lists are converted
+        return DataFrame(data={column: list(data)}, index=list(self._index), index_name=self._index_name,
+                         sort=self._sort)
 
     def get_matrix(self, indexes, columns):
         """
@@ -337,7 +741,7 @@ class DataFrame(object):
         """
         bool_indexes = []
         locations = []
-        if all([isinstance(i, bool) for i in indexes]):  # boolean list
+        if is_bool_list(indexes):  # boolean list
             is_bool_indexes = True
             if len(indexes) != len(self._index):
                 raise ValueError('boolean index list must be same size of existing index')
@@ -345,15 +749,14 @@ class DataFrame(object):
             indexes = list(compress(self._index, indexes))
         else:
             is_bool_indexes = False
-            locations = [sorted_index(self._index, x) for x in indexes] if self._sort \
-                else [self._index.index(x) for x in indexes]
+            locations = [self._index_location(x) for x in indexes]
 
-        if all([isinstance(i, bool) for i in columns]):  # boolean list
+        if is_bool_list(columns):  # boolean list
             if len(columns) != len(self._columns):
                 raise ValueError('boolean column list must be same size of existing columns')
             columns = list(compress(self._columns, columns))
 
-        col_locations = [self._columns.index(x) for x in columns]
+        col_locations = [self._column_location(x) for x in columns]
         data_dict = dict()
 
         for c in col_locations:
@@ -378,16 +781,16 @@ class DataFrame(object):
         """
         if columns is None:
             columns = self._columns
-        elif not isinstance(columns, list):  # single value for columns
-            c = self._columns.index(columns)
+        elif not isinstance(columns, (list, Mask)):  # single value for columns
+            c = self._column_location(columns)
             return self._data[c][location]
-        elif all([isinstance(i, bool) for i in columns]):
+        elif is_bool_list(columns):
             if len(columns) != len(self._columns):
                 raise ValueError('boolean column list must be same size of existing columns')
             columns = list(compress(self._columns, columns))
         data = dict()
         for column in columns:
-            c = self._columns.index(column)
+            c = self._column_location(column)
             data[column] = self._data[c][location]
         index_value = self._index[location]
         if as_dict:
@@ -399,20 +802,43 @@ class DataFrame(object):
             return DataFrame(data=data, index=[index_value], columns=columns, index_name=self._index_name,
                              sort=self._sort)
 
-    def get_locations(self, locations, columns=None, **kwargs):
+    def get_locations(self, locations, columns=None, as_list=False):
         """
-        For list of locations and list of columns return a DataFrame of the values.
+        For a list of locations or a slice of locations and list of columns return a DataFrame of the values. The
+        values are read from the lists directly by location and a slice is copied from each list in one step, so this
+        is O(k) for k rows with no lookup of the index values.
 
-        :param locations: list of index locations
-        :param columns: list of column names
-        :param kwargs: will pass along these parameters to the get() method
-        :return: DataFrame
+        :param locations: list of index locations or a slice of locations
+        :param columns: list of column names, list of booleans, single column name, or None to include all columns
+        :param as_list: if True and columns is a single column name then return a list of the values
+        :return: DataFrame, or list if as_list is True and columns is a single column name
+        """
+        single = columns is not None and not self._check_list(columns)
+        if columns is None:
+            columns = self._columns
+        elif single:
+            columns = [columns]
+        elif is_bool_list(columns):
+            if len(columns) != len(self._columns):
+                raise ValueError('boolean column list must be same size of existing columns')
+            columns = list(compress(self._columns, columns))
+        data = {column: take(self._data[self._column_location(column)], locations) for column in columns}
+        if single and as_list:
+            return data[columns[0]]
+        return DataFrame(data=data if data else None, index=take(self._index, locations), columns=list(columns),
+                         index_name=self._index_name, sort=self._sort)
+
+    @property
+    def iloc(self):
         """
+        Positional access to the rows by location, list of locations or slice of locations, with optional columns.
+        See LocationIndexer
 
-        indexes = [self._index[x] for x in locations]
-        return self.get(indexes, columns, **kwargs)
+        :return: LocationIndexer
+        """
+        return LocationIndexer(self)
 
-    def get_slice(self, start_index=None, stop_index=None, columns=None, as_dict=False):
+    def get_slice(self, start_index=None, stop_index=None, columns=None, as_dict=False, as_view=False):
         """
         For sorted DataFrames will return either a DataFrame or dict of all of the rows where the index is greater than
         or equal to the start_index if provided and less than or equal to the stop_index if provided. If either the
@@ -423,25 +849,28 @@ class DataFrame(object):
         :param stop_index: highest index value to include, or None to end at the last row
         :param columns: list of column names to include, or None for all columns
         :param as_dict: if True then return a tuple of (list of index, dict of column names: list data values)
-        :return: DataFrame or tuple
+        :param as_view: if True then return a ViewDataFrame of the rows that does not copy the data
+        :return: DataFrame, tuple or ViewDataFrame
         """
         if not self._sort:
             raise RuntimeError('Can only use get_slice on sorted DataFrames')
 
         if columns is None:
             columns = self._columns
-        elif all([isinstance(i, bool) for i in columns]):
+        elif is_bool_list(columns):
             if len(columns) != len(self._columns):
                 raise ValueError('boolean column list must be same size of existing columns')
             columns = list(compress(self._columns, columns))
 
         start_location = bisect_left(self._index, start_index) if start_index is not None else None
         stop_location = bisect_right(self._index, stop_index) if stop_index is not None else None
+        if as_view:
+            return ViewDataFrame(self, start_location, stop_location, columns)
 
         index = self._index[start_location:stop_location]
         data = dict()
         for column in columns:
-            c = self._columns.index(column)
+            c = self._column_location(column)
             data[column] = self._data[c][start_location:stop_location]
 
         if as_dict:
@@ -451,32 +880,111 @@ class DataFrame(object):
             return DataFrame(data=data, index=index, columns=columns, index_name=self._index_name, sort=self._sort,
                              dropin=self._dropin)
 
+    def view(self, start=None, stop=None, columns=None):
+        """
+        Return a read only ViewDataFrame of the rows from the start location up to but not including the stop location
+        and a subset of the columns. The view does not copy the data, it reads the lists of this DataFrame.
+
+        :param start: first location, in standard python form of positive or negative number. If None then zero
+        :param stop: location after the last row. If None then the length of the DataFrame
+        :param columns: list of column names, or None for all columns
+        :return: ViewDataFrame
+        """
+        return ViewDataFrame(self, start, stop, columns)
+
+    def get_asof(self, index, columns=None, as_dict=False):
+        """
+        For sorted DataFrames return the row at the index value, or if the index value is not in the index then the
+        last row before it. This is the "as of" row and is found with a binary search without copying any rows. Raises
+        ValueError if all the index values are after the index value.
+
+        :param index: index value
+        :param columns: list of columns, single column name, or None to include all columns
+        :param as_dict: if True then return a dictionary
+        :return: DataFrame or dictionary if columns is a list or value if columns is a single column name, the same as
+            get_location()
+        """
+        if not self._sort:
+            raise RuntimeError('Can only use get_asof on sorted DataFrames')
+        i = sorted_asof(self._index, index)
+        if i < 0:
+            raise ValueError('no index value at or before %s' % repr(index))
+        return self.get_location(i, columns, as_dict)
+
+    def get_asof_many(self, indexes, columns=None, as_list=False):
+        """
+        For sorted DataFrames and a list of index values return the "as of" row for each index value, as get_asof()
+        does. All of the rows are found with one forward pass over the index. Any index value before the first index
+        value of the DataFrame will have None for the values.
+
+        :param indexes: list of index values, does not need to be sorted
+        :param columns: list of column names, single column name, or None to include all columns
+        :param as_list: if True and columns is a single column name then return a list of the values
+        :return: DataFrame with the indexes as the index, or list if as_list is True
+        """
+        if not self._sort:
+            raise RuntimeError('Can only use get_asof_many on sorted DataFrames')
+        locations = sorted_asof_locations(self._index, indexes)
+        single = (columns is not None) and not isinstance(columns, list)
+        if columns is None:
+            columns = self._columns
+        elif single:
+            columns = [columns]
+        data = dict()
+        for column in columns:
+            values = self._data[self._column_location(column)]
+            data[column] = [values[i] if i >= 0 else None for i in locations]
+        if as_list and single:
+            return data[columns[0]]
+        return DataFrame(data=data, index=list(indexes), columns=list(columns), index_name=self._index_name,
+                         sort=self._sort)
+
     def _insert_row(self, i, index):
         """
         Insert a new row in the DataFrame.
 
         :param i: index location to insert
         :param index: index value to insert into the index list
-        :return: nothing
+        :return: location of the new row
         """
         if i == len(self._index):
             self._add_row(index)
+            return len(self._index) - 1
         else:
+            if self._level_map is not None:
+                self._check_level_indexes([index])
             self._index.insert(i, index)
             for c in range(len(self._columns)):
                 self._data[c].insert(i, None)
+            if self._index_map is not None:  # all locations after the insert have shifted
+                for j in range(i, len(self._index)):
+                    self._index_map[self._index[j]] = j
+            if self._level_map is not None:  # all locations after the insert have shifted, rebuild on the next lookup
+                self._level_stale = True
+            return i
 
     def _insert_missing_rows(self, indexes):
         """
         Given a list of indexes, find all the indexes that are not currently in the DataFrame and make a new row for
-        that index, inserting into the index. This requires the DataFrame to be sort=True
+        that index, inserting into the index. All of the new rows are merged in with a single pass over the index and
+        data. This requires the DataFrame to be sort=True
 
         :param indexes: list of indexes
         :return: nothing
         """
-        new_indexes = [x for x in indexes if x not in self._index]
-        for x in new_indexes:
-            self._insert_row(bisect_left(self._index, x), x)
+        new_indexes = sorted(set([x for x in indexes if not self._index_exists(x)]))
+        if len(new_indexes) == 1:
+            self._insert_row(bisect_left(self._index, new_indexes[0]), new_indexes[0])
+        elif new_indexes:
+            if self._level_map is not None:
+                self._check_level_indexes(new_indexes)
+            # merge all of the new rows into the index and each column in one pass
+            locations = sorted_insert_locations(self._index, new_indexes)
+            self._index[:] = splice_values(self._index, locations, new_indexes)
+            nones = [None] * len(new_indexes)
+            for c in range(len(self._columns)):
+                self._data[c][:] = splice_values(self._data[c], locations, nones)
+            self._rebuild_index_map()
 
     def _add_row(self, index):
         """
@@ -485,10 +993,38 @@ class DataFrame(object):
         :param index: index of the new row
         :return: nothing
         """
+        if self._level_map is not None:
+            self._check_level_indexes([index])
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
+        if self._level_map is not None:
+            self._add_level_locations([index], len(self._index))
         self._index.append(index)
         for c, _ in enumerate(self._columns):
             self._data[c].append(None)
 
+    def _duplicate_indexes(self, indexes):
+        """
+        Returns True if any of the indexes are already in the index or are repeated in the indexes list. If the hash
+        index is maintained, or the DataFrame is sorted and in order and the new indexes are all after the last index
+        value, then the check is O(len(indexes)) and does not depend on the size of the DataFrame. Otherwise the entire
+        index is checked, as after appending out of order the last index value is not always the largest.
+
+        :param indexes: list of new index values
+        :return: boolean
+        """
+        if len(set(indexes)) != len(indexes):
+            return True
+        if not indexes or not self._index:
+            return False
+        if self._index_map is not None:
+            return any(x in self._index_map for x in indexes)
+        if self._sort and not self._unordered and min(indexes) > self._index[-1]:
+            return False
+        if len(indexes) == 1:
+            return indexes[0] in self._index
+        return not set(self._index).isdisjoint(indexes)
+
     def _add_missing_rows(self, indexes):
         """
         Given a list of indexes, find all the indexes that are not currently in the DataFrame and make a new row for
@@ -497,7 +1033,7 @@ class DataFrame(object):
         :param indexes: list of indexes
         :return: nothing
         """
-        new_indexes = [x for x in indexes if x not in self._index]
+        new_indexes = [x for x in indexes if not self._index_exists(x)]
         for x in new_indexes:
             self._add_row(x)
 
@@ -508,6 +1044,7 @@ class DataFrame(object):
         :param column: column name
         :return: nothing
         """
+        self._column_map[column] = len(self._columns)
         self._columns.append(column)
         if self._dropin:
             self._data.append(self._dropin([None] * len(self._index)))
@@ -553,18 +1090,21 @@ class DataFrame(object):
         if self._sort:
             exists, i = sorted_exists(self._index, index)
             if not exists:
-                self._insert_row(i, index)
+                i = self._insert_row(i, index)
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
             except ValueError:
-                i = len(self._index)
                 self._add_row(index)
+                i = len(self._index) - 1
         try:
-            c = self._columns.index(column)
+            c = self._column_location(column)
         except ValueError:
             c = len(self._columns)
             self._add_column(column)
+        if self._stats is not None:
+            self._update_stats(column, [self._data[c][i]], [value])
+        self._update_value_index(column, [i], [value])
         self._data[c][i] = value
 
     def set_row(self, index, values):
@@ -578,16 +1118,19 @@ class DataFrame(object):
         if self._sort:
             exists, i = sorted_exists(self._index, index)
             if not exists:
-                self._insert_row(i, index)
+                i = self._insert_row(i, index)
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
             except ValueError:  # new row
-                i = len(self._index)
                 self._add_row(index)
+                i = len(self._index) - 1
         if isinstance(values, dict):
-            if not (set(values.keys()).issubset(self._columns)):
+            if not (set(values.keys()).issubset(self._column_map)):
                 raise ValueError('keys of values are not all in existing columns')
+            self._reset_stats(values.keys())
+            for column in values:
+                self._update_value_index(column, [i], [values[column]])
             for c, column in enumerate(self._columns):
                 self._data[c][i] = values.get(column, self._data[c][i])
         else:
@@ -606,19 +1149,21 @@ class DataFrame(object):
         :return: nothing
         """
         try:
-            c = self._columns.index(column)
+            c = self._column_location(column)
         except ValueError:  # new column
             c = len(self._columns)
             self._add_column(column)
+        self._reset_stats([column])
         if index:  # index was provided
-            if all([isinstance(i, bool) for i in index]):  # boolean list
+            if is_bool_list(index):  # boolean list
                 if not self._check_list(values):  # single value provided, not a list, so turn values into list
                     values = [values for x in index if x]
                 if len(index) != len(self._index):
                     raise ValueError('boolean index list must be same size of existing index')
                 if len(values) != index.count(True):
                     raise ValueError('length of values list must equal number of True entries in index list')
-                indexes = [i for i, x in enumerate(index) if x]
+                indexes = index.locations() if isinstance(index, Mask) else [i for i, x in enumerate(index) if x]
+                self._update_value_index(column, indexes, values)
                 for x, i in enumerate(indexes):
                     self._data[c][i] = values[x]
             else:  # list of index
@@ -633,13 +1178,14 @@ class DataFrame(object):
                     indexes = exists_tuples[1]
                     if not all(exists):
                         self._insert_missing_rows(index)
-                        indexes = [sorted_index(self._index, x) for x in index]
+                        indexes = [self._index_location(x) for x in index]
                 else:
                     try:  # all index in current index
-                        indexes = [self._index.index(x) for x in index]
+                        indexes = [self._index_location(x) for x in index]
                     except ValueError:  # new rows need to be added
                         self._add_missing_rows(index)
-                        indexes = [self._index.index(x) for x in index]
+                        indexes = [self._index_location(x) for x in index]
+                self._update_value_index(column, indexes, values)
                 for x, i in enumerate(indexes):
                     self._data[c][i] = values[x]
         else:  # no index, only values
@@ -648,7 +1194,8 @@ class DataFrame(object):
             if len(values) != len(self._index):
                 raise ValueError('values list must be at same length as current index length.')
             else:
-                self._data[c] = self._dropin(values) if self._dropin else values
+                self._data[c] = self._retype(c, values)
+                self._rebuild_value_indexes([column])
 
     def set_location(self, location, values, missing_to_none=False):
         """
@@ -667,21 +1214,45 @@ class DataFrame(object):
                 if column not in values:
                     values[column] = None
 
+        self._reset_stats(values.keys())
         for column in values:
-            i = self._columns.index(column)
+            i = self._column_location(column)
+            self._update_value_index(column, [location], [values[column]])
             self._data[i][location] = values[column]
 
     def set_locations(self, locations, column, values):
         """
-        For a list of locations and a column set the values.
+        For a list of locations or a slice of locations and a column set the values. The values are set in the column
+        list directly by location with no lookup of the index values. If the column is not in the DataFrame then it is
+        added.
 
-        :param locations: list of index locations
+        :param locations: list of index locations or a slice of locations
         :param column: column name
         :param values: list of values or a single value
         :return: nothing
         """
-        indexes = [self._index[x] for x in locations]
-        self.set(indexes, column, values)
+        if isinstance(locations, slice):
+            locations = range(*locations.indices(len(self._index)))
+        elif locations and not -len(self._index) <= min(locations) <= max(locations) < len(self._index):
+            raise IndexError('location out of range')
+        if not self._check_list(values):
+            values = [values] * len(locations)
+        if len(values) != len(locations):
+            raise ValueError('length of values and locations must be the same.')
+        try:
+            c = self._column_location(column)
+        except ValueError:  # new column
+            c = len(self._columns)
+            self._add_column(column)
+        self._reset_stats([column])
+        self._update_value_index(column, locations, values)
+        data = self._data[c]
+        if isinstance(locations, range) and locations.step == 1 and locations.start >= 0 and \
+                isinstance(data, (list, TypedList)):
+            data[locations.start:locations.stop] = values
+        else:
+            for i, value in zip(locations, values):
+                data[i] = value
 
     def append_row(self, index, values, new_cols=True):
         """
@@ -695,20 +1266,40 @@ class DataFrame(object):
         :return: nothing
         """
 
-        if index in self._index:
+        if self._duplicate_indexes([index]):
             raise IndexError('index already in DataFrame')
+        if self._bars:
+            for bars in self._bars:
+                bars._check_row(index, values)
+        if self._level_map is not None:
+            self._check_level_indexes([index])
+        if self._sort and self._index and not index > self._index[-1]:
+            self._unordered = True
 
         if new_cols:
             for col in values:
-                if col not in self._columns:
+                if col not in self._column_map:
                     self._add_column(col)
 
         # append index value
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
+        if self._level_map is not None:
+            self._add_level_locations([index], len(self._index))
         self._index.append(index)
 
         # add data values, if not in values then use None
         for c, col in enumerate(self._columns):
             self._data[c].append(values.get(col, None))
+        if self._stats:
+            for col in values:
+                self._update_stats(col, added=[values[col]])
+        if self._value_indexes:
+            for col, value_index in self._value_indexes.items():
+                value_index.add(values.get(col), index)
+        if self._bars:
+            for bars in self._bars:
+                bars._append_row(index, values)
 
     def append_rows(self, indexes, values, new_cols=True):
         """
@@ -728,30 +1319,50 @@ class DataFrame(object):
                 raise ValueError('length of %s column in values is longer than indexes' % column)
 
         # check the indexes are not duplicates
-        combined_index = self._index + indexes
-        if len(set(combined_index)) != len(combined_index):
+        if self._duplicate_indexes(indexes):
             raise IndexError('duplicate indexes in DataFrames')
+        if self._bars:
+            for bars in self._bars:
+                bars._check_rows(indexes, values)
+        if self._level_map is not None:
+            self._check_level_indexes(indexes)
+        if self._sort and not is_increasing(list(self._index[-1:]) + list(indexes)):
+            self._unordered = True
 
         if new_cols:
             for col in values:
-                if col not in self._columns:
+                if col not in self._column_map:
                     self._add_column(col)
 
         # append index value
+        if self._index_map is not None:
+            self._index_map.update(zip(indexes, range(len(self._index), len(self._index) + len(indexes))))
+        if self._level_map is not None:
+            self._add_level_locations(indexes, len(self._index))
         self._index.extend(indexes)
 
         # add data values, if not in values then use None
         for c, col in enumerate(self._columns):
             self._data[c].extend(values.get(col, [None] * len(indexes)))
         self._pad_data()
+        if self._stats:
+            for col in values:
+                self._update_stats(col, added=values[col])
+        if self._value_indexes:
+            for col, value_index in self._value_indexes.items():
+                for x, value in zip(indexes, values.get(col, [])):
+                    value_index.add(value, x)
+        if self._bars:
+            for bars in self._bars:
+                bars._append_rows(indexes, values)
 
     def _slice_index(self, slicer):
         try:
-            start_index = sorted_index(self._index, slicer.start) if self._sort else self._index.index(slicer.start)
+            start_index = self._index_location(slicer.start)
         except ValueError:
             raise IndexError('start of slice not in the index')
         try:
-            end_index = sorted_index(self._index, slicer.stop) if self._sort else self._index.index(slicer.stop)
+            end_index = self._index_location(slicer.stop)
         except ValueError:
             raise IndexError('end of slice not in the index')
         if end_index < start_index:
@@ -856,19 +1467,79 @@ class DataFrame(object):
         """
         input_dict = {'data': self.to_dict(index=False), 'index': list(self._index)}
 
-        # if self._dropin, turn into lists
-        if self._dropin:
+        # if self._dropin or not list containers, turn into lists
+        if not isinstance(input_dict['index'], list):
             input_dict['index'] = list(input_dict['index'])
-            for key in input_dict['data']:
+        for key in input_dict['data']:
+            if not isinstance(input_dict['data'][key], list):
                 input_dict['data'][key] = list(input_dict['data'][key])
 
+        input_dict['meta_data'] = self._meta_data()
+        return json.dumps(input_dict, default=repr)
+
+    def to_json_file(self, file, rows=100000):
+        """
+        Writes the JSON of the entire DataFrame to a file object incrementally, the index and each column are written
+        in chunks of rows so the JSON of the entire DataFrame is never held in memory. The JSON is the same as
+        to_json() with the meta_data first, so it can be read back with either from_json() or from_json_file(). Any
+        object that cannot be serialized will be replaced with the representation of the object using repr().
+
+        :param file: file object open for writing text
+        :param rows: number of rows of each chunk
+        :return: nothing
+        """
+        if rows < 1:
+            raise ValueError('rows must be at least 1')
+        file.write('{"meta_data": ')
+        file.write(json.dumps(self._meta_data(), default=repr))
+        file.write(', "index": ')
+        _write_json_list(file, self._index, rows)
+        file.write(', "data": {')
+        for c, column in enumerate(self._columns):
+            # same conversion of the column name to a string as json.dumps of a dict
+            file.write((', ' if c else '') + json.dumps(column if isinstance(column, str) else json.dumps(column)))
+            file.write(': ')
+            _write_json_list(file, self._data[c], rows)
+        file.write('}}')
+
+    def to_file(self, path, append=False):
+        """
+        Writes the DataFrame to a binary columnar file that can be read back with from_file(). The columns with a
+        dtype are written as the fixed width values of the array so they can be read through a memory map with no copy,
+        the index and other columns are written with pickle so the values keep their type, for example tuples and
+        datetimes.
+
+        With append=True and an existing file, the rows are added to the end of the file as a new batch without
+        reading the rest of the file. The columns must be the same as the file and are converted to the dtypes of the
+        file. For a sorted file the index values must be greater than the last index value of the file, for an unsorted
+        file the index values are not checked for duplicates.
+
+        :param path: path of the file
+        :param append: if True add the rows to the end of the file if it exists
+        :return: nothing
+        """
+        if self._dropin:
+            raise ValueError('to_file is not available with a dropin')
+        columnar.write_file(self, path, append)
+
+    def _meta_data(self):
+        """
+        Returns the dictionary of meta data for to_json(). The keys are the parameters of __init__ so that from_json()
+        can reconstruct the DataFrame.
+
+        :return: dict
+        """
         meta_data = dict()
-        for key in self.__slots__:
-            if key not in ['_data', '_index']:
+        for key in DataFrame.__slots__:
+            if key not in ['_data', '_index', '_index_map', '_column_map', '_level_map', '_stats', '_bars',
+                           '_value_indexes', '_unordered', '_level_stale']:
                 value = self.__getattribute__(key)
                 meta_data[key.lstrip('_')] = value if not type(value) == self._dropin else list(value)
-        input_dict['meta_data'] = meta_data
-        return json.dumps(input_dict, default=repr)
+        meta_data['hash_index'] = self.hash_index
+        meta_data['level_index'] = self.level_index
+        meta_data['dtypes'] = self.dtypes
+        meta_data['running_stats'] = self.running_stats
+        return meta_data
 
     def rename_columns(self, rename_dict):
         """
@@ -877,10 +1548,16 @@ class DataFrame(object):
         :param rename_dict: dict where the keys are the current column names and the values are the new names
         :return: nothing
         """
-        if not all([x in self._columns for x in rename_dict.keys()]):
+        if not all([x in self._column_map for x in rename_dict.keys()]):
             raise ValueError('all dictionary keys must be in current columns')
-        for current in rename_dict.keys():
-            self._columns[self._columns.index(current)] = rename_dict[current]
+        locations = [(self._column_map[current], rename_dict[current]) for current in rename_dict.keys()]
+        for c, new in locations:
+            self._columns[c] = new
+        self._rebuild_column_map()
+        self._reset_stats()
+        if self._value_indexes:
+            self._value_indexes = {rename_dict.get(column, column): value_index
+                                   for column, value_index in self._value_indexes.items()}
 
     def head(self, rows):
         """
@@ -889,9 +1566,7 @@ class DataFrame(object):
         :param rows: number of rows
         :return: DataFrame
         """
-        rows_bool = [True] * min(rows, len(self._index))
-        rows_bool.extend([False] * max(0, len(self._index) - rows))
-        return self.get(indexes=rows_bool)
+        return self.get_locations(slice(0, max(rows, 0)))
 
     def tail(self, rows):
         """
@@ -900,9 +1575,7 @@ class DataFrame(object):
         :param rows: number of rows
         :return: DataFrame
         """
-        rows_bool = [False] * max(0, len(self._index) - rows)
-        rows_bool.extend([True] * min(rows, len(self._index)))
-        return self.get(indexes=rows_bool)
+        return self.get_locations(slice(max(len(self._index) - rows, 0), len(self._index)))
 
     def delete_rows(self, indexes):
         """
@@ -912,20 +1585,48 @@ class DataFrame(object):
         :return: nothing
         """
         indexes = [indexes] if not self._check_list(indexes) else indexes
-        if all([isinstance(i, bool) for i in indexes]):  # boolean list
+        if is_bool_list(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError('boolean indexes list must be same size of existing indexes')
-            indexes = [i for i, x in enumerate(indexes) if x]
+            indexes = indexes.locations() if isinstance(indexes, Mask) else [i for i, x in enumerate(indexes) if x]
         else:
-            indexes = [sorted_index(self._index, x) for x in indexes] if self._sort \
-                else [self._index.index(x) for x in indexes]
-        indexes = sorted(indexes, reverse=True)  # need to sort and reverse list so deleting works
-        for c, _ in enumerate(self._columns):
-            for i in indexes:
+            indexes = [self._index_location(x) for x in indexes]
+        self._delete_locations(indexes)
+
+    def _delete_locations(self, locations):
+        """
+        Delete the rows at the locations. Deleting a single row is done directly, otherwise the index and each column
+        are compacted in a single pass rather than shifting the lists once for every deleted row. The lists are updated
+        in place so any other reference to them, like a ViewSeries, remains valid.
+
+        :param locations: list of locations to delete
+        :return: nothing
+        """
+        locations = set(locations)
+        if self._stats:
+            for c, column in enumerate(self._columns):
+                if column in self._stats:
+                    self._update_stats(column, removed=[self._data[c][i] for i in locations])
+        if self._value_indexes:
+            for column, value_index in self._value_indexes.items():
+                if len(locations) == 1:
+                    i = next(iter(locations))
+                    value_index.remove(self._data[self._column_map[column]][i], self._index[i])
+                elif locations:
+                    value_index.remove_keys(set([self._index[i] for i in locations]))
+        if len(locations) == 1:
+            i = locations.pop()
+            for c in range(len(self._columns)):
                 del self._data[c][i]
-        # now remove from index
-        for i in indexes:
             del self._index[i]
+        elif locations:
+            keep = [True] * len(self._index)
+            for i in locations:
+                keep[i] = False
+            for c in range(len(self._columns)):
+                self._data[c][:] = list(compress(self._data[c], keep))
+            self._index[:] = list(compress(self._index, keep))
+        self._rebuild_index_map()
 
     def delete_all_rows(self):
         """
@@ -938,6 +1639,9 @@ class DataFrame(object):
         del self._index[:]
         for c in range(len(self._columns)):
             del self._data[c][:]
+        self._rebuild_index_map()
+        self._reset_stats()
+        self._rebuild_value_indexes()
 
     def delete_columns(self, columns):
         """
@@ -947,12 +1651,14 @@ class DataFrame(object):
         :return: nothing
         """
         columns = [columns] if not self._check_list(columns) else columns
-        if not all([x in self._columns for x in columns]):
+        if not all([x in self._column_map for x in columns]):
             raise ValueError('all columns must be in current columns')
-        for column in columns:
-            c = self._columns.index(column)
+        for c in sorted(set([self._column_map[x] for x in columns]), reverse=True):
             del self._data[c]
             del self._columns[c]
+        self._rebuild_column_map()
+        self._reset_stats(columns)
+        self._rebuild_value_indexes(columns)
         if not len(self._data):  # if all the columns have been deleted, remove index
             self.index = list()
 
@@ -965,10 +1671,11 @@ class DataFrame(object):
         sort = sorted_list_indexes(self._index)
         # sort index
         self._index = self._dropin([self._index[x] for x in sort]) if self._dropin else [self._index[x] for x in sort]
+        self._unordered = False
         # each column
         for c in range(len(self._data)):
-            self._data[c] = self._dropin([self._data[c][i] for i in sort]) if self._dropin \
-                else [self._data[c][i] for i in sort]
+            self._data[c] = self._retype(c, [self._data[c][i] for i in sort])
+        self._rebuild_index_map()
 
     def sort_columns(self, column, key=None, reverse=False):
         """
@@ -983,13 +1690,14 @@ class DataFrame(object):
         """
         if self._check_list(column):
             raise TypeError('Can only sort by a single column  ')
-        sort = sorted_list_indexes(self._data[self._columns.index(column)], key, reverse)
+        sort = sorted_list_indexes(self._data[self._column_location(column)], key, reverse)
         # sort index
         self._index = self._dropin([self._index[x] for x in sort]) if self._dropin else [self._index[x] for x in sort]
+        self._unordered = len(self._index) > 1
         # each column
         for c in range(len(self._data)):
-            self._data[c] = self._dropin([self._data[c][i] for i in sort]) if self._dropin \
-                else [self._data[c][i] for i in sort]
+            self._data[c] = self._retype(c, [self._data[c][i] for i in sort])
+        self._rebuild_index_map()
 
     def _validate_index(self, indexes):
         if len(indexes) != len(set(indexes)):
@@ -1035,35 +1743,175 @@ class DataFrame(object):
         if len(data_frame) == 0:  # empty DataFrame, do nothing
             return
         data_frame_index = data_frame.index
-        combined_index = self._index + data_frame_index
-        if len(set(combined_index)) != len(combined_index):
+        if self._duplicate_indexes(data_frame_index):
             raise ValueError('duplicate indexes in DataFrames')
 
         for c, column in enumerate(data_frame.columns):
             self.set(indexes=data_frame_index, columns=column, values=data_frame.data[c].copy())
 
-    def equality(self, column, indexes=None, value=None):
+    def join(self, other, how='inner', on=None, suffixes=('_left', '_right')):
+        """
+        Join this DataFrame with another DataFrame on the index or on key columns and return a new DataFrame. This
+        DataFrame is the left side and the other is the right side. An inner join has the rows with keys in both,
+        a left join has all of the rows of the left side and an outer join has all of the rows of either side. Values
+        that are missing from one side are None.
+
+        When joining on the index and both DataFrames are sorted the indexes are merged in one linear pass and the
+        result is sorted, otherwise the right side is hashed and the rows are in the order of the left side followed
+        by the rows only in the right side for an outer join.
+
+        When joining on columns the keys do not need to be unique, every pair of matching rows is in the result. The
+        key columns are the first columns of the result and the index is the default integer index.
+
+        :param other: DataFrame to join to this one
+        :param how: one of inner, left or outer
+        :param on: if None join on the index, otherwise the column name or list of column names that are in both
+        :param suffixes: tuple of the suffixes added to the names of columns that are in both DataFrames
+        :return: DataFrame
+        """
+        if how not in ['inner', 'left', 'outer']:
+            raise ValueError('how must be one of: inner, left, outer')
+        if on is None:
+            index_name = self._index_name
+            key_columns = []
+            if self._sort and other.sort:
+                index, left_locations, right_locations = sorted_merge_locations(self._index, other.index, how)
+                sort = True
+            else:
+                index, left_locations, right_locations = self._hash_join_locations(self._index, other.index, how,
+                                                                                   unique=True)
+                sort = self._sort and how != 'outer'
+        else:
+            index_name = 'index'
+            key_columns = list(on) if isinstance(on, list) or self._check_list(on) else [on]
+            if len(key_columns) == 1:
+                left_keys = self.get_entire_column(key_columns[0], as_list=True)
+                right_keys = other.get_entire_column(key_columns[0], as_list=True)
+            else:
+                left_keys = list(zip(*[self.get_entire_column(x, as_list=True) for x in key_columns]))
+                right_keys = list(zip(*[other.get_entire_column(x, as_list=True) for x in key_columns]))
+            keys, left_locations, right_locations = self._hash_join_locations(left_keys, right_keys, how)
+            index = None
+            sort = None
+
+        left_columns = [x for x in self._columns if x not in key_columns]
+        right_columns = [x for x in other.columns if x not in key_columns]
+        both = set(left_columns).intersection(right_columns)
+        columns = list()
+        data = dict()
+        dtypes = dict()
+        if key_columns:
+            if len(key_columns) == 1:
+                data[key_columns[0]] = keys
+            else:
+                for k, key_values in enumerate(zip(*keys) if keys else [[]] * len(key_columns)):
+                    data[key_columns[k]] = list(key_values)
+            columns.extend(key_columns)
+        for frame, frame_columns, locations, suffix in [(self, left_columns, left_locations, suffixes[0]),
+                                                        (other, right_columns, right_locations, suffixes[1])]:
+            frame_dtypes = frame.dtypes
+            for column in frame_columns:
+                name = '%s%s' % (column, suffix) if column in both else column
+                data[name] = self._take(frame.get_entire_column(column, as_list=True), locations)
+                if column in frame_dtypes:
+                    dtypes[name] = frame_dtypes[column]
+                columns.append(name)
+        return DataFrame(data=data, columns=columns, index=index, index_name=index_name, sort=sort, dtypes=dtypes)
+
+    @staticmethod
+    def _hash_join_locations(left_keys, right_keys, how, unique=False):
+        """
+        Find the matching locations of the left and right keys by hashing the right keys. The result is in the order
+        of the left keys, with each left key followed by the locations of all of the matching right keys, and then for
+        an outer join the right keys that do not match any left key.
+
+        :param left_keys: list of keys
+        :param right_keys: list of keys
+        :param how: one of inner, left or outer
+        :param unique: if True the right keys are unique, like an index, which allows a faster map
+        :return: (keys, left_locations, right_locations) tuple of lists. The location is None if there is no match
+        """
+        keys = list()
+        left_locations = list()
+        right_locations = list()
+        if unique:
+            right_map = dict(zip(right_keys, range(len(right_keys))))
+            matches = [right_map.get(key) for key in left_keys]
+            if how == 'inner':
+                for i, j in enumerate(matches):
+                    if j is not None:
+                        left_locations.append(i)
+                        right_locations.append(j)
+                keys = [left_keys[i] for i in left_locations]
+            else:
+                keys = list(left_keys)
+                left_locations = list(range(len(left_keys)))
+                right_locations = matches
+        else:
+            right_map = dict()
+            for j, key in enumerate(right_keys):
+                try:
+                    right_map[key].append(j)
+                except KeyError:
+                    right_map[key] = [j]
+            for i, key in enumerate(left_keys):
+                matches = right_map.get(key)
+                if matches is None:
+                    if how != 'inner':
+                        keys.append(key)
+                        left_locations.append(i)
+                        right_locations.append(None)
+                else:
+                    for j in matches:
+                        keys.append(key)
+                        left_locations.append(i)
+                        right_locations.append(j)
+        if how == 'outer':
+            left_set = set(left_keys)
+            extra = [j for j, key in enumerate(right_keys) if key not in left_set]
+            keys.extend([right_keys[j] for j in extra])
+            left_locations.extend([None] * len(extra))
+            right_locations.extend(extra)
+        return keys, left_locations, right_locations
+
+    @staticmethod
+    def _take(values, locations):
+        """
+        Return a new list of the values at the locations, None for a location that is None
+
+        :param values: list of values
+        :param locations: list of integer locations or None
+        :return: list
+        """
+        if None in locations:
+            return [None if i is None else values[i] for i in locations]
+        return take(values, locations)
+
+    def equality(self, column, indexes=None, value=None, as_array=False):
         """
         Math helper method. Given a column and optional indexes will return a list of booleans on the equality of the
-        value for that index in the DataFrame to the value parameter.
+        value for that index in the DataFrame to the value parameter. If NumPy is installed and the column is numeric
+        the comparison is vectorized.
 
         :param column: column name to compare
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
         :param value: value to compare
-        :return: list of booleans
+        :param as_array: if True return a NumPy bool array, requires NumPy
+        :return: Mask of booleans, or numpy array if as_array is True
         """
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        compare_list = self.get_rows(indexes, column, as_list=True)
-        return [x == value for x in compare_list]
+        compare_list = self._get_list(column, indexes)
+        return math_utils.equality(compare_list, value, as_array)
+
+    def _get_list(self, column, indexes):
+        if indexes is None:
+            return self._data[self._column_location(column)]
+        return self.get_rows(indexes, column, as_list=True)
 
     def _get_lists(self, left_column, right_column, indexes):
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        left_list = self.get_rows(indexes, left_column, as_list=True)
-        right_list = self.get_rows(indexes, right_column, as_list=True)
-        return left_list, right_list
+        return self._get_list(left_column, indexes), self._get_list(right_column, indexes)
 
-    def add(self, left_column, right_column, indexes=None):
+    def add(self, left_column, right_column, indexes=None, as_array=False):
         """
         Math helper method that adds element-wise two columns. If indexes are not None then will only perform the math
         on that sub-set of the columns.
@@ -1072,12 +1920,13 @@ class DataFrame(object):
         :param right_column: second column name
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
-        :return: list
+        :param as_array: if True return a NumPy array, requires NumPy
+        :return: list, or numpy array if as_array is True
         """
         left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [l + r for l, r in zip(left_list, right_list)]
+        return math_utils.arithmetic('add', left_list, right_list, as_array)
 
-    def subtract(self, left_column, right_column, indexes=None):
+    def subtract(self, left_column, right_column, indexes=None, as_array=False):
         """
         Math helper method that subtracts element-wise two columns. If indexes are not None then will only perform the
         math on that sub-set of the columns.
@@ -1086,12 +1935,13 @@ class DataFrame(object):
         :param right_column: name of column to subtract from the left_column
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
-        :return: list
+        :param as_array: if True return a NumPy array, requires NumPy
+        :return: list, or numpy array if as_array is True
         """
         left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [l - r for l, r in zip(left_list, right_list)]
+        return math_utils.arithmetic('subtract', left_list, right_list, as_array)
 
-    def multiply(self, left_column, right_column, indexes=None):
+    def multiply(self, left_column, right_column, indexes=None, as_array=False):
         """
         Math helper method that multiplies element-wise two columns. If indexes are not None then will only perform the
         math on that sub-set of the columns.
@@ -1100,12 +1950,13 @@ class DataFrame(object):
         :param right_column: second column name
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
-        :return: list
+        :param as_array: if True return a NumPy array, requires NumPy
+        :return: list, or numpy array if as_array is True
         """
         left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [l * r for l, r in zip(left_list, right_list)]
+        return math_utils.arithmetic('multiply', left_list, right_list, as_array)
 
-    def divide(self, left_column, right_column, indexes=None):
+    def divide(self, left_column, right_column, indexes=None, as_array=False):
         """
         Math helper method that divides element-wise two columns. If indexes are not None then will only perform the
         math on that sub-set of the columns.
@@ -1114,58 +1965,268 @@ class DataFrame(object):
         :param right_column: column name of divisor
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
-        :return: list
+        :param as_array: if True return a NumPy array, requires NumPy
+        :return: list, or numpy array if as_array is True
         """
         left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [l / r for l, r in zip(left_list, right_list)]
+        return math_utils.arithmetic('divide', left_list, right_list, as_array)
 
-    def isin(self, column, compare_list):
+    def eval(self, expression, column=None, indexes=None, as_array=False):
         """
-        Returns a boolean list where each elements is whether that element in the column is in the compare_list.
+        Evaluate an arithmetic and comparison expression over the columns, for example 'a + b * c' or
+        '(a - b) / b > 0.5'. The expression is compiled once into a function that is run in a single pass over the
+        columns so there are no intermediate lists for each operation. If NumPy is installed and the columns have a
+        float dtype, or as_array is True, then the expression is run as one vectorized NumPy kernel.
 
-        :param column: single column name, does not work for multiple columns
-        :param compare_list: list of items to compare to
-        :return: list of booleans
+        The expression can use column names, numbers, strings, True, False, None, the operators + - * / // % **, the
+        comparisons == != < <= > >=, and, or, not and parentheses. Column names must be valid python names.
+
+        :param expression: string expression
+        :param column: if not None then the results are set into this column with set_column() and nothing is
+            returned. If the column does not exist it is created
+        :param indexes: list of index values or list of booleans to evaluate only that sub-set of rows. If a list of
+            booleans then the list must be the same length as the DataFrame
+        :param as_array: if True return a NumPy array, requires NumPy
+        :return: list, or numpy array if as_array is True, if column is None. Otherwise nothing
         """
-        return [x in compare_list for x in self._data[self._columns.index(column)]]
+        columns = math_utils.compile_expression(expression)[0]
+        values = {name: self._get_list(name, indexes) for name in columns}
+        result = math_utils.evaluate(expression, values, as_array and column is None)
+        if column is None:
+            return result
+        self.set_column(indexes, column, self._dropin(result) if self._dropin else result)
 
-    def iterrows(self, index=True):
+    def isin(self, column, compare_list, as_array=False):
         """
-        Iterates over DataFrame rows as dictionary of the values. The index will be included.
+        Returns a boolean list where each elements is whether that element in the column is in the compare_list. If
+        NumPy is installed and the column and compare_list are numeric the check is vectorized.
 
-        :param index: if True include the index in the results
-        :return: dictionary
+        :param column: single column name, does not work for multiple columns
+        :param compare_list: list of items to compare to
+        :param as_array: if True return a NumPy bool array, requires NumPy
+        :return: Mask of booleans, or numpy array if as_array is True
         """
-        for i in range(len(self._index)):
-            row = {self._index_name: self._index[i]} if index else dict()
-            for c, col in enumerate(self._columns):
-                row[col] = self._data[c][i]
-            yield row
+        return math_utils.isin(self._data[self._column_location(column)], compare_list, as_array)
 
-    def itertuples(self, index=True, name='Raccoon'):
+    def _aggregate(self, name, column):
         """
-        Iterates over DataFrame rows as tuple of the values.
+        Aggregate a column in a single pass, or from the running stats if they are being maintained.
 
-        :param index: if True then include the index
-        :param name: name of the namedtuple
-        :return: namedtuple
-        """
-        fields = [self._index_name] if index else list()
-        fields.extend(self._columns)
-        row_tuple = namedtuple(name, fields)
-        for i in range(len(self._index)):
-            row = {self._index_name: self._index[i]} if index else dict()
-            for c, col in enumerate(self._columns):
-                row[col] = self._data[c][i]
-            yield row_tuple(**row)
+        :param name: name of the aggregation
+        :param column: column name
+        :return: value of the aggregation
+        """
+        c = self._column_location(column)
+        if self._stats is not None:
+            stats = self._stats.get(column)
+            if stats is None:
+                try:
+                    stats = self._stats[column] = math_utils.RunningStats(self._data[c])
+                except TypeError:  # not numbers, use the single pass
+                    pass
+            if stats is not None:
+                return stats.get(name, self._data[c])
+        return math_utils.aggregate(name, self._data[c])
 
-    def reset_index(self, drop=False):
+    def count(self, column):
+        """
+        Returns the number of values in the column that are not None.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('count', column)
+
+    def sum(self, column):
+        """
+        Returns the sum of the values in the column, ignoring None values.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('sum', column)
+
+    def mean(self, column):
+        """
+        Returns the mean of the values in the column, ignoring None values. None if there are no values.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('mean', column)
+
+    def min(self, column):
+        """
+        Returns the minimum value in the column, ignoring None values. None if there are no values.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('min', column)
+
+    def max(self, column):
+        """
+        Returns the maximum value in the column, ignoring None values. None if there are no values.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('max', column)
+
+    def std(self, column):
+        """
+        Returns the sample standard deviation of the values in the column, ignoring None values. None if there
+        are fewer than two values.
+
+        :param column: column name
+        :return: value
+        """
+        return self._aggregate('std', column)
+
+    def resample(self, width, origin=None):
+        """
+        Group the rows of a sorted DataFrame into buckets of fixed width on the index, for example one minute bars
+        with a width of timedelta(minutes=1) on a datetime index. The index is walked once, with a binary search for
+        the end of each bucket. Use agg() on the returned Resample to aggregate the columns for each bucket into a new
+        sorted DataFrame indexed by the start of each bucket. Buckets with no rows are not included.
+
+        :param width: width of the buckets, a number for a numeric index or a timedelta for a datetime or date index
+        :param origin: index value that is the start of a bucket. If None then zero for a numeric index and
+            1970-01-01 for a datetime or date index
+        :return: Resample
+        """
+        return Resample(self, width, origin)
+
+    def bars(self, width, column, volume=None, origin=None, output=None):
+        """
+        Attach a BarBuilder to a sorted DataFrame that builds open, high, low and close bars of fixed width on the index
+        from the values of a column as rows are appended with append_row() or append_rows(). The bars of the existing
+        rows are built when attached, then each appended row updates the open bar in O(1) and when a row is in a later
+        bar the finished bar is appended to the output DataFrame. Bars only reflect appended rows, not rows that are
+        set or deleted.
+
+        :param width: width of the bars, a number for a numeric index or a timedelta for a datetime or date index
+        :param column: column name of the prices
+        :param volume: (optional) column name of the volumes to sum into a volume column of the bars
+        :param origin: index value that is the start of a bar. If None then zero for a numeric index and 1970-01-01
+            for a datetime or date index
+        :param output: (optional) DataFrame to append the finished bars to. If None then a new sorted DataFrame
+        :return: BarBuilder
+        """
+        if column not in self._column_map:
+            raise ValueError('column not in DataFrame')
+        if volume is not None and volume not in self._column_map:
+            raise ValueError('volume column not in DataFrame')
+        return BarBuilder(self, width, column, volume, origin, output)
+
+    def rolling(self, column, window, by_index=None, min_periods=None):
+        """
+        Return a RollingWindow over a column for rolling count(), sum(), mean(), std(), min() and max() calculations.
+        Each calculation is a single pass over the column and returns a list with the value for the window ending at
+        each row.
+
+        :param column: column name
+        :param window: number of rows in the window, or the width of the window in index units if by_index is True.
+            For example a window of timedelta(minutes=5) on a datetime index
+        :param by_index: if True the window is a width in index units and the DataFrame must be sorted. If None then
+            True if the window is not an int
+        :param min_periods: minimum number of values in the window to have a result, otherwise the result is None. If
+            None then the window for a number of rows, and 1 for a window on the index
+        :return: RollingWindow
+        """
+        rolling = RollingWindow(self.get_entire_column(column, as_list=True), self._index, window, by_index,
+                                min_periods)
+        if rolling.by_index and not self._sort:
+            raise ValueError('a window on the index requires a sorted DataFrame')
+        return rolling
+
+    def groupby(self, columns):
+        """
+        Group the rows of the DataFrame by the values of one or more columns. The groups are built in one pass over the
+        key columns, use agg() on the returned GroupBy to aggregate the other columns for each group.
+
+        :param columns: single column name or list of column names
+        :return: GroupBy
+        """
+        return GroupBy(self, columns)
+
+    def _iter_lists(self, index, columns):
+        """
+        Return the names and the lists of the index and columns to iterate over
+
+        :param index: if True include the index
+        :param columns: list of column names, or None for all columns
+        :return: tuple of (list of names, list of lists)
+        """
+        names = [self._index_name] if index else list()
+        lists = [self._index] if index else list()
+        for column in (self._columns if columns is None else columns):
+            names.append(column)
+            lists.append(self._data[self._column_location(column)])
+        return names, lists
+
+    def _iter_values(self, lists):
+        """
+        Iterator of the tuple of values of each row of the lists, zip over the lists so the loop runs in C
+
+        :param lists: list of lists
+        :return: iterator of tuples
+        """
+        return zip(*lists) if lists else repeat((), len(self._index))
+
+    def iterrows(self, index=True, columns=None):
+        """
+        Iterates over DataFrame rows as dictionary of the values. The index will be included.
+
+        :param index: if True include the index in the results
+        :param columns: list of column names to include, or None for all columns
+        :return: dictionary
+        """
+        names, lists = self._iter_lists(index, columns)
+        return map(dict, map(zip, repeat(names), self._iter_values(lists)))
+
+    def itertuples(self, index=True, name='Raccoon', columns=None):
+        """
+        Iterates over DataFrame rows as tuple of the values. The namedtuple class is cached so it is only created once
+        for the same name and fields. If the name is None then the rows are plain tuples, which is the fastest way to
+        iterate over the rows.
+
+        :param index: if True then include the index
+        :param name: name of the namedtuple, or None for plain tuples
+        :param columns: list of column names to include, or None for all columns
+        :return: namedtuple or tuple
+        """
+        names, lists = self._iter_lists(index, columns)
+        rows = self._iter_values(lists)
+        if name is None:
+            return rows
+        return map(_row_tuple(name, tuple(names))._make, rows)
+
+    def iterbatches(self, rows, index=True, columns=None):
+        """
+        Iterates over the DataFrame in batches of rows as a dictionary of lists, in the same form as to_dict(). Each
+        batch is a slice of each list, so this is the fastest way to process the columns of a large DataFrame in
+        chunks. The last batch can be smaller than the number of rows.
+
+        :param rows: number of rows in each batch
+        :param index: if True include the index in the results with the index_name as the key
+        :param columns: list of column names to include, or None for all columns
+        :return: dictionary of lists
+        """
+        if rows < 1:
+            raise ValueError('rows must be at least 1')
+        names, lists = self._iter_lists(index, columns)
+        for start in range(0, len(self._index), rows):
+            locations = slice(start, start + rows)
+            yield {name: take(values, locations) for name, values in zip(names, lists)}
+
+    def reset_index(self, drop=False):
         """
         Resets the index of the DataFrame to simple integer list and the index name to 'index'. If drop is True then
         the existing index is dropped, if drop is False then the current index is made a column in the DataFrame with
         the index name the name of the column. If the index is a tuple multi-index then each element of the tuple is
         converted into a separate column. If the index name was 'index' then the column name will be 'index_0' to not
-        conflict on print().
+        conflict on print(). The level index is turned off as the new index values are not tuples.
 
         :param drop: if True then the current index is dropped, if False then index converted to columns
         :return: nothing
@@ -1178,6 +2239,7 @@ class DataFrame(object):
             else:
                 col_name = self.index_name if self.index_name != 'index' else 'index_0'
                 self.set_column(column=col_name, values=self._index)
+        self._level_map = None
         self.index = list(range(self.__len__()))
         self.index_name = 'index'
 
@@ -1195,7 +2257,72 @@ class DataFrame(object):
         :param dropin_func: drop-in replacement for list that was used in the JSON
         :return: DataFrame
         """
-        input_dict = json.loads(json_string)
+        return cls._from_json_dict(json.loads(json_string), dropin_func)
+
+    @classmethod
+    def from_json_file(cls, file, dropin_func=None):
+        """
+        Creates and return a DataFrame from a file object with a JSON of the type created by to_json() or
+        to_json_file(). The file is read incrementally and the index and each column are decoded into lists as they are
+        read, so the JSON of the entire DataFrame is never held in memory.
+
+        If a dropin is in the meta data from the JSON, then the same dropin class must be provided here to
+        allow construction as the dropin function cannot be stored with the JSON.
+
+        :param file: file object open for reading text
+        :param dropin_func: drop-in replacement for list that was used in the JSON
+        :return: DataFrame
+        """
+        reader = _JsonReader(file)
+        input_dict = dict()
+        for key in reader.keys():
+            if key == 'data':
+                input_dict['data'] = {column: reader.array() for column in reader.keys()}
+            elif key == 'index':
+                input_dict['index'] = reader.array()
+            else:
+                input_dict[key] = reader.value()
+        return cls._from_json_dict(input_dict, dropin_func)
+
+    @classmethod
+    def from_file(cls, path, columns=None, memory_map=True):
+        """
+        Creates and return a DataFrame from a file created by to_file(). With memory_map=True the columns with a dtype
+        are TypedLists that read the values from a memory map of the file, so opening the file does not read these
+        columns and the pages are loaded when the values are used. The values are copied into memory on the first
+        change to the column. The index and the other columns are read from the file.
+
+        If the file was written in more than one batch with to_file(append=True), the batches of each column are joined
+        in memory. Write the file again with to_file() to read the columns from the memory map.
+
+        The file is read with pickle so only read files from a trusted source.
+
+        :param path: path of the file
+        :param columns: list of column names to read, or None for all columns
+        :param memory_map: if True read the columns with a dtype through a memory map, otherwise read the entire file
+        :return: DataFrame
+        """
+        header, index, data = columnar.read_file(path, columns, memory_map)
+        dataframe = cls(columns=header['columns'], index_name=header['index_name'], sort=False)
+        dataframe._data = data
+        if header['sort']:
+            # the index of a sorted file is unique and in order, so set the index and sort without checking or sorting
+            dataframe._index = index
+            dataframe._unordered = False
+            dataframe._sort = True
+        else:
+            dataframe.index = index
+        return dataframe
+
+    @classmethod
+    def _from_json_dict(cls, input_dict, dropin_func):
+        """
+        Creates and return a DataFrame from the decoded JSON for from_json() and from_json_file()
+
+        :param input_dict: dictionary with the data, index and meta_data
+        :param dropin_func: drop-in replacement for list that was used in the JSON
+        :return: DataFrame
+        """
         # convert index to tuple if required
         if input_dict['index'] and isinstance(input_dict['index'][0], list):
             input_dict['index'] = [tuple(x) for x in input_dict['index']]
@@ -1204,7 +2331,7 @@ class DataFrame(object):
             input_dict['meta_data']['index_name'] = tuple(input_dict['meta_data']['index_name'])
         data = input_dict['data'] if input_dict['data'] else None
         # confirm the dropin and replace with the actual class
-        if input_dict['meta_data']['dropin']:
+        if input_dict['meta_data'].get('dropin'):
             if not dropin_func:
                 raise AttributeError('the JSON has a dropin : %s : but the dropin parameter was not supplied'
                                      % input_dict['meta_data']['dropin'])
@@ -1214,3 +2341,1022 @@ class DataFrame(object):
                 raise AttributeError('the supplied dropin parameter: %s : does not match the value in '
                                      'the JSON: %s' % (dropin_func, input_dict['meta_data']['dropin']))
         return cls(data=data, index=input_dict['index'], **input_dict['meta_data'])
+
+
+class RollingDataFrame(DataFrame):
+    """
+    RollingDataFrame class. A DataFrame with a fixed capacity that keeps only the most recent rows, for use with
+    streaming data. The index and each column are stored in a RingBuffer, so when the RollingDataFrame is full adding a
+    row to the end evicts the oldest row in O(1) without shifting the other rows. The get and set methods are the same
+    as the DataFrame. For sorted RollingDataFrames new rows can only be inserted before the end while there is spare
+    capacity, once full an IndexError is raised.
+
+    Because the index and column containers are updated in place, a ViewSeries made with ViewSeries.from_dataframe()
+    remains a valid view of the column as rows are added and evicted. There is no hash index, level index or dropin.
+    """
+    __slots__ = ['_capacity']
+
+    def __init__(self, data=None, columns=None, index=None, index_name='index', sort=None, capacity=None):
+        """
+        :param data: (optional) dictionary of lists. The keys of the dictionary will be used for the column names and\
+        the lists will be used for the column data. If longer than the capacity only the last rows are kept
+        :param columns: (optional) list of column names that will define the order
+        :param index: (optional) list of index values. If None then the index will be integers starting with zero
+        :param index_name: (optional) name for the index. Default is "index"
+        :param sort: if True then DataFrame will keep the index sort. If True all index values must be of same type
+        :param capacity: maximum number of rows
+        """
+        if capacity is None or capacity < 1:
+            raise ValueError('capacity must be an integer of at least 1')
+        self._capacity = capacity
+        # keep only the last rows so the index and data are the same length when created
+        if isinstance(data, dict):
+            data = {k: v[-capacity:] if isinstance(v, list) else v for k, v in data.items()}
+        if index is not None:
+            index = list(index)[-capacity:]
+        super(RollingDataFrame, self).__init__(data=data, columns=columns, index=index, index_name=index_name,
+                                               sort=sort)
+        self._make_rings()
+
+    def _make_rings(self):
+        """
+        Convert the index and any column that is not already a RingBuffer into a RingBuffer.
+
+        :return: nothing
+        """
+        if not isinstance(self._index, RingBuffer):
+            self._index = RingBuffer(self._index, self._capacity)
+        for c in range(len(self._data)):
+            if not isinstance(self._data[c], RingBuffer):
+                self._data[c] = RingBuffer(self._data[c], self._capacity)
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def full(self):
+        """
+        :return: True if adding a row to the end will evict the oldest row
+        """
+        return len(self._index) == self._capacity
+
+    @property
+    def index(self):
+        """
+        Return a view of the index as a RingBuffer. Because this is a view any change to the return list from this
+        method will corrupt the RollingDataFrame.
+
+        :return: RingBuffer
+        """
+        return self._index
+
+    @index.setter
+    def index(self, index_list):
+        self._validate_index(index_list)
+        self._index = RingBuffer(index_list, self._capacity)
+        self._unordered = len(self._index) > 1
+
+    @property
+    def hash_index(self):
+        return False
+
+    @hash_index.setter
+    def hash_index(self, boolean):
+        if boolean:
+            raise ValueError('hash_index is not available for RollingDataFrame')
+
+    @property
+    def level_index(self):
+        return False
+
+    @level_index.setter
+    def level_index(self, boolean):
+        if boolean:
+            raise ValueError('level_index is not available for RollingDataFrame')
+
+    @property
+    def running_stats(self):
+        return False
+
+    @running_stats.setter
+    def running_stats(self, boolean):
+        if boolean:
+            raise ValueError('running_stats is not available for RollingDataFrame')
+
+    def _insert_row(self, i, index):
+        """
+        Insert a new row in the RollingDataFrame. Rows can only be inserted before the end if there is spare capacity.
+
+        :param i: index location to insert
+        :param index: index value to insert into the index list
+        :return: location of the new row
+        """
+        if i < len(self._index) and self.full:
+            raise IndexError('cannot insert a row before the end of a full RollingDataFrame')
+        return super(RollingDataFrame, self)._insert_row(i, index)
+
+    def _insert_missing_rows(self, indexes):
+        """
+        Given a list of indexes, find all the indexes that are not currently in the RollingDataFrame and insert a new
+        row for each one at a time, so that rows evicted by rows added to the end are evicted from every column.
+
+        :param indexes: list of indexes
+        :return: nothing
+        """
+        for x in sorted(set([x for x in indexes if not self._index_exists(x)])):
+            self._insert_row(bisect_left(self._index, x), x)
+
+    def _add_column(self, column):
+        """
+        Add a new column to the RollingDataFrame
+
+        :param column: column name
+        :return: nothing
+        """
+        self._column_map[column] = len(self._columns)
+        self._columns.append(column)
+        self._data.append(RingBuffer([None] * len(self._index), self._capacity))
+
+    def set_column(self, index=None, column=None, values=None):
+        """
+        Set a column to a single value or list of values. If any of the index values are not in the current indexes
+        then a new row will be created. See DataFrame.set_column()
+
+        :param index: list of index values or list of booleans
+        :param column: column name
+        :param values: either a single value or a list
+        :return: nothing
+        """
+        if isinstance(values, RingBuffer):
+            values = list(values)
+        super(RollingDataFrame, self).set_column(index, column, values)
+        self._make_rings()
+
+    def append_rows(self, indexes, values, new_cols=True):
+        """
+        Appends rows of values to the end of the data, evicting the oldest rows if needed. See DataFrame.append_rows()
+
+        :param indexes: list of indexes
+        :param values: dictionary of values where the key is the column name and the value is a list
+        :param new_cols: if True add new columns in values, if False ignore
+        :return: nothing
+        """
+        # pad the values first as the columns cannot be padded after the oldest rows are evicted
+        values = {column: values[column] + [None] * (len(indexes) - len(values[column]))
+                  if len(values[column]) < len(indexes) else values[column] for column in values}
+        super(RollingDataFrame, self).append_rows(indexes, values, new_cols)
+
+    def sort_index(self):
+        """
+        Sort the RollingDataFrame by the index. The sort modifies the RollingDataFrame inplace
+
+        :return: nothing
+        """
+        super(RollingDataFrame, self).sort_index()
+        self._make_rings()
+
+    def sort_columns(self, column, key=None, reverse=False):
+        """
+        Sort the RollingDataFrame by one of the columns. See DataFrame.sort_columns()
+
+        :param column: column name to use for the sort
+        :param key: if not None then a function of one argument that is used to extract a comparison key
+        :param reverse: if True then the list elements are sort as if each comparison were reversed.
+        :return: nothing
+        """
+        super(RollingDataFrame, self).sort_columns(column, key, reverse)
+        self._make_rings()
+
+    def set_dtypes(self, dtypes):
+        raise ValueError('dtypes are not available for RollingDataFrame')
+
+    def create_index(self, column):
+        raise ValueError('indexes are not available for RollingDataFrame')
+
+    @classmethod
+    def from_file(cls, path, columns=None, memory_map=True):
+        raise ValueError('from_file is not available for RollingDataFrame, use DataFrame.from_file()')
+
+    def _meta_data(self):
+        """
+        Returns the dictionary of meta data for to_json()
+
+        :return: dict
+        """
+        return {'index_name': self._index_name, 'columns': list(self._columns), 'sort': self._sort,
+                'capacity': self._capacity}
+
+
+class LocationIndexer(object):
+    """
+    Positional access to a DataFrame or Series by location, as returned by the iloc property. The rows are a single
+    location, a list of locations or a slice of locations, in standard python form of positive or negative numbers,
+    and are read and set directly in the lists with no lookup of the index values.
+
+    Usage...
+    df.iloc[5] -- DataFrame of the row at location 5, any integer type including NumPy integers can be used
+    df.iloc[5, 'b'] -- value of column b at location 5
+    df.iloc[[4, 5], ['a', 'b']] -- DataFrame of locations 4 and 5 and columns a and b
+    df.iloc[-10:] -- DataFrame of the last 10 rows
+    df.iloc[2:4, 'b'] = [1, 2] -- set column b at locations 2 and 3
+    srs.iloc[5] -- value at location 5
+    srs.iloc[2:4] -- Series of locations 2 and 3
+    """
+    __slots__ = ['_data_object']
+
+    def __init__(self, data_object):
+        """
+        :param data_object: DataFrame or Series
+        """
+        self._data_object = data_object
+
+    def __getitem__(self, key):
+        if isinstance(self._data_object, DataFrame):
+            locations, columns = key if isinstance(key, tuple) else (key, None)
+            if isinstance(locations, Integral):
+                return self._data_object.get_location(locations, columns)
+            return self._data_object.get_locations(locations, columns)
+        if isinstance(key, Integral):
+            return self._data_object.data[key]
+        return self._data_object.get_locations(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(self._data_object, DataFrame):
+            if not isinstance(key, tuple):
+                raise ValueError('the column must be provided to set values of a DataFrame')
+            locations, column = key
+            if isinstance(locations, Integral):
+                locations = [locations]
+                value = [value]
+            return self._data_object.set_locations(locations, column, value)
+        if isinstance(key, Integral):
+            return self._data_object.set_location(key, value)
+        return self._data_object.set_locations(key, value)
+
+
+class ViewDataFrame(object):
+    """
+    Read only view of a range of rows and a subset of the columns of a DataFrame. The view does not copy the data, the
+    read methods translate the locations of the view to the locations of the DataFrame and read its lists directly, so
+    a view is O(1) to create and changes to the values of the DataFrame are seen by the view. The rows of the view are
+    fixed locations, so inserting or deleting rows in the DataFrame shifts the rows that are in the view.
+    """
+    __slots__ = ['_dataframe', '_start', '_stop', '_columns', '_column_set']
+
+    def __init__(self, dataframe, start=None, stop=None, columns=None):
+        """
+        :param dataframe: DataFrame
+        :param start: first location, in standard python form of positive or negative number. If None then zero
+        :param stop: location after the last row. If None then the length of the DataFrame
+        :param columns: list of column names, or None for all columns
+        """
+        self._dataframe = dataframe
+        self._start, self._stop, _ = slice(start, stop).indices(len(dataframe))
+        self._stop = max(self._stop, self._start)
+        if columns is None:
+            self._columns = dataframe.columns
+        else:
+            columns = list(columns)
+            for column in columns:
+                dataframe._column_location(column)
+            self._columns = columns
+        self._column_set = set(self._columns)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __repr__(self):
+        return 'object id: %s\ndataframe id: %s\nstart: %s\nstop: %s\ncolumns:\n%s\n' % \
+            (id(self), id(self._dataframe), self._start, self._stop, self._columns)
+
+    def __str__(self):
+        return self._make_table()
+
+    def _make_table(self, index=True, **kwargs):
+        kwargs['headers'] = 'keys' if 'headers' not in kwargs.keys() else kwargs['headers']
+        return tabulate(self.to_dict(ordered=True, index=index), **kwargs)
+
+    def print(self, index=True, **kwargs):
+        """
+        Print the contents of the ViewDataFrame. See DataFrame.print()
+
+        :param index: If True then include the indexes as a column in the output, if False ignore the index
+        :param kwargs: Parameters to pass along to the tabulate function
+        :return: output of the tabulate function
+        """
+        print(self._make_table(index=index, **kwargs))
+
+    @property
+    def dataframe(self):
+        return self._dataframe
+
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def stop(self):
+        return self._stop
+
+    @property
+    def columns(self):
+        return self._columns.copy()
+
+    @property
+    def index(self):
+        """
+        Return the index values of the view as a new list
+
+        :return: list
+        """
+        return list(self._dataframe.index[self._start:self._stop])
+
+    @property
+    def index_name(self):
+        return self._dataframe.index_name
+
+    @property
+    def sort(self):
+        return self._dataframe.sort
+
+    def _location(self, location):
+        """
+        Translate a location of the view to the location in the DataFrame
+
+        :param location: location in standard python form of positive or negative number
+        :return: location in the DataFrame
+        """
+        length = self._stop - self._start
+        if location < 0:
+            location += length
+        if not 0 <= location < length:
+            raise IndexError('location out of range of the view')
+        return self._start + location
+
+    def _index_location(self, index):
+        """
+        Return the location in the DataFrame of an index value in the view. A binary search of the rows of the view if
+        the DataFrame is sorted, the hash index if the DataFrame has one, or a scan of the rows of the view otherwise.
+
+        :param index: index value
+        :return: location in the DataFrame. Raises ValueError if the index value is not in the view
+        """
+        dataframe = self._dataframe
+        values = dataframe.index
+        if dataframe.sort:
+            i = bisect_left(values, index, self._start, self._stop)
+            if i < self._stop and values[i] == index:
+                return i
+        elif dataframe.hash_index:
+            i = dataframe._index_location(index)
+            if self._start <= i < self._stop:
+                return i
+        else:
+            try:
+                return values.index(index, self._start, self._stop)
+            except ValueError:
+                pass
+        raise ValueError('%s is not in the view' % repr(index))
+
+    def _column_values(self, column):
+        """
+        Return the list of values of a column of the DataFrame
+
+        :param column: column name, must be in the columns of the view
+        :return: list
+        """
+        if column not in self._column_set:
+            raise ValueError('%s is not in the columns of the view' % repr(column))
+        return self._dataframe._data[self._dataframe._column_location(column)]
+
+    def get_cell(self, index, column):
+        """
+        For a single index value and column value return the value of the cell
+
+        :param index: index value
+        :param column: column name
+        :return: value
+        """
+        return self._column_values(column)[self._index_location(index)]
+
+    def get_location(self, location, columns=None, as_dict=False, index=True):
+        """
+        For a location of the view and either (1) list of columns return a DataFrame or dictionary of the values or
+        (2) single column name and return the value of that cell. See DataFrame.get_location()
+
+        :param location: location in the view in standard python form of positive or negative number
+        :param columns: list of columns, single column name, or None to include all columns of the view
+        :param as_dict: if True then return a dictionary
+        :param index: if True then include the index in the dictionary if as_dict=True
+        :return: DataFrame or dictionary if columns is a list or value if columns is a single column name
+        """
+        location = self._location(location)
+        if columns is None:
+            columns = self._columns
+        elif not isinstance(columns, list):
+            return self._column_values(columns)[location]
+        for column in columns:
+            self._column_values(column)
+        return self._dataframe.get_location(location, columns, as_dict=as_dict, index=index)
+
+    def get_entire_column(self, column):
+        """
+        Return a list of the values of a column for the rows of the view
+
+        :param column: column name
+        :return: list
+        """
+        return list(self._column_values(column)[self._start:self._stop])
+
+    def iterrows(self, index=True):
+        """
+        Iterates over the rows of the view as dictionary of the values. The rows of each column of the view are
+        sliced once and zipped together.
+
+        :param index: if True include the index in the results
+        :return: dictionary
+        """
+        names = [self._dataframe.index_name] if index else list()
+        lists = [self.index] if index else list()
+        for column in self._columns:
+            names.append(column)
+            lists.append(self.get_entire_column(column))
+        rows = zip(*lists) if lists else repeat((), len(self))
+        return map(dict, map(zip, repeat(names), rows))
+
+    def to_dict(self, index=True, ordered=False):
+        """
+        Returns a dict where the keys are the column names and the values are lists of the values of the view for that
+        column. The lists are new lists of only the rows of the view.
+
+        :param index: If True then include the index in the dict with the index_name as the key
+        :param ordered: If True then return an OrderedDict() to preserve the order of the columns
+        :return: dict or OrderedDict()
+        """
+        result = OrderedDict() if ordered else dict()
+        if index:
+            result[self._dataframe.index_name] = self.index
+        for column in self._columns:
+            result[column] = self.get_entire_column(column)
+        return result
+
+    def to_dataframe(self):
+        """
+        Return a new DataFrame with a copy of the rows and columns of the view
+
+        :return: DataFrame
+        """
+        return DataFrame(data=self.to_dict(index=False), columns=self.columns, index=self.index,
+                         index_name=self._dataframe.index_name, sort=self._dataframe.sort)
+
+
+@lru_cache(maxsize=128)
+def _row_tuple(name, fields):
+    """
+    Return the namedtuple class for itertuples(), cached so the class is only created once for the same name and fields
+
+    :param name: name of the namedtuple
+    :param fields: tuple of field names
+    :return: namedtuple class
+    """
+    return namedtuple(name, fields)
+
+
+def _default_origin(value):
+    """
+    Return the default start of the first bucket of fixed width buckets on an index, 1970-01-01 for a datetime or date
+    index and zero otherwise
+
+    :param value: index value
+    :return: origin
+    """
+    if isinstance(value, datetime):
+        return datetime(1970, 1, 1, tzinfo=value.tzinfo)
+    if isinstance(value, date):
+        return date(1970, 1, 1)
+    return 0
+
+
+class GroupBy(object):
+    """
+    The rows of a DataFrame grouped by the values of one or more key columns, as returned by DataFrame.groupby(). The
+    group key is the value of the key column, or the tuple of the values if there are multiple key columns. The groups
+    are a dictionary of the group key to the list of row locations, so aggregations read the column values of each
+    group directly and do not create the rows.
+    """
+    __slots__ = ['_dataframe', '_columns', '_groups']
+
+    # the group keys can be None or of mixed types so the result of agg() is not sorted
+    SORT_RESULT = False
+
+    def __init__(self, dataframe, columns):
+        """
+        :param dataframe: DataFrame to group
+        :param columns: single column name or list of column names
+        """
+        self._dataframe = dataframe
+        self._columns = list(columns) if isinstance(columns, list) or dataframe._check_list(columns) else columns
+        groups = dict()
+        if isinstance(self._columns, list):
+            keys = zip(*[dataframe.get_entire_column(column, as_list=True) for column in self._columns])
+        else:
+            keys = dataframe.get_entire_column(self._columns, as_list=True)
+        for i, key in enumerate(keys):
+            try:
+                groups[key].append(i)
+            except KeyError:
+                groups[key] = [i]
+        self._groups = groups
+
+    def __len__(self):
+        return len(self._groups)
+
+    @property
+    def groups(self):
+        """
+        Return the dictionary of the group key to the list of row locations in the DataFrame
+
+        :return: dict
+        """
+        return self._groups
+
+    def _group_values(self, values):
+        """
+        Generator of the list of values for each group
+
+        :param values: list of the values of a column
+        :return: generator of lists
+        """
+        for locations in self._groups.values():
+            if len(locations) == 1:
+                yield [values[locations[0]]]
+            else:
+                yield list(itemgetter(*locations)(values))
+
+    def agg(self, aggregations):
+        """
+        Aggregate the columns for each group. The aggregations are the names in math_utils.AGGREGATIONS, which are
+        count, sum, mean, min, max, std, first and last and ignore None values, or any function that takes a list and
+        returns a value.
+
+        The result is a DataFrame indexed by the group key, in the order the groups first appear, with sort=False. For
+        resample() the result is sorted by the start of each bucket. If the aggregation for a column is a single name or
+        function the result column has the same name as the column, if it is a list then the result has a column for
+        each, named by the tuple of the column name and the aggregation name.
+
+        :param aggregations: dict of column name to an aggregation name or function, or a list of them
+        :return: DataFrame
+        """
+        if not aggregations:
+            raise ValueError('aggregations cannot be empty')
+        data = dict()
+        columns = list()
+        for column, functions in aggregations.items():
+            values = self._dataframe.get_entire_column(column, as_list=True)
+            aggregators = list()
+            results = list()
+            for function in (functions if isinstance(functions, list) else [functions]):
+                name = function if isinstance(function, str) else function.__name__
+                result_column = (column, name) if isinstance(functions, list) else column
+                if isinstance(function, str):
+                    if function not in math_utils.AGGREGATIONS:
+                        raise ValueError('aggregation must be one of: %s' % ', '.join(math_utils.AGGREGATIONS))
+                    function = partial(math_utils.aggregate, function)
+                aggregators.append(function)
+                data[result_column] = list()
+                results.append(data[result_column])
+                columns.append(result_column)
+            # get the values of each group once for all of the aggregations of the column
+            for group_values in self._group_values(values):
+                for function, result in zip(aggregators, results):
+                    result.append(function(group_values))
+        index_name = tuple(self._columns) if isinstance(self._columns, list) else self._columns
+        return DataFrame(data=data, columns=columns, index=list(self._groups.keys()), index_name=index_name,
+                         sort=self.SORT_RESULT)
+
+
+class Resample(GroupBy):
+    """
+    The rows of a sorted DataFrame grouped into buckets of fixed width on the index, as returned by
+    DataFrame.resample(). The group key is the start of the bucket, and because the DataFrame is sorted the rows of each
+    bucket are a range of locations so the aggregations slice the columns.
+    """
+    __slots__ = []
+
+    # the buckets are made in order of the index
+    SORT_RESULT = True
+
+    def __init__(self, dataframe, width, origin=None):
+        """
+        :param dataframe: sorted DataFrame to group
+        :param width: width of the buckets
+        :param origin: index value that is the start of a bucket, see DataFrame.resample()
+        """
+        if not dataframe.sort:
+            raise ValueError('resample requires a sorted DataFrame')
+        self._dataframe = dataframe
+        self._columns = dataframe.index_name
+        self._groups = dict()
+        index = dataframe.index
+        if not index:
+            return
+        if origin is None:
+            origin = _default_origin(index[0])
+        location = 0
+        while location < len(index):
+            start = origin + ((index[location] - origin) // width) * width
+            end = max(bisect_left(index, start + width, location), location + 1)
+            self._groups[start] = range(location, end)
+            location = end
+
+    def _group_values(self, values):
+        """
+        Generator of the list of values for each bucket
+
+        :param values: list of the values of a column
+        :return: generator of lists
+        """
+        for locations in self._groups.values():
+            yield values[locations.start:locations.stop]
+
+
+class BarBuilder(object):
+    """
+    Open, high, low and close bars of fixed width on the index of a sorted DataFrame or Series, built as rows are
+    appended, as returned by DataFrame.bars() and Series.bars(). The open bar is kept in the BarBuilder and updated in
+    O(1) for each appended row. When a row is in a later bar the open bar is finished and appended to the output
+    DataFrame, indexed by the start of the bar, with open, high, low, close and count columns and a volume column if
+    there is a volume. Rows with a price of None are ignored.
+    """
+    __slots__ = ['_source', '_column', '_volume', '_width', '_origin', '_output', '_start', '_open', '_high', '_low',
+                 '_close', '_count', '_sum']
+
+    def __init__(self, source, width, column=None, volume=None, origin=None, output=None):
+        """
+        :param source: sorted DataFrame or Series
+        :param width: width of the bars
+        :param column: column name of the prices for a DataFrame, None for a Series
+        :param volume: (optional) column name of the volumes for a DataFrame
+        :param origin: index value that is the start of a bar, see DataFrame.bars()
+        :param output: (optional) DataFrame to append the finished bars to
+        """
+        if not source.sort:
+            raise ValueError('bars require a sorted source')
+        self._source = source
+        self._column = column
+        self._volume = volume
+        self._width = width
+        self._origin = origin
+        if output is None:
+            columns = ['open', 'high', 'low', 'close', 'count'] + (['volume'] if volume is not None else [])
+            output = DataFrame(columns=columns, index_name=source.index_name, sort=True)
+        self._output = output
+        self._start = None
+        self._open = self._high = self._low = self._close = None
+        self._count = self._sum = 0
+
+        # build the bars of the existing rows then attach to the source for the appended rows
+        if column is None:
+            self._append_rows(source.index, source.data)
+        else:
+            values = {column: source.get_entire_column(column, as_list=True)}
+            if volume is not None:
+                values[volume] = source.get_entire_column(volume, as_list=True)
+            self._append_rows(source.index, values)
+        if source._bars is None:
+            source._bars = list()
+        source._bars.append(self)
+
+    @property
+    def output(self):
+        return self._output
+
+    @property
+    def current(self):
+        """
+        The open bar that is not finished
+
+        :return: dict of the start, open, high, low, close, count and volume of the bar, or None if there is no open bar
+        """
+        if self._start is None:
+            return None
+        bar = {'start': self._start, 'open': self._open, 'high': self._high, 'low': self._low, 'close': self._close,
+               'count': self._count}
+        if self._volume is not None:
+            bar['volume'] = self._sum
+        return bar
+
+    def _finish(self):
+        """
+        Append the open bar to the output
+
+        :return: nothing
+        """
+        bar = self.current
+        del bar['start']
+        self._output.append_row(self._start, bar)
+
+    def _bar_start(self, index, origin):
+        """
+        Return the start of the bar of an index value
+
+        :param index: index value
+        :param origin: start of the first bar
+        :return: start of the bar
+        """
+        return origin + ((index - origin) // self._width) * self._width
+
+    def _check(self, indexes, prices):
+        """
+        Raise ValueError if any price would be before the start of its open bar. The bars are not changed, so this is
+        called before the source adds the rows and a rejected row leaves the source and the bars unchanged.
+
+        :param indexes: list of index values
+        :param prices: list of prices
+        :return: nothing
+        """
+        start = self._start
+        origin = self._origin
+        for index, price in zip(indexes, prices):
+            if price is None:
+                continue
+            if start is not None and index < start + self._width:
+                if index < start:
+                    raise ValueError('index is before the start of the open bar')
+            else:
+                if origin is None:
+                    origin = _default_origin(index)
+                start = self._bar_start(index, origin)
+
+    def _prices(self, values):
+        """
+        Return the price and volume of an appended row
+
+        :param values: dictionary of values for a DataFrame, or the value for a Series
+        :return: tuple of (price, volume)
+        """
+        if self._column is None:
+            return values, None
+        return values.get(self._column), values.get(self._volume) if self._volume is not None else None
+
+    def _check_row(self, index, values):
+        """
+        Check a row before it is appended to the source, see _check()
+
+        :param index: index value
+        :param values: dictionary of values for a DataFrame, or the value for a Series
+        :return: nothing
+        """
+        self._check([index], [self._prices(values)[0]])
+
+    def _check_rows(self, indexes, values):
+        """
+        Check rows before they are appended to the source, see _check()
+
+        :param indexes: list of index values
+        :param values: dictionary of lists of values for a DataFrame, or the list of values for a Series
+        :return: nothing
+        """
+        self._check(indexes, values if self._column is None else values.get(self._column, []))
+
+    def _add(self, index, price, volume):
+        """
+        Add a price to the bars, finishing the open bar if the index is in a later bar. The index must have been
+        checked with _check().
+
+        :param index: index value
+        :param price: price
+        :param volume: volume, or None
+        :return: nothing
+        """
+        if price is None:
+            return
+        if self._start is not None and index < self._start + self._width:
+            if price > self._high:
+                self._high = price
+            elif price < self._low:
+                self._low = price
+            self._close = price
+            self._count += 1
+        else:
+            if self._start is not None:
+                self._finish()
+            if self._origin is None:
+                self._origin = _default_origin(index)
+            self._start = self._bar_start(index, self._origin)
+            self._open = self._high = self._low = self._close = price
+            self._count = 1
+            self._sum = 0
+        if volume is not None:
+            self._sum += volume
+
+    def _append_row(self, index, values):
+        """
+        Update the bars for an appended row
+
+        :param index: index value
+        :param values: dictionary of values for a DataFrame, or the value for a Series
+        :return: nothing
+        """
+        self._add(index, *self._prices(values))
+
+    def _append_rows(self, indexes, values):
+        """
+        Update the bars for appended rows
+
+        :param indexes: list of index values
+        :param values: dictionary of lists of values for a DataFrame, or the list of values for a Series
+        :return: nothing
+        """
+        if self._column is None:
+            prices = values
+            volumes = []
+        else:
+            prices = values.get(self._column, [])
+            volumes = values.get(self._volume, []) if self._volume is not None else []
+        for i, index in enumerate(indexes):
+            self._add(index, prices[i] if i < len(prices) else None, volumes[i] if i < len(volumes) else None)
+
+    def close(self):
+        """
+        Append the open bar to the output and detach from the source, so no more rows are added to the bars
+
+        :return: output DataFrame
+        """
+        if self._start is not None:
+            self._finish()
+            self._start = None
+        if self in self._source._bars:
+            self._source._bars.remove(self)
+        return self._output
+
+
+def _write_json_list(file, values, rows):
+    """
+    Write the JSON of a list to a file object in chunks of rows
+
+    :param file: file object
+    :param values: list
+    :param rows: number of rows of each chunk
+    :return: nothing
+    """
+    file.write('[')
+    for start in range(0, len(values), rows):
+        if start:
+            file.write(', ')
+        file.write(json.dumps(take(values, slice(start, start + rows)), default=repr)[1:-1])
+    file.write(']')
+
+
+class _JsonReader(object):
+    """
+    Incremental reader of a JSON from a file object for DataFrame.from_json_file(). The text is read in blocks into a
+    buffer, and the values of a list are decoded many at a time by cutting the buffer at a comma between values, so
+    large lists of numbers are decoded at the speed of json.loads() without the entire JSON in memory. If a cut is
+    inside a string or nested value the decode fails and the values up to the cut are decoded one at a time.
+    """
+    __slots__ = ['_file', '_size', '_buffer', '_pos', '_offset', '_decoder']
+
+    def __init__(self, file, size=1 << 20):
+        """
+        :param file: file object open for reading text
+        :param size: number of characters to read at a time
+        """
+        self._file = file
+        self._size = size
+        self._buffer = ''
+        self._pos = 0
+        self._offset = 0  # location in the file of the start of the buffer
+        self._decoder = json.JSONDecoder()
+
+    def _read(self):
+        """
+        Read the next block of the file into the buffer, dropping the part of the buffer already decoded
+
+        :return: False if the end of the file, otherwise True
+        """
+        block = self._file.read(self._size)
+        if not block:
+            return False
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
+    def _next_char(self):
+        """
+        Skip the white space and return the next character without moving past it
+
+        :return: character, or empty string if the end of the file
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer) or not self._read():
+                return buffer[pos:pos + 1]
+
+    def _expect(self, chars):
+        """
+        Move past the next character, which must be one of the chars
+
+        :param chars: string of allowed characters
+        :return: the character
+        """
+        char = self._next_char()
+        if not char or char not in chars:
+            raise ValueError('invalid JSON: expected one of %r at %r' % (chars, self._buffer[self._pos:self._pos + 20]))
+        self._pos += 1
+        return char
+
+    def value(self):
+        """
+        Decode the next value. A value that ends at the end of the buffer may be incomplete, such as a number, so the
+        next block is read and the value decoded again.
+
+        :return: value
+        """
+        self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if self._read():
+                    continue
+                raise
+            if end < len(self._buffer) or not self._read():
+                self._pos = end
+                return value
+
+    def keys(self):
+        """
+        Iterate over the keys of the next object. After each key the caller must decode its value before the next key.
+
+        :return: iterator of keys
+        """
+        self._expect('{')
+        if self._next_char() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(':')
+            yield key
+            if self._expect(',}') == '}':
+                return
+
+    def _decode_to(self, cut, end):
+        """
+        Try to decode the values of the list from the position to the cut as one list
+
+        :param cut: location in the buffer after the last value
+        :param end: string to close the list
+        :return: list of values, or None if the cut is not between values of the list
+        """
+        try:
+            return json.loads('[' + self._buffer[self._pos:cut] + end)
+        except ValueError:
+            return None
+
+    def array(self):
+        """
+        Decode the next list. The end of the list is tried first, then the last comma between values in the buffer, and
+        if neither is between values of the list the values are decoded one at a time up to the last comma.
+
+        :return: list
+        """
+        self._expect('[')
+        values = list()
+        if self._next_char() == ']':
+            self._pos += 1
+            return values
+        slow = -1  # decode one value at a time until past this offset in the file
+        while True:
+            if self._offset + self._pos > slow:
+                buffer = self._buffer
+                for separator in (']', ']]'):
+                    cut = buffer.find(separator, self._pos)
+                    decoded = self._decode_to(cut + len(separator) - 1, ']') if cut >= 0 else None
+                    if decoded is not None:
+                        values.extend(decoded)
+                        self._pos = cut + len(separator)
+                        return values
+                for separator in (',', '],', '",'):
+                    cut = buffer.rfind(separator, self._pos)
+                    decoded = self._decode_to(cut + len(separator) - 1, ']') if cut >= 0 else None
+                    if decoded is not None:
+                        values.extend(decoded)
+                        self._pos = cut + len(separator)
+                        break
+                if decoded is not None:
+                    continue
+                cut = buffer.rfind(',', self._pos)
+                if cut < 0 and self._read():
+                    continue
+                slow = self._offset + cut
+            values.append(self.value())
+            if self._expect(',]') == ']':
+                return values
@@ -0,0 +1,449 @@
+"""
+Utility functions for the math helper methods, aggregations and the eval() expressions of the DataFrame and Series.
+When NumPy is installed and the values are numeric TypedList columns, or the result is an array, the functions use
+vectorized NumPy operations, otherwise they fall back to python list comprehensions. NumPy is optional and is only
+required for results returned as arrays.
+"""
+
+import ast
+import operator
+import sys
+from functools import lru_cache
+from math import fsum
+from numbers import Number
+
+from raccoon.containers import Mask, TypedList
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+OPERATORS = {'add': operator.add, 'subtract': operator.sub, 'multiply': operator.mul, 'divide': operator.truediv}
+
+# largest magnitude of int64 values that is safe from overflow in an addition or subtraction
+_INT_LIMIT = 2 ** 62
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError('numpy is required for as_array=True')
+
+
+def to_array(values):
+    """
+    Convert a list of numbers into a NumPy array of int64 or float64 with the same values. A TypedList without None
+    values is read through the buffer protocol without a copy. Returns None if NumPy is not installed or the values
+    are not all numbers, including lists with None or booleans, in which case the python path must be used.
+
+    :param values: list, TypedList or dropin list
+    :return: numpy array or None
+    """
+    if np is None:
+        return None
+    if isinstance(values, TypedList):
+        if values.null_mask().popcount():
+            return None
+        array = np.frombuffer(values.array, dtype=values.typecode) if len(values) else np.array([])
+    else:
+        try:
+            array = np.asarray(values)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    if array.ndim != 1 or array.dtype.kind not in 'iuf':
+        return None
+    # upcast so the results are the same as with python numbers
+    if array.dtype.kind == 'f':
+        return array.astype(np.float64, copy=False)
+    if array.dtype.kind == 'u' and array.dtype.itemsize == 8:
+        return None
+    return array.astype(np.int64, copy=False)
+
+
+def _overflows(name, left, right):
+    """
+    Check if an integer operation could overflow int64, in which case python integers are needed for the exact result.
+
+    :return: True if the operation could overflow
+    """
+    if left.dtype.kind == 'f' and right.dtype.kind == 'f':
+        return False
+    left_max = int(np.abs(left).max()) if len(left) else 0
+    right_max = int(np.abs(right).max()) if len(right) else 0
+    if name == 'multiply':
+        return left.dtype.kind == right.dtype.kind == 'i' and left_max * right_max >= 2 ** 63
+    # add and subtract, divide converts to float64 which is exact only to 2 ** 53
+    limit = 2 ** 53 if name == 'divide' else _INT_LIMIT
+    return (left.dtype.kind == 'i' and left_max >= limit) or (right.dtype.kind == 'i' and right_max >= limit)
+
+
+def arithmetic(name, left_list, right_list, as_array=False):
+    """
+    Element-wise math of two lists of the same length.
+
+    :param name: one of add, subtract, multiply or divide
+    :param left_list: list of left values
+    :param right_list: list of right values
+    :param as_array: if True return a NumPy array, which requires NumPy to be installed
+    :return: list or numpy array
+    """
+    if as_array:
+        _check_numpy()
+    # converting python lists to arrays and back costs more than the math, so lists only use NumPy for array results
+    vectorize = as_array or isinstance(left_list, TypedList) or isinstance(right_list, TypedList)
+    left = to_array(left_list) if vectorize else None
+    right = to_array(right_list) if left is not None else None
+    if left is not None and right is not None and not _overflows(name, left, right) and \
+            not (name == 'divide' and not right.all()):  # python raises ZeroDivisionError
+        result = OPERATORS[name](left, right)
+        return result if as_array else result.tolist()
+    func = OPERATORS[name]
+    result = [func(x, y) for x, y in zip(left_list, right_list)]
+    return np.array(result) if as_array else result
+
+
+def _is_number(value):
+    return isinstance(value, Number) and not isinstance(value, bool) and \
+        (not isinstance(value, int) or -2 ** 63 <= value < 2 ** 63)
+
+
+def _to_mask(array):
+    """
+    Convert a NumPy bool array to a Mask without going through python booleans.
+
+    :param array: numpy bool array
+    :return: Mask
+    """
+    return Mask._from_bytes(array.view(np.uint8).tobytes())
+
+
+def equality(values, value, as_array=False):
+    """
+    Element-wise equality of the values to a single value.
+
+    :param values: list of values
+    :param value: value to compare
+    :param as_array: if True return a NumPy bool array, which requires NumPy to be installed
+    :return: Mask or numpy bool array
+    """
+    if as_array:
+        _check_numpy()
+    # as with arithmetic(), python lists only use NumPy for array results
+    vectorize = as_array or isinstance(values, TypedList)
+    array = to_array(values) if vectorize and _is_number(value) else None
+    if array is not None:
+        result = array == value
+    elif as_array:
+        result = np.array([x == value for x in values], dtype=bool)
+    else:
+        return Mask(x == value for x in values)
+    return result if as_array else _to_mask(result)
+
+
+def isin(values, compare_list, as_array=False):
+    """
+    Element-wise check of whether each value is in the compare_list.
+
+    :param values: list of values
+    :param compare_list: list of items to compare to
+    :param as_array: if True return a NumPy bool array, which requires NumPy to be installed
+    :return: Mask or numpy bool array
+    """
+    if as_array:
+        _check_numpy()
+    vectorize = as_array or isinstance(values, TypedList)
+    array = to_array(values) if vectorize and all(_is_number(x) for x in compare_list) else None
+    if array is not None:
+        result = np.isin(array, list(compare_list))
+    elif as_array:
+        result = np.array([x in compare_list for x in values], dtype=bool)
+    else:
+        return Mask(x in compare_list for x in values)
+    return result if as_array else _to_mask(result)
+
+
+# the parts of python syntax allowed in an expression. Before python 3.8 the constants are Num, Str and NameConstant
+_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp, ast.Name, ast.Load,
+          ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub, ast.Not,
+          ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.And, ast.Or)
+_NODES += (ast.Constant,) if sys.version_info >= (3, 8) else (ast.Num, ast.Str, ast.NameConstant)
+
+
+class _ColumnNames(ast.NodeTransformer):
+    """
+    Replace the column names in an expression with the argument names _0, _1, ... and record the column names in order
+    """
+    def __init__(self):
+        self.columns = list()
+
+    def visit_Name(self, node):
+        if node.id not in self.columns:
+            self.columns.append(node.id)
+        return ast.copy_location(ast.Name(id='_%d' % self.columns.index(node.id), ctx=ast.Load()), node)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression):
+    """
+    Compile an arithmetic and comparison expression over column names into a function that takes the values of the
+    columns as arguments. The expression can use numbers, strings, True, False, None, the operators + - * / // % **,
+    the comparisons == != < <= > >=, and, or, not and parentheses. Column names must be valid python names. Compiled
+    expressions are cached.
+
+    :param expression: string expression, for example 'a + b * c'
+    :return: (columns, function, vectorize) tuple of the list of column names in the order of the function arguments,
+        the function and whether the function also works on NumPy arrays
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError('invalid expression: %s : %s' % (expression, e.msg))
+    for node in ast.walk(tree):
+        if not isinstance(node, _NODES):
+            raise ValueError('invalid expression: %s : %s is not supported' % (expression, type(node).__name__))
+    # and, or, not and chained comparisons do not work element-wise on arrays
+    vectorize = not any(isinstance(node, (ast.BoolOp, ast.Not)) or (isinstance(node, ast.Compare) and len(node.ops) > 1)
+                        for node in ast.walk(tree))
+    names = _ColumnNames()
+    body = names.visit(tree).body
+    if not names.columns:
+        raise ValueError('invalid expression: %s : no column names' % expression)
+    # parse the lambda of the arguments so the arguments node has the fields of the running python version
+    function = ast.parse('lambda %s: None' % ', '.join('_%d' % i for i in range(len(names.columns))), mode='eval')
+    function.body.body = body
+    function = ast.fix_missing_locations(function)
+    return names.columns, eval(compile(function, '<expression>', 'eval'), {'__builtins__': {}}), vectorize
+
+
+def evaluate(expression, values, as_array=False):
+    """
+    Evaluate an expression element-wise over lists of values in one pass without intermediate lists. If NumPy is
+    installed, the expression works on arrays and the values are all float columns with a dtype, or as_array is True,
+    then the expression is evaluated as one vectorized NumPy kernel.
+
+    :param expression: string expression, see compile_expression()
+    :param values: dictionary of column name to list of values for each column name in the expression
+    :param as_array: if True return a NumPy array, which requires NumPy to be installed
+    :return: list or numpy array
+    """
+    if as_array:
+        _check_numpy()
+    columns, function, vectorize = compile_expression(expression)
+    lists = [values[column] for column in columns]
+    if vectorize and np is not None and (as_array or all(isinstance(x, TypedList) for x in lists)):
+        arrays = [to_array(x) for x in lists]
+        # only floats are vectorized as integers overflow without an error
+        if all(x is not None and x.dtype.kind == 'f' for x in arrays):
+            try:
+                with np.errstate(all='raise'):
+                    result = np.asarray(function(*arrays))
+                return result if as_array else result.tolist()
+            except FloatingPointError:  # division by zero or overflow, the python path gives the python result
+                pass
+    result = list(map(function, *lists))
+    return np.array(result) if as_array else result
+
+
+AGGREGATIONS = ['count', 'sum', 'mean', 'min', 'max', 'std', 'first', 'last']
+_BUILTINS = {'sum': sum, 'min': min, 'max': max}
+
+# the std is recalculated from the values when removing values leaves m2 below this fraction of its largest value, as
+# then the rounding error of the values that have been removed is large compared to m2
+_CANCELLATION = 2.0 ** -10
+
+
+class RunningStats(object):
+    """
+    Running count, sum, mean, standard deviation, min and max of a list of numbers. Values can be added and removed in
+    O(1), None values are ignored. The standard deviation is updated with Welford's method. When the current min or max
+    value is removed it is recalculated from the values on the next request. Removing values leaves the rounding error
+    of the values removed in the sum of squares, so when it falls far below its largest value the standard deviation
+    is also recalculated from the values on the next request.
+    """
+    __slots__ = ['_count', '_sum', '_mean', '_m2', '_min', '_max', '_peak']
+
+    def __init__(self, values=None):
+        """
+        :param values: (optional) list of values to add
+        """
+        self._count = 0
+        self._sum = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = None  # None if there are no values or the min needs to be recalculated
+        self._max = None
+        self._peak = 0.0  # largest m2 since the last recalculation
+        if values is not None:
+            for value in values:
+                self.add(value)
+
+    def add(self, value):
+        """
+        Add a value. Raises TypeError if the value is not a number.
+
+        :param value: value to add, None is ignored
+        :return: nothing
+        """
+        if value is None:
+            return
+        delta = value - self._mean
+        self._count += 1
+        self._sum += value
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if self._m2 > self._peak:
+            self._peak = self._m2
+        if self._count == 1:
+            self._min = self._max = value
+        else:
+            if self._min is not None and value < self._min:
+                self._min = value
+            if self._max is not None and value > self._max:
+                self._max = value
+
+    def remove(self, value):
+        """
+        Remove a value that was previously added.
+
+        :param value: value to remove, None is ignored
+        :return: nothing
+        """
+        if value is None:
+            return
+        self._count -= 1
+        self._sum -= value
+        if self._count == 0:
+            self._mean = self._m2 = self._peak = 0.0
+            self._min = self._max = None
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+        if value == self._min:
+            self._min = None
+        if value == self._max:
+            self._max = None
+
+    def replace(self, old, new):
+        """
+        Replace a value that was previously added with a new value.
+
+        :param old: value to remove
+        :param new: value to add
+        :return: nothing
+        """
+        self.add(new)
+        self.remove(old)
+
+    def inexact(self):
+        """
+        Return True if values have been removed since the std was last calculated from the values, and the rounding
+        error of the values removed could be a large part of the std.
+
+        :return: boolean
+        """
+        return self._m2 < self._peak * _CANCELLATION
+
+    def recalculate(self, values):
+        """
+        Recalculate all of the statistics from the values, which removes the rounding error left by values that have
+        been removed. The mean and sum of squares use fsum, and are exact when all of the values are the same.
+
+        :param values: list of the values that have been added
+        :return: nothing
+        """
+        numbers = [x for x in values if x is not None]
+        self._count = len(numbers)
+        self._sum = sum(numbers)
+        if not numbers:
+            self._mean = self._m2 = self._peak = 0.0
+            self._min = self._max = None
+            return
+        self._min = min(numbers)
+        self._max = max(numbers)
+        if self._min == self._max:
+            self._mean = float(self._min)
+            self._m2 = 0.0
+        else:
+            self._mean = fsum(numbers) / self._count
+            self._m2 = fsum((x - self._mean) ** 2 for x in numbers)
+        self._peak = self._m2
+
+    def get(self, name, values):
+        """
+        Return one of the statistics count, sum, mean, std, min or max. The values are only used if the min, max or std
+        needs to be recalculated.
+
+        :param name: name of the statistic
+        :param values: list of the values that have been added
+        :return: value of the statistic, or None if there are no values or too few values for the std
+        """
+        if name == 'count':
+            return self._count
+        if name == 'sum':
+            return self._sum
+        if name == 'mean':
+            return self._sum / self._count if self._count else None
+        if name == 'std':
+            if values is not None and self.inexact():
+                self.recalculate(values)
+            return (self._m2 / (self._count - 1)) ** 0.5 if self._count > 1 else None
+        if name == 'min':
+            if self._min is None and self._count:
+                self._min = min(_non_null(values))
+            return self._min
+        if name == 'max':
+            if self._max is None and self._count:
+                self._max = max(_non_null(values))
+            return self._max
+        raise ValueError('aggregation must be one of: %s' % ', '.join(AGGREGATIONS))
+
+
+def _non_null(values):
+    """
+    Return the values without the None values, as the array of a TypedList if possible so the iteration runs in C.
+
+    :param values: list of values
+    :return: list or array
+    """
+    if isinstance(values, TypedList):
+        return values.array if None not in values else [x for x in values if x is not None]
+    return [x for x in values if x is not None] if None in values else values
+
+
+def aggregate(name, values):
+    """
+    Aggregate a list of values in a single pass, ignoring None values. The mean is the sum divided by the count, the
+    std is the sample standard deviation and first and last are the first and last values that are not None. The
+    mean, min, max, std, first and last of no values is None, as is the std of one value.
+
+    :param name: name of the aggregation, one of AGGREGATIONS
+    :param values: list of values
+    :return: value of the aggregation
+    """
+    if name not in AGGREGATIONS:
+        raise ValueError('aggregation must be one of: %s' % ', '.join(AGGREGATIONS))
+    if name == 'first':
+        return next((x for x in values if x is not None), None)
+    if name == 'last':
+        return next((x for x in reversed(values) if x is not None), None)
+    if name in _BUILTINS and len(values) and not isinstance(values, TypedList):
+        # skip the scan for None values, the builtins raise a TypeError if there are any
+        try:
+            return _BUILTINS[name](values)
+        except TypeError:
+            pass
+    values = _non_null(values)
+    if name == 'count':
+        return len(values)
+    if name == 'sum':
+        return sum(values)
+    if not len(values):
+        return None
+    if name == 'mean':
+        return sum(values) / len(values)
+    if name == 'min':
+        return min(values)
+    if name == 'max':
+        return max(values)
+    return RunningStats(values).get('std', values)
@@ -8,7 +8,12 @@ from itertools import compress
 
 from tabulate import tabulate
 
-from raccoon.sort_utils import sorted_exists, sorted_index, sorted_list_indexes
+from raccoon import math_utils
+from raccoon.containers import Mask, is_bool_list, take
+from raccoon.dataframe import BarBuilder, LocationIndexer
+from raccoon.sort_utils import is_increasing, sorted_asof, sorted_asof_locations, sorted_exists, sorted_index, \
+    sorted_insert_locations, sorted_list_indexes, splice_values
+from raccoon.window import RollingWindow
 
 
 class SeriesBase(ABC):
@@ -17,7 +22,8 @@ class SeriesBase(ABC):
     methods in Series are views to the underlying data and not copies.
     """
     # Define slots to make object faster
-    __slots__ = ['_data', '_data_name', '_index', '_index_name', '_sort', '_dropin']
+    __slots__ = ['_data', '_data_name', '_index', '_index_name', '_sort', '_dropin', '_index_map', '_level_map',
+                 '_bars', '_unordered', '_level_stale']
 
     def __init__(self):
         """
@@ -29,6 +35,11 @@ class SeriesBase(ABC):
         self._data_name = None
         self._sort = None
         self._dropin = None
+        self._index_map = None
+        self._level_map = None
+        self._bars = None
+        self._unordered = False  # True if appending has left a sorted index out of order
+        self._level_stale = False  # True if the level maps must be rebuilt before the next lookup
 
     def __len__(self):
         return len(self._index)
@@ -91,7 +102,33 @@ class SeriesBase(ABC):
         return
 
     def _check_list(self, x):
-        return type(x) == (self._dropin if self._dropin else list)
+        return type(x) == (self._dropin if self._dropin else list) or isinstance(x, Mask)
+
+    def _index_location(self, index):
+        """
+        Return the location of an index value using the fastest method available: the hash index if maintained, a
+        binary search if the Series is sorted, or a linear scan otherwise.
+
+        :param index: index value
+        :return: integer location. Raises ValueError if the index value is not in the index
+        """
+        if self._index_map is not None:
+            try:
+                return self._index_map[index]
+            except KeyError:
+                raise ValueError('%s is not in index' % repr(index))
+        return sorted_index(self._index, index) if self._sort else self._index.index(index)
+
+    def _index_exists(self, index):
+        """
+        Returns True if the index value is in the index.
+
+        :param index: index value
+        :return: boolean
+        """
+        if self._index_map is not None:
+            return index in self._index_map
+        return sorted_exists(self._index, index)[0] if self._sort else index in self._index
 
     def get(self, indexes, as_list=False):
         """
@@ -115,7 +152,7 @@ class SeriesBase(ABC):
         :param index: index value
         :return: value
         """
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
+        i = self._index_location(index)
         return self._data[i]
 
     def get_rows(self, indexes, as_list=False):
@@ -126,7 +163,7 @@ class SeriesBase(ABC):
         :param as_list: if True return a list, if False return Series
         :return: Series if as_list if False, a list if as_list is True
         """
-        if all([isinstance(i, bool) for i in indexes]):  # boolean list
+        if is_bool_list(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError('boolean index list must be same size of existing index')
             if all(indexes):  # the entire column
@@ -136,8 +173,7 @@ class SeriesBase(ABC):
                 data = list(compress(self._data, indexes))
                 index = list(compress(self._index, indexes))
         else:  # index values list
-            locations = [sorted_index(self._index, x) for x in indexes] if self._sort \
-                else [self._index.index(x) for x in indexes]
+            locations = [self._index_location(x) for x in indexes]
             data = [self._data[i] for i in locations]
             index = [self._index[i] for i in locations]
         return data if as_list else Series(data=data, index=index, data_name=self._data_name,
@@ -156,15 +192,28 @@ class SeriesBase(ABC):
 
     def get_locations(self, locations, as_list=False):
         """
-        For list of locations return a Series or list of the values.
+        For a list of locations or a slice of locations return a Series or list of the values. The values are read
+        from the lists directly by location and a slice is copied in one step, so this is O(k) for k rows with no
+        lookup of the index values.
 
-        :param locations: list of index locations
+        :param locations: list of index locations or a slice of locations
         :param as_list: True to return a list of values
         :return: Series or list
         """
+        data = take(self._data, locations)
+        if as_list:
+            return data
+        return Series(data=data, index=take(self._index, locations), data_name=self._data_name,
+                      index_name=self._index_name, sort=self._sort, dropin=self._dropin)
 
-        indexes = [self._index[x] for x in locations]
-        return self.get(indexes, as_list)
+    @property
+    def iloc(self):
+        """
+        Positional access to the values by location, list of locations or slice of locations. See LocationIndexer
+
+        :return: LocationIndexer
+        """
+        return LocationIndexer(self)
 
     def get_slice(self, start_index=None, stop_index=None, as_list=False):
         """
@@ -193,13 +242,45 @@ class SeriesBase(ABC):
             return Series(data=data, index=index, data_name=self._data_name, index_name=self._index_name,
                           sort=self._sort, dropin=self._dropin)
 
+    def get_asof(self, index):
+        """
+        For sorted Series return the value at the index value, or if the index value is not in the index then the
+        value of the last row before it. This is the "as of" value and is found with a binary search without copying
+        any rows. Raises ValueError if all the index values are after the index value.
+
+        :param index: index value
+        :return: value
+        """
+        if not self._sort:
+            raise RuntimeError('Can only use get_asof on sorted Series')
+        i = sorted_asof(self._index, index)
+        if i < 0:
+            raise ValueError('no index value at or before %s' % repr(index))
+        return self._data[i]
+
+    def get_asof_many(self, indexes, as_list=False):
+        """
+        For sorted Series and a list of index values return the "as of" value for each index value, as get_asof()
+        does. All of the values are found with one forward pass over the index. Any index value before the first
+        index value of the Series will have None for the value.
+
+        :param indexes: list of index values, does not need to be sorted
+        :param as_list: if True then return a list of the values
+        :return: Series with the indexes as the index, or list if as_list is True
+        """
+        if not self._sort:
+            raise RuntimeError('Can only use get_asof_many on sorted Series')
+        data = [self._data[i] if i >= 0 else None for i in sorted_asof_locations(self._index, indexes)]
+        return data if as_list else Series(data=data, index=list(indexes), data_name=self._data_name,
+                                           index_name=self._index_name, sort=self._sort, dropin=self._dropin)
+
     def _slice_index(self, slicer):
         try:
-            start_index = sorted_index(self._index, slicer.start) if self._sort else self._index.index(slicer.start)
+            start_index = self._index_location(slicer.start)
         except ValueError:
             raise IndexError('start of slice not in the index')
         try:
-            end_index = sorted_index(self._index, slicer.stop) if self._sort else self._index.index(slicer.stop)
+            end_index = self._index_location(slicer.stop)
         except ValueError:
             raise IndexError('end of slice not in the index')
         if end_index < start_index:
@@ -262,9 +343,7 @@ class SeriesBase(ABC):
         :param rows: number of rows
         :return: Series
         """
-        rows_bool = [True] * min(rows, len(self._index))
-        rows_bool.extend([False] * max(0, len(self._index) - rows))
-        return self.get(indexes=rows_bool)
+        return self.get_locations(slice(0, max(rows, 0)))
 
     def tail(self, rows):
         """
@@ -273,9 +352,7 @@ class SeriesBase(ABC):
         :param rows: number of rows
         :return: Series
         """
-        rows_bool = [False] * max(0, len(self._index) - rows)
-        rows_bool.extend([True] * min(rows, len(self._index)))
-        return self.get(indexes=rows_bool)
+        return self.get_locations(slice(max(len(self._index) - rows, 0), len(self._index)))
 
     def select_index(self, compare, result='boolean'):
         """
@@ -285,19 +362,17 @@ class SeriesBase(ABC):
         values.
 
         :param compare: value to compare as a singleton or tuple
-        :param result: 'boolean' = returns a list of booleans, 'value' = returns a list of index values that match
-        :return: list of booleans or values
+        :param result: 'boolean' = returns a Mask of booleans, 'value' = returns a list of index values that match
+        :return: Mask or list of values
         """
-        if isinstance(compare, tuple):
+        if isinstance(compare, tuple) and self._level_map is not None:
+            booleans = Mask.from_locations(len(self._index), self._level_locations(compare))
+        elif isinstance(compare, tuple):
             # this crazy list comprehension will match all the tuples in the list with None being an * wildcard
-            booleans = [all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
-                        for x, v in enumerate(self._index)]
+            booleans = Mask([all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
+                             for x, v in enumerate(self._index)])
         else:
-            booleans = [False] * len(self._index)
-            if self._sort:
-                booleans[sorted_index(self._index, compare)] = True
-            else:
-                booleans[self._index.index(compare)] = True
+            booleans = Mask.from_locations(len(self._index), [self._index_location(compare)])
         if result == 'boolean':
             return booleans
         elif result == 'value':
@@ -305,28 +380,120 @@ class SeriesBase(ABC):
         else:
             raise ValueError('only valid values for result parameter are: boolean or value.')
 
-    def isin(self, compare_list):
+    def _level_locations(self, compare):
+        """
+        Return the locations of the rows that match a tuple compare using the level maps. None in any field of the
+        tuple matches all values.
+
+        :param compare: tuple
+        :return: set or range of locations
+        """
+        if self._level_stale:
+            self._rebuild_level_map()
+        sets = list()
+        for level, value in enumerate(compare):
+            if value is not None:
+                if level >= len(self._level_map):
+                    return set()
+                sets.append(self._level_map[level].get(value, set()))
+        if not sets:
+            return range(len(self._index))
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def isin(self, compare_list, as_array=False):
         """
-        Returns a boolean list where each elements is whether that element in the column is in the compare_list.
+        Returns a boolean list where each elements is whether that element in the column is in the compare_list. If
+        NumPy is installed and the data and compare_list are numeric the check is vectorized.
 
         :param compare_list: list of items to compare to
-        :return: list of booleans
+        :param as_array: if True return a NumPy bool array, requires NumPy
+        :return: Mask of booleans, or numpy array if as_array is True
         """
-        return [x in compare_list for x in self._data]
+        return math_utils.isin(self._data, compare_list, as_array)
 
-    def equality(self, indexes=None, value=None):
+    def equality(self, indexes=None, value=None, as_array=False):
         """
         Math helper method. Given a column and optional indexes will return a list of booleans on the equality of the
-        value for that index in the DataFrame to the value parameter.
+        value for that index in the DataFrame to the value parameter. If NumPy is installed and the data is numeric the
+        comparison is vectorized.
 
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
         :param value: value to compare
-        :return: list of booleans
+        :param as_array: if True return a NumPy bool array, requires NumPy
+        :return: Mask of booleans, or numpy array if as_array is True
         """
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        compare_list = self.get_rows(indexes, as_list=True)
-        return [x == value for x in compare_list]
+        compare_list = self._data if indexes is None else self.get_rows(indexes, as_list=True)
+        return math_utils.equality(compare_list, value, as_array)
+
+    def rolling(self, window, by_index=None, min_periods=None):
+        """
+        Return a RollingWindow over the data for rolling count(), sum(), mean(), std(), min() and max() calculations.
+        Each calculation is a single pass over the data and returns a list with the value for the window ending at
+        each row.
+
+        :param window: number of rows in the window, or the width of the window in index units if by_index is True.
+            For example a window of timedelta(minutes=5) on a datetime index
+        :param by_index: if True the window is a width in index units and the Series must be sorted. If None then
+            True if the window is not an int
+        :param min_periods: minimum number of values in the window to have a result, otherwise the result is None. If
+            None then the window for a number of rows, and 1 for a window on the index
+        :return: RollingWindow
+        """
+        rolling = RollingWindow(self._data, self._index, window, by_index, min_periods)
+        if rolling.by_index and not self._sort:
+            raise ValueError('a window on the index requires a sorted Series')
+        return rolling
+
+    def count(self):
+        """
+        Returns the number of values that are not None.
+
+        :return: value
+        """
+        return math_utils.aggregate('count', self._data)
+
+    def sum(self):
+        """
+        Returns the sum of the values, ignoring None values.
+
+        :return: value
+        """
+        return math_utils.aggregate('sum', self._data)
+
+    def mean(self):
+        """
+        Returns the mean of the values, ignoring None values. None if there are no values.
+
+        :return: value
+        """
+        return math_utils.aggregate('mean', self._data)
+
+    def min(self):
+        """
+        Returns the minimum value, ignoring None values. None if there are no values.
+
+        :return: value
+        """
+        return math_utils.aggregate('min', self._data)
+
+    def max(self):
+        """
+        Returns the maximum value, ignoring None values. None if there are no values.
+
+        :return: value
+        """
+        return math_utils.aggregate('max', self._data)
+
+    def std(self):
+        """
+        Returns the sample standard deviation of the values, ignoring None values. None if there are fewer
+        than two values.
+
+        :return: value
+        """
+        return math_utils.aggregate('std', self._data)
 
 
 class Series(SeriesBase):
@@ -340,7 +507,8 @@ class Series(SeriesBase):
     index remains sort.
     """
 
-    def __init__(self, data=None, index=None, data_name='value', index_name='index', sort=None, dropin=None):
+    def __init__(self, data=None, index=None, data_name='value', index_name='index', sort=None, dropin=None,
+                 hash_index=False, level_index=False):
         """
         :param data: (optional) list of values.
         :param index: (optional) list of index values. If None then the index will be integers starting with zero
@@ -348,6 +516,10 @@ class Series(SeriesBase):
         :param index_name: (optional) name for the index. Default is "index"
         :param sort: if True then Series will keep the index sort. If True all index values must be of same type
         :param dropin: if supplied the drop-in replacement for list that will be used
+        :param hash_index: if True then maintain a dictionary of index value to location so that lookups by index value
+        are O(1) and not a linear scan of the index
+        :param level_index: if True then maintain a dictionary for each level of tuple index values so that
+        select_index() with a tuple compare does not scan the index. Requires the index values to be tuples
         """
         super(SeriesBase, self).__init__()
 
@@ -357,6 +529,11 @@ class Series(SeriesBase):
         self._data = None
         self._data_name = data_name
         self._dropin = dropin
+        self._index_map = dict() if hash_index else None
+        self._level_map = list() if level_index else None
+        self._bars = None
+        self._unordered = False
+        self._level_stale = False
 
         # setup data list
         if data is None:
@@ -408,11 +585,100 @@ class Series(SeriesBase):
     def index(self, index_list):
         self._validate_index(index_list)
         self._index = self._dropin(index_list) if self._dropin else list(index_list)
+        self._unordered = len(self._index) > 1
+        self._rebuild_index_map()
 
     @property
     def dropin(self):
         return self._dropin
 
+    @property
+    def hash_index(self):
+        """
+        If True then the Series maintains a dictionary of index value to location. This makes lookups by index value
+        O(1) for unsorted Series at the cost of additional memory. Because the map is kept in sync by the Series
+        methods, do not modify the list returned by the index property directly when this is True.
+
+        :return: boolean
+        """
+        return self._index_map is not None
+
+    @hash_index.setter
+    def hash_index(self, boolean):
+        self._index_map = dict() if boolean else None
+        self._rebuild_index_map()
+
+    def _rebuild_index_map(self):
+        """
+        Rebuild the index value to location map from the index, if the hash index is being maintained, and the level
+        maps if the level index is being maintained.
+
+        :return: nothing
+        """
+        if self._index_map is not None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        if self._level_map is not None:
+            self._rebuild_level_map()
+
+    @property
+    def level_index(self):
+        """
+        If True then the Series maintains a dictionary for each level of the tuple index values from the value of that
+        level to the set of locations of the rows with that value. A select_index() with a tuple compare is then the
+        intersection of the location sets for the levels that are not None, and not a scan of every index tuple. All
+        of the index values must be tuples. Because the maps are kept in sync by the Series methods, do not modify the
+        list returned by the index property directly when this is True.
+
+        :return: boolean
+        """
+        return self._level_map is not None
+
+    @level_index.setter
+    def level_index(self, boolean):
+        self._level_map = list() if boolean else None
+        self._rebuild_index_map()
+
+    def _rebuild_level_map(self):
+        """
+        Rebuild the level maps from the index.
+
+        :return: nothing
+        """
+        self._level_map = list()
+        self._level_stale = False
+        self._add_level_locations(self._index, 0)
+
+    @staticmethod
+    def _check_level_indexes(indexes):
+        """
+        Raise a TypeError if any of the index values are not tuples. Called before any change is made to the object so
+        a bad index value does not leave the index and the level maps out of sync.
+
+        :param indexes: list of index values
+        :return: nothing
+        """
+        if not all(isinstance(index, tuple) for index in indexes):
+            raise TypeError('level_index requires all index values to be tuples')
+
+    def _add_level_locations(self, indexes, start):
+        """
+        Add new rows to the level maps.
+
+        :param indexes: list of tuple index values of the new rows
+        :param start: location of the first new row
+        :return: nothing
+        """
+        if self._level_stale:  # the new rows are added when the level maps are rebuilt
+            return
+        level_map = self._level_map
+        for i, index in enumerate(indexes, start):
+            if not isinstance(index, tuple):
+                raise TypeError('level_index requires all index values to be tuples')
+            for level, value in enumerate(index):
+                if level == len(level_map):
+                    level_map.append(dict())
+                level_map[level].setdefault(value, set()).add(i)
+
     @property
     def sort(self):
         return self._sort
@@ -432,8 +698,10 @@ class Series(SeriesBase):
         sort = sorted_list_indexes(self._index)
         # sort index
         self._index = self._dropin([self._index[x] for x in sort]) if self._dropin else [self._index[x] for x in sort]
+        self._unordered = False
         # sort data
         self._data = self._dropin([self._data[x] for x in sort]) if self._dropin else [self._data[x] for x in sort]
+        self._rebuild_index_map()
 
     def set(self, indexes, values=None):
         """
@@ -457,6 +725,12 @@ class Series(SeriesBase):
         :param index: index of the new row
         :return: nothing
         """
+        if self._level_map is not None:
+            self._check_level_indexes([index])
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
+        if self._level_map is not None:
+            self._add_level_locations([index], len(self._index))
         self._index.append(index)
         self._data.append(None)
 
@@ -471,8 +745,37 @@ class Series(SeriesBase):
         if i == len(self._index):
             self._add_row(index)
         else:
+            if self._level_map is not None:
+                self._check_level_indexes([index])
             self._index.insert(i, index)
             self._data.insert(i, None)
+            if self._index_map is not None:  # all locations after the insert have shifted
+                for j in range(i, len(self._index)):
+                    self._index_map[self._index[j]] = j
+            if self._level_map is not None:  # all locations after the insert have shifted, rebuild on the next lookup
+                self._level_stale = True
+
+    def _duplicate_indexes(self, indexes):
+        """
+        Returns True if any of the indexes are already in the index or are repeated in the indexes list. If the hash
+        index is maintained, or the Series is sorted and in order and the new indexes are all after the last index
+        value, then the check is O(len(indexes)) and does not depend on the size of the Series. Otherwise the entire
+        index is checked, as after appending out of order the last index value is not always the largest.
+
+        :param indexes: list of new index values
+        :return: boolean
+        """
+        if len(set(indexes)) != len(indexes):
+            return True
+        if not indexes or not self._index:
+            return False
+        if self._index_map is not None:
+            return any(x in self._index_map for x in indexes)
+        if self._sort and not self._unordered and min(indexes) > self._index[-1]:
+            return False
+        if len(indexes) == 1:
+            return indexes[0] in self._index
+        return not set(self._index).isdisjoint(indexes)
 
     def _add_missing_rows(self, indexes):
         """
@@ -482,21 +785,30 @@ class Series(SeriesBase):
         :param indexes: list of indexes
         :return: nothing
         """
-        new_indexes = [x for x in indexes if x not in self._index]
+        new_indexes = [x for x in indexes if not self._index_exists(x)]
         for x in new_indexes:
             self._add_row(x)
 
     def _insert_missing_rows(self, indexes):
         """
         Given a list of indexes, find all the indexes that are not currently in the Series and make a new row for
-        that index, inserting into the index. This requires the Series to be sorted=True
+        that index, inserting into the index. All of the new rows are merged in with a single pass over the index and
+        data. This requires the Series to be sorted=True
 
         :param indexes: list of indexes
         :return: nothing
         """
-        new_indexes = [x for x in indexes if x not in self._index]
-        for x in new_indexes:
-            self._insert_row(bisect_left(self._index, x), x)
+        new_indexes = sorted(set([x for x in indexes if not self._index_exists(x)]))
+        if len(new_indexes) == 1:
+            self._insert_row(bisect_left(self._index, new_indexes[0]), new_indexes[0])
+        elif new_indexes:
+            if self._level_map is not None:
+                self._check_level_indexes(new_indexes)
+            # merge all of the new rows into the index and data in one pass
+            locations = sorted_insert_locations(self._index, new_indexes)
+            self._index[:] = splice_values(self._index, locations, new_indexes)
+            self._data[:] = splice_values(self._data, locations, [None] * len(new_indexes))
+            self._rebuild_index_map()
 
     def set_cell(self, index, value):
         """
@@ -512,7 +824,7 @@ class Series(SeriesBase):
                 self._insert_row(i, index)
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
             except ValueError:
                 i = len(self._index)
                 self._add_row(index)
@@ -529,14 +841,14 @@ class Series(SeriesBase):
         list is values, or the length of the True values in the index list if the index list is booleans
         :return: nothing
         """
-        if all([isinstance(i, bool) for i in index]):  # boolean list
+        if is_bool_list(index):  # boolean list
             if not self._check_list(values):  # single value provided, not a list, so turn values into list
                 values = [values for x in index if x]
             if len(index) != len(self._index):
                 raise ValueError('boolean index list must be same size of existing index')
             if len(values) != index.count(True):
                 raise ValueError('length of values list must equal number of True entries in index list')
-            indexes = [i for i, x in enumerate(index) if x]
+            indexes = index.locations() if isinstance(index, Mask) else [i for i, x in enumerate(index) if x]
             for x, i in enumerate(indexes):
                 self._data[i] = values[x]
         else:  # list of index
@@ -551,13 +863,13 @@ class Series(SeriesBase):
                 indexes = exists_tuples[1]
                 if not all(exists):
                     self._insert_missing_rows(index)
-                    indexes = [sorted_index(self._index, x) for x in index]
+                    indexes = [self._index_location(x) for x in index]
             else:
                 try:  # all index in current index
-                    indexes = [self._index.index(x) for x in index]
+                    indexes = [self._index_location(x) for x in index]
                 except ValueError:  # new rows need to be added
                     self._add_missing_rows(index)
-                    indexes = [self._index.index(x) for x in index]
+                    indexes = [self._index_location(x) for x in index]
             for x, i in enumerate(indexes):
                 self._data[i] = values[x]
 
@@ -573,15 +885,27 @@ class Series(SeriesBase):
 
     def set_locations(self, locations, values):
         """
-        For a list of locations set the values.
+        For a list of locations or a slice of locations set the values. The values are set in the list directly by
+        location with no lookup of the index values.
 
-        :param locations: list of index locations
+        :param locations: list of index locations or a slice of locations
         :param values: list of values or a single value
         :return: nothing
         """
-
-        indexes = [self._index[x] for x in locations]
-        self.set(indexes, values)
+        if isinstance(locations, slice):
+            locations = range(*locations.indices(len(self._index)))
+        elif locations and not -len(self._index) <= min(locations) <= max(locations) < len(self._index):
+            raise IndexError('location out of range')
+        if not self._check_list(values):
+            values = [values] * len(locations)
+        if len(values) != len(locations):
+            raise ValueError('length of values and locations must be the same.')
+        if isinstance(locations, range) and locations.step == 1 and locations.start >= 0 and \
+                isinstance(self._data, list):
+            self._data[locations.start:locations.stop] = values
+        else:
+            for i, value in zip(locations, values):
+                self._data[i] = value
 
     def __setitem__(self, index, value):
         """
@@ -619,6 +943,19 @@ class Series(SeriesBase):
         else:  # just a single cell or list of cells
             return self.get(index)
 
+    def bars(self, width, origin=None, output=None):
+        """
+        Attach a BarBuilder to a sorted Series that builds open, high, low and close bars of fixed width on the index
+        as rows are appended with append_row() or append_rows(). See DataFrame.bars()
+
+        :param width: width of the bars, a number for a numeric index or a timedelta for a datetime or date index
+        :param origin: index value that is the start of a bar. If None then zero for a numeric index and 1970-01-01
+            for a datetime or date index
+        :param output: (optional) DataFrame to append the finished bars to. If None then a new sorted DataFrame
+        :return: BarBuilder
+        """
+        return BarBuilder(self, width, origin=origin, output=output)
+
     def append_row(self, index, value):
         """
         Appends a row of value to the end of the data. Be very careful with this function as for sorted Series it will
@@ -628,11 +965,25 @@ class Series(SeriesBase):
         :param value: value
         :return: nothing
         """
-        if index in self._index:
+        if self._duplicate_indexes([index]):
             raise IndexError('index already in Series')
-
+        if self._bars:
+            for bars in self._bars:
+                bars._check_row(index, value)
+        if self._level_map is not None:
+            self._check_level_indexes([index])
+        if self._sort and self._index and not index > self._index[-1]:
+            self._unordered = True
+
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
+        if self._level_map is not None:
+            self._add_level_locations([index], len(self._index))
         self._index.append(index)
         self._data.append(value)
+        if self._bars:
+            for bars in self._bars:
+                bars._append_row(index, value)
 
     def append_rows(self, indexes, values):
         """
@@ -649,13 +1000,26 @@ class Series(SeriesBase):
             raise ValueError('length of values is not equal to length of indexes')
 
         # check the indexes are not duplicates
-        combined_index = self._index + indexes
-        if len(set(combined_index)) != len(combined_index):
+        if self._duplicate_indexes(indexes):
             raise IndexError('duplicate indexes in Series')
+        if self._bars:
+            for bars in self._bars:
+                bars._check_rows(indexes, values)
+        if self._level_map is not None:
+            self._check_level_indexes(indexes)
+        if self._sort and not is_increasing(list(self._index[-1:]) + list(indexes)):
+            self._unordered = True
 
         # append index value
+        if self._index_map is not None:
+            self._index_map.update(zip(indexes, range(len(self._index), len(self._index) + len(indexes))))
+        if self._level_map is not None:
+            self._add_level_locations(indexes, len(self._index))
         self._index.extend(indexes)
         self._data.extend(values)
+        if self._bars:
+            for bars in self._bars:
+                bars._append_rows(indexes, values)
 
     def delete(self, indexes):
         """
@@ -665,26 +1029,44 @@ class Series(SeriesBase):
         :return: nothing
         """
         indexes = [indexes] if not self._check_list(indexes) else indexes
-        if all([isinstance(i, bool) for i in indexes]):  # boolean list
+        if is_bool_list(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError('boolean indexes list must be same size of existing indexes')
-            indexes = [i for i, x in enumerate(indexes) if x]
+            indexes = indexes.locations() if isinstance(indexes, Mask) else [i for i, x in enumerate(indexes) if x]
         else:
-            indexes = [sorted_index(self._index, x) for x in indexes] if self._sort \
-                else [self._index.index(x) for x in indexes]
-        indexes = sorted(indexes, reverse=True)  # need to sort and reverse list so deleting works
-        for i in indexes:
+            indexes = [self._index_location(x) for x in indexes]
+        self._delete_locations(indexes)
+
+    def _delete_locations(self, locations):
+        """
+        Delete the rows at the locations. Deleting a single row is done directly, otherwise the index and data are
+        compacted in a single pass rather than shifting the lists once for every deleted row. The lists are updated in
+        place so any other reference to them, like a ViewSeries, remains valid.
+
+        :param locations: list of locations to delete
+        :return: nothing
+        """
+        locations = set(locations)
+        if len(locations) == 1:
+            i = locations.pop()
             del self._data[i]
-        # now remove from index
-        for i in indexes:
             del self._index[i]
+        elif locations:
+            keep = [True] * len(self._index)
+            for i in locations:
+                keep[i] = False
+            self._data[:] = list(compress(self._data, keep))
+            self._index[:] = list(compress(self._index, keep))
+        self._rebuild_index_map()
 
     def reset_index(self):
         """
-        Resets the index of the Series to simple integer list and the index name to 'index'.
+        Resets the index of the Series to simple integer list and the index name to 'index'. The level index is turned
+        off as the new index values are not tuples.
 
         :return: nothing
         """
+        self._level_map = None
         self.index = list(range(self.__len__()))
         self.index_name = 'index'
 
@@ -718,6 +1100,11 @@ class ViewSeries(SeriesBase):
             raise ValueError('Data cannot be None.')
 
         # standard variable setup
+        self._index_map = None  # the index is a view that can be modified elsewhere, so no hash or level index
+        self._level_map = None
+        self._bars = None
+        self._unordered = False
+        self._level_stale = False
         self._data = data  # direct view, no copy
         self._data_name = data_name
         self.index = index  # direct view, no copy
@@ -783,7 +1170,7 @@ class ViewSeries(SeriesBase):
                 return self.get(indexes, as_list=True)
 
         # list of booleans
-        elif all([isinstance(x, bool) for x in indexes]):
+        elif is_bool_list(indexes):
             return self.get(indexes, as_list=True)
 
         # list of values
@@ -3,6 +3,10 @@ Utility functions for sorting and dealing with sorted Series and DataFrames
 """
 
 from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+from operator import lt
+
+from raccoon.containers import ChunkedList
 
 
 def sorted_exists(values, x):
@@ -34,6 +38,52 @@ def sorted_index(values, x):
     return values[i:j].index(x) + i
 
 
+def is_increasing(values):
+    """
+    Returns True if each value in the list is greater than the value before it, so the list is sorted with no
+    duplicates
+
+    :param values: list
+    :return: boolean
+    """
+    return all(map(lt, values, islice(values, 1, None)))
+
+
+def sorted_asof(values, x):
+    """
+    For sorted list, values, returns the location of the last item that is less than or equal to x, the "as of"
+    location. If all of the items are greater than x then returns -1.
+
+    :param values: sorted list
+    :param x: item
+    :return: integer location
+    """
+    return bisect_right(values, x) - 1
+
+
+def sorted_asof_locations(values, new_values):
+    """
+    For sorted list, values, returns the as of location for each item in new_values as sorted_asof() does. The
+    new_values are walked in sorted order with one forward pass over values, so each search starts from the location of
+    the previous one. If new_values is not sorted then it is sorted first and the locations returned in the original
+    order.
+
+    :param values: sorted list
+    :param new_values: list of items
+    :return: list of integer locations, -1 for any item before the first item in values
+    """
+    if all(a <= b for a, b in zip(new_values, new_values[1:])):
+        order = range(len(new_values))
+    else:
+        order = sorted_list_indexes(new_values)
+    locations = [-1] * len(new_values)
+    lo = 0
+    for i in order:
+        lo = bisect_right(values, new_values[i], lo)
+        locations[i] = lo - 1
+    return locations
+
+
 def sorted_list_indexes(list_to_sort, key=None, reverse=False):
     """
     Sorts a list but returns the order of the index values of the list for the sort and not the values themselves.
@@ -51,3 +101,208 @@ def sorted_list_indexes(list_to_sort, key=None, reverse=False):
     else:
         key_func = list_to_sort.__getitem__
     return sorted(range(len(list_to_sort)), key=key_func, reverse=reverse)
+
+
+def sorted_insert_locations(values, new_values):
+    """
+    For sorted list, values, and sorted list, new_values, returns the location in values that each of the new_values
+    would be inserted at to keep the list sorted. The locations are found in one forward pass over values, so the
+    result is a non-decreasing list of locations in values before any insert.
+
+    :param values: sorted list
+    :param new_values: sorted list of items to insert
+    :return: list of locations
+    """
+    locations = list()
+    lo = 0
+    for x in new_values:
+        lo = bisect_left(values, x, lo)
+        locations.append(lo)
+    return locations
+
+
+def splice_values(values, locations, new_values):
+    """
+    Returns a new list of values with each item of new_values inserted before the matching location in values. This
+    does all of the inserts in one pass over values rather than shifting the values for each insert.
+
+    :param values: list
+    :param locations: non-decreasing list of locations in values, as returned by sorted_insert_locations()
+    :param new_values: list of items to insert, same length as locations
+    :return: list
+    """
+    result = list()
+    previous = 0
+    for location, x in zip(locations, new_values):
+        result.extend(values[previous:location])
+        result.append(x)
+        previous = location
+    result.extend(values[previous:])
+    return result
+
+
+def sorted_merge_locations(left, right, how='inner'):
+    """
+    For two sorted lists of unique items, left and right, returns the merged items and the location of each merged item
+    in the left and right lists. The lists are walked once with two pointers. An inner merge has the items in both
+    lists, a left merge has all of the items in left and an outer merge has all of the items in either list.
+
+    :param left: sorted list of unique items
+    :param right: sorted list of unique items
+    :param how: one of inner, left or outer
+    :return: (items, left_locations, right_locations) tuple of lists. The location is None if the item is not in that
+        list
+    """
+    items = list()
+    left_locations = list()
+    right_locations = list()
+    i = j = 0
+    left_len = len(left)
+    right_len = len(right)
+    while i < left_len and j < right_len:
+        x = left[i]
+        y = right[j]
+        if x == y:
+            items.append(x)
+            left_locations.append(i)
+            right_locations.append(j)
+            i += 1
+            j += 1
+        elif x < y:
+            if how != 'inner':
+                items.append(x)
+                left_locations.append(i)
+                right_locations.append(None)
+            i += 1
+        else:
+            if how == 'outer':
+                items.append(y)
+                left_locations.append(None)
+                right_locations.append(j)
+            j += 1
+    if how != 'inner' and i < left_len:
+        items.extend(left[i:])
+        left_locations.extend(range(i, left_len))
+        right_locations.extend([None] * (left_len - i))
+    if how == 'outer' and j < right_len:
+        items.extend(right[j:])
+        left_locations.extend([None] * (right_len - j))
+        right_locations.extend(range(j, right_len))
+    return items, left_locations, right_locations
+
+
+class ColumnIndex(object):
+    """
+    Secondary index on the values of a column, kept as two ChunkedLists sorted by value: the values and the index value
+    of the row of each value. The row is identified by its index value and not its location so inserting and deleting
+    other rows does not change the entries. Finding the rows for a value, a range of values or the largest or smallest
+    values is a binary search, O(log n + k) for k rows, and adding or removing a value is O(sqrt n). None values are not
+    in the index, all other values must be comparable with each other.
+    """
+    __slots__ = ['_values', '_keys']
+
+    def __init__(self, values, keys):
+        """
+        :param values: list of values of the column
+        :param keys: list of the index values of the rows, same length as the values
+        """
+        order = sorted([i for i, x in enumerate(values) if x is not None], key=values.__getitem__)
+        self._values = ChunkedList([values[i] for i in order])
+        self._keys = ChunkedList([keys[i] for i in order])
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def values(self):
+        return list(self._values)
+
+    @property
+    def keys(self):
+        return list(self._keys)
+
+    def add(self, value, key):
+        """
+        Add a value after any equal values
+
+        :param value: value, None is ignored
+        :param key: index value of the row
+        :return: nothing
+        """
+        if value is None:
+            return
+        i = bisect_right(self._values, value)
+        self._values.insert(i, value)
+        self._keys.insert(i, key)
+
+    def remove(self, value, key):
+        """
+        Remove a value that was previously added
+
+        :param value: value, None is ignored
+        :param key: index value of the row
+        :return: nothing
+        """
+        if value is None:
+            return
+        i = self._keys.index(key, bisect_left(self._values, value), bisect_right(self._values, value))
+        del self._values[i]
+        del self._keys[i]
+
+    def replace(self, old, new, key):
+        """
+        Replace the value of a row. The new value is added first so if it cannot be compared the index is unchanged.
+
+        :param old: current value
+        :param new: new value
+        :param key: index value of the row
+        :return: nothing
+        """
+        self.add(new, key)
+        self.remove(old, key)
+
+    def remove_keys(self, keys):
+        """
+        Remove the rows in one pass over the index
+
+        :param keys: set of index values of the rows to remove
+        :return: nothing
+        """
+        keep = [x not in keys for x in self._keys]
+        self._values = ChunkedList(compress(self._values, keep))
+        self._keys = ChunkedList(compress(self._keys, keep))
+
+    def equal(self, value):
+        """
+        Return the index values of the rows equal to the value
+
+        :param value: value
+        :return: list of index values
+        """
+        return list(self._keys[bisect_left(self._values, value):bisect_right(self._values, value)])
+
+    def between(self, start=None, stop=None):
+        """
+        Return the index values of the rows with values greater than or equal to the start and less than or equal to
+        the stop, in order of the values
+
+        :param start: lowest value to include, or None for no lower limit
+        :param stop: highest value to include, or None for no upper limit
+        :return: list of index values
+        """
+        lo = bisect_left(self._values, start) if start is not None else 0
+        hi = bisect_right(self._values, stop) if stop is not None else len(self._values)
+        return list(self._keys[lo:hi])
+
+    def top(self, n, largest=True):
+        """
+        Return the index values of the rows with the n largest values, largest first, or the n smallest values,
+        smallest first
+
+        :param n: number of rows
+        :param largest: if True the largest values, otherwise the smallest
+        :return: list of index values
+        """
+        if n <= 0:
+            return []
+        return list(reversed(self._keys[max(len(self._keys) - n, 0):])) if largest else list(self._keys[:n])
@@ -0,0 +1,211 @@
+"""
+Rolling window calculations over a list of values, as returned by the rolling() methods of the DataFrame and Series
+"""
+
+from collections import deque
+
+from raccoon.math_utils import RunningStats
+
+
+class RollingWindow(object):
+    """
+    Rolling window calculations over a list of values. For each row the window is either the last window rows, or for
+    a window on the index all of the rows with an index value greater than the index value of the row minus the window
+    and less than or equal to the index value of the row. The window moves forward one row at a time so each step of
+    the sum, mean and std is O(1) with running totals, and of the min and max is O(1) amortized with a monotonic deque.
+
+    None values are ignored. The result for a row is None if the window has fewer than min_periods values that are not
+    None.
+    """
+    __slots__ = ['_values', '_index', '_window', '_by_index', '_min_periods']
+
+    def __init__(self, values, index, window, by_index=None, min_periods=None):
+        """
+        :param values: list of values
+        :param index: list of index values, must be sorted if by_index is True
+        :param window: number of rows in the window, or the width of the window in index units if by_index is True. Must
+            be greater than zero
+        :param by_index: if True the window is a width in index units, for example a timedelta for a datetime index. If
+            None then True if the window is not an int
+        :param min_periods: minimum number of values in the window to have a result. If None then the window for a
+            number of rows, and 1 for a window on the index
+        """
+        self._by_index = not isinstance(window, int) if by_index is None else by_index
+        if not self._by_index and (not isinstance(window, int) or window < 1):
+            raise ValueError('window must be a positive integer')
+        # compare to the zero of the type of the window so a timedelta window is compared to timedelta(0)
+        if self._by_index and not window > window - window:
+            raise ValueError('window must be a positive width')
+        self._values = values
+        self._index = index
+        self._window = window
+        self._min_periods = min_periods if min_periods is not None else (1 if self._by_index else window)
+
+    @property
+    def by_index(self):
+        return self._by_index
+
+    def _starts(self):
+        """
+        Return the start location of the window for each row, the window is the locations from the start to the row
+        inclusive. The start locations never decrease, for a window on the index they are found with a second pointer
+        that follows the row.
+
+        :return: list of locations
+        """
+        if self._by_index:
+            starts = list()
+            start = 0
+            index = self._index
+            window = self._window
+            for x in index:
+                cutoff = x - window
+                while index[start] <= cutoff:
+                    start += 1
+                starts.append(start)
+            return starts
+        rows = len(self._values)
+        return [0] * min(self._window, rows) + list(range(1, rows - self._window + 1))
+
+    def _sums(self, mean):
+        """
+        Walk the windows keeping a running total and count of the values in the window.
+
+        :param mean: if True return the mean, otherwise the sum
+        :return: list
+        """
+        values = self._values
+        min_periods = self._min_periods
+        result = list()
+        total = 0
+        count = 0
+        previous = 0
+        for i, start in enumerate(self._starts()):
+            value = values[i]
+            if value is not None:
+                total += value
+                count += 1
+            while previous < start:
+                value = values[previous]
+                if value is not None:
+                    total -= value
+                    count -= 1
+                previous += 1
+            if not count:
+                total = 0  # remove any floating point remainder
+            if count < min_periods:
+                result.append(None)
+            elif mean:
+                result.append(total / count if count else None)
+            else:
+                result.append(total)
+        return result
+
+    def _extreme(self, minimum):
+        """
+        Walk the windows keeping a deque of the locations of the values that could be the min or max of a window.
+
+        :param minimum: if True the min, otherwise the max
+        :return: list
+        """
+        values = self._values
+        min_periods = self._min_periods
+        candidates = deque()
+        result = list()
+        count = 0
+        previous = 0
+        for i, start in enumerate(self._starts()):
+            value = values[i]
+            if value is not None:
+                count += 1
+                if minimum:
+                    while candidates and values[candidates[-1]] >= value:
+                        candidates.pop()
+                else:
+                    while candidates and values[candidates[-1]] <= value:
+                        candidates.pop()
+                candidates.append(i)
+            while previous < start:
+                if values[previous] is not None:
+                    count -= 1
+                previous += 1
+            while candidates and candidates[0] < start:
+                candidates.popleft()
+            result.append(values[candidates[0]] if count >= min_periods and candidates else None)
+        return result
+
+    def count(self):
+        """
+        Return the number of values that are not None in each window
+
+        :return: list
+        """
+        values = self._values
+        result = list()
+        count = 0
+        previous = 0
+        for i, start in enumerate(self._starts()):
+            if values[i] is not None:
+                count += 1
+            while previous < start:
+                if values[previous] is not None:
+                    count -= 1
+                previous += 1
+            result.append(count)
+        return result
+
+    def sum(self):
+        """
+        Return the sum of each window
+
+        :return: list
+        """
+        return self._sums(False)
+
+    def mean(self):
+        """
+        Return the mean of each window
+
+        :return: list
+        """
+        return self._sums(True)
+
+    def std(self):
+        """
+        Return the sample standard deviation of each window, None if the window has fewer than two values. The running
+        totals are recalculated from the values of the window when the values that have left the window could leave a
+        rounding error that is a large part of the result, which is at most once for each window of rows.
+
+        :return: list
+        """
+        values = self._values
+        min_periods = self._min_periods
+        stats = RunningStats()
+        result = list()
+        previous = 0
+        for i, start in enumerate(self._starts()):
+            stats.add(values[i])
+            while previous < start:
+                stats.remove(values[previous])
+                previous += 1
+            if stats.inexact():
+                stats.recalculate(values[start:i + 1])
+            count = stats.get('count', None)
+            result.append(stats.get('std', None) if count >= min_periods else None)
+        return result
+
+    def min(self):
+        """
+        Return the minimum value of each window
+
+        :return: list
+        """
+        return self._extreme(True)
+
+    def max(self):
+        """
+        Return the maximum value of each window
+
+        :return: list
+        """
+        return self._extreme(False)
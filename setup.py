@@ -75,5 +75,6 @@ setup(
     packages=find_packages(exclude=['docs', 'examples', 'tests']),
     python_requires=REQUIRED_PYTHON,
     install_requires=REQUIRED_PACKAGES,
+    extras_require={'numpy': ['numpy']},
     tests_require=['pytest', 'blist'],
 )
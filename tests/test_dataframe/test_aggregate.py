@@ -0,0 +1,214 @@
+import random
+from statistics import stdev
+
+import pytest
+
+import raccoon as rc
+from raccoon.containers import ChunkedList
+from raccoon.math_utils import RunningStats, aggregate
+
+
+def check_stats(df, column):
+    # the running stats match a full pass
+    values = [x for x in df.get_entire_column(column, as_list=True) if x is not None]
+    assert df.count(column) == len(values)
+    assert df.sum(column) == pytest.approx(sum(values))
+    if values:
+        assert df.mean(column) == pytest.approx(sum(values) / len(values))
+        assert df.min(column) == min(values)
+        assert df.max(column) == max(values)
+    else:
+        assert df.mean(column) is None
+        assert df.min(column) is None
+    if len(values) > 1:
+        assert df.std(column) == pytest.approx(stdev(values))
+    else:
+        assert df.std(column) is None
+
+
+def test_aggregate():
+    assert aggregate('sum', [1, 2, None, 3]) == 6
+    assert aggregate('count', [1, 2, None, 3]) == 3
+    assert aggregate('mean', [1, 2, None, 3]) == 2
+    assert aggregate('min', [3, None, 1, 2]) == 1
+    assert aggregate('max', [3, None, 1, 2]) == 3
+    assert aggregate('std', [2, 4, 4, 4, 5, 5, 7, 9]) == pytest.approx(stdev([2, 4, 4, 4, 5, 5, 7, 9]))
+
+    assert aggregate('sum', []) == 0
+    assert aggregate('count', [None]) == 0
+    for name in ['mean', 'min', 'max', 'std']:
+        assert aggregate(name, [None]) is None
+    assert aggregate('std', [1]) is None
+
+    assert aggregate('min', ['b', 'a']) == 'a'
+    with pytest.raises(TypeError):
+        aggregate('sum', ['a', 'b'])
+    with pytest.raises(ValueError):
+        aggregate('median', [1])
+
+
+def test_running_stats():
+    random.seed(0)
+    values = list()
+    stats = RunningStats()
+    for _ in range(1000):
+        if values and random.random() < 0.4:
+            value = values.pop(random.randrange(len(values)))
+            stats.remove(value)
+        else:
+            value = random.randint(-50, 50)
+            values.append(value)
+            stats.add(value)
+        assert stats.get('count', values) == len(values)
+        assert stats.get('sum', values) == sum(values)
+        if values:
+            assert stats.get('min', values) == min(values)
+            assert stats.get('max', values) == max(values)
+            assert stats.get('mean', values) == pytest.approx(sum(values) / len(values))
+        if len(values) > 1:
+            assert stats.get('std', values) == pytest.approx(stdev(values))
+
+    # the std is recalculated from the values after large values are removed
+    values = [1e9, -1e9, 5.0, 5.0, 5.0]
+    stats = RunningStats(values)
+    stats.remove(1e9)
+    stats.remove(-1e9)
+    assert stats.inexact() is True
+    assert stats.get('std', values[2:]) == 0.0
+    assert stats.inexact() is False
+    assert stats.get('mean', values[2:]) == 5.0
+
+    stats = RunningStats([1, None, 3])
+    stats.replace(3, 5)
+    stats.replace(None, 2)
+    assert stats.get('sum', [1, 5, 2]) == 8
+    assert stats.get('max', [1, 5, 2]) == 5
+
+    with pytest.raises(TypeError):
+        stats.add('a')
+    assert stats.get('count', [1, 5, 2]) == 3
+
+
+@pytest.mark.parametrize('running_stats', [False, True])
+def test_dataframe(running_stats):
+    df = rc.DataFrame({'a': [1, 2, 3, None], 'b': [1.5, 2.5, 0.5, 1.0], 'c': ['x', 'y', 'z', None]},
+                      columns=['a', 'b', 'c'], running_stats=running_stats)
+    assert df.running_stats is running_stats
+
+    assert df.count('a') == 3
+    assert df.sum('a') == 6
+    assert df.mean('a') == 2
+    assert df.min('a') == 1
+    assert df.max('a') == 3
+    assert df.std('a') == 1.0
+    assert df.sum('b') == 5.5
+    assert df.min('c') == 'x'
+    assert df.count('c') == 3
+    with pytest.raises(TypeError):
+        df.sum('c')
+    with pytest.raises(ValueError):
+        df.sum('bad')
+
+    for column in ['a', 'b']:
+        check_stats(df, column)
+
+
+def test_running_updates():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4.0, 5.0, 6.0]}, columns=['a', 'b'], index=[10, 11, 12],
+                      running_stats=True)
+    assert df.sum('a') == 6
+    assert df.sum('b') == 15
+    assert set(df._stats) == {'a', 'b'}
+
+    # updates keep the stats and do not iterate the column
+    df.set_cell(11, 'a', 20)
+    df.set_cell(13, 'a', 5)
+    df.set_cell(14, 'b', None)
+    df.append_row(15, {'a': -1, 'b': 7.0})
+    df.append_rows([16, 17], {'a': [8, None]})
+    assert set(df._stats) == {'a', 'b'}
+    for column in ['a', 'b']:
+        check_stats(df, column)
+
+    df.delete_rows([11])
+    df.delete_rows([True, False, False, True, False, True, False])
+    assert set(df._stats) == {'a', 'b'}
+    for column in ['a', 'b']:
+        check_stats(df, column)
+
+    # a non number stops the running stats of that column
+    df.set_cell(12, 'a', 'x')
+    assert set(df._stats) == {'b'}
+    assert df.min('b') == 6.0
+
+    # other methods reset the stats of the column
+    df.set_cell(12, 'a', 3)
+    check_stats(df, 'a')
+    df.set_column(column='a', values=[100] * len(df))
+    assert 'a' not in df._stats
+    check_stats(df, 'a')
+    df.set_row(12, {'b': 50.0})
+    check_stats(df, 'b')
+    df.set_location(0, {'b': -50.0})
+    check_stats(df, 'b')
+    df.eval('a * 2', 'b')
+    check_stats(df, 'b')
+    df.rename_columns({'a': 'b', 'b': 'a'})
+    check_stats(df, 'a')
+    check_stats(df, 'b')
+    df.sort_columns('a')
+    check_stats(df, 'a')
+    df.delete_columns('a')
+    assert 'a' not in df._stats
+    df.delete_all_rows()
+    check_stats(df, 'b')
+    df.append_row(1, {'b': 5})
+    check_stats(df, 'b')
+
+
+def test_running_random():
+    random.seed(1)
+    df = rc.DataFrame(columns=['a'], running_stats=True, sort=True)
+    assert df.count('a') == 0
+    for i in range(500):
+        operation = random.random()
+        if operation < 0.4:
+            df.set_cell(random.randint(0, 200), 'a', random.choice([None, random.random(), random.randint(0, 9)]))
+        elif operation < 0.6:
+            df.append_row(1000 + i, {'a': random.random()})
+        elif len(df):
+            df.delete_rows(random.choice(df.index))
+        check_stats(df, 'a')
+
+
+def test_dtypes_dropin():
+    df = rc.DataFrame({'a': [1.0, None, 3.0]}, dtypes={'a': 'd'}, running_stats=True)
+    check_stats(df, 'a')
+    df.append_row(3, {'a': 4.0})
+    df.set_dtypes({'a': 'f'})
+    check_stats(df, 'a')
+
+    df = rc.DataFrame({'a': [1, 2, 3]}, dropin=ChunkedList, running_stats=True)
+    check_stats(df, 'a')
+    df.delete_rows(ChunkedList([0, 1]))
+    check_stats(df, 'a')
+
+    df = rc.DataFrame({'a': [1, 2, 3]}, running_stats=True)
+    df.running_stats = False
+    assert df.running_stats is False
+    assert df.sum('a') == 6
+    df.running_stats = True
+    assert df.sum('a') == 6
+
+    actual = rc.DataFrame.from_json(df.to_json())
+    assert actual.running_stats is True
+
+
+def test_rolling():
+    df = rc.RollingDataFrame({'a': [1, 2, 3]}, capacity=2)
+    assert df.running_stats is False
+    assert df.sum('a') == 5
+    df.append_row(5, {'a': 4})
+    assert df.sum('a') == 7
+    with pytest.raises(ValueError):
+        df.running_stats = True
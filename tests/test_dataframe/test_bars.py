@@ -0,0 +1,117 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def test_bars():
+    index = [datetime(2020, 1, 1, 9, 30, 1), datetime(2020, 1, 1, 9, 30, 20)]
+    df = rc.DataFrame({'price': [10, 11], 'size': [1, 2]}, columns=['price', 'size'], index=index, index_name='time',
+                      sort=True)
+
+    bars = df.bars(timedelta(minutes=1), 'price', volume='size')
+    assert bars.output.index == []
+    assert bars.output.columns == ['open', 'high', 'low', 'close', 'count', 'volume']
+    assert bars.current == {'start': datetime(2020, 1, 1, 9, 30), 'open': 10, 'high': 11, 'low': 10, 'close': 11,
+                            'count': 2, 'volume': 3}
+
+    df.append_row(datetime(2020, 1, 1, 9, 30, 40), {'price': 8, 'size': 3})
+    df.append_row(datetime(2020, 1, 1, 9, 30, 50), {'price': None, 'size': 4})
+    assert bars.output.index == []
+    assert bars.current['low'] == 8
+    assert bars.current['count'] == 3
+
+    df.append_rows([datetime(2020, 1, 1, 9, 31, 1), datetime(2020, 1, 1, 9, 33)], {'price': [12, 13]})
+    expected = rc.DataFrame({'open': [10, 12], 'high': [11, 12], 'low': [8, 12], 'close': [8, 12], 'count': [3, 1],
+                             'volume': [6, 0]}, columns=['open', 'high', 'low', 'close', 'count', 'volume'],
+                            index=[datetime(2020, 1, 1, 9, 30), datetime(2020, 1, 1, 9, 31)], index_name='time',
+                            sort=True)
+    assert_frame_equal(bars.output, expected)
+    assert bars.current['start'] == datetime(2020, 1, 1, 9, 33)
+
+    # close finishes the open bar and detaches from the DataFrame
+    output = bars.close()
+    assert output.index[-1] == datetime(2020, 1, 1, 9, 33)
+    assert bars.current is None
+    df.append_row(datetime(2020, 1, 1, 9, 35), {'price': 14})
+    assert len(output) == 3
+
+
+def test_matches_resample():
+    random.seed(0)
+    index = [i * 0.3 for i in range(1000)]
+    prices = [random.random() for _ in range(1000)]
+    df = rc.DataFrame({'price': prices[:100], 'size': [1] * 100}, columns=['price', 'size'], index=index[:100],
+                      sort=True)
+    bars = df.bars(7, 'price', volume='size', origin=2)
+    for i in range(100, 1000):
+        df.append_row(index[i], {'price': prices[i], 'size': 1})
+    bars.close()
+
+    expected = df.resample(7, origin=2).agg({'price': ['first', 'max', 'min', 'last', 'count'], 'size': 'sum'})
+    assert bars.output.index == expected.index
+    for column, aggregation in zip(['open', 'high', 'low', 'close', 'count'], ['first', 'max', 'min', 'last', 'count']):
+        actual = bars.output.get_entire_column(column, as_list=True)
+        assert actual == expected.get_entire_column(('price', aggregation), as_list=True)
+    assert bars.output.get_entire_column('volume', as_list=True) == expected.get_entire_column('size', as_list=True)
+
+
+def test_rolling_source():
+    df = rc.RollingDataFrame(columns=['a'], index=[], sort=True, capacity=3)
+    output = rc.DataFrame(columns=['open', 'high', 'low', 'close', 'count'], sort=True)
+    bars = df.bars(10, 'a', output=output)
+    assert bars.output is output
+    for i in range(25):
+        df.append_row(i, {'a': i})
+    assert len(df) == 3
+    assert output.to_dict(index=False) == {'open': [0, 10], 'high': [9, 19], 'low': [0, 10], 'close': [9, 19],
+                                           'count': [10, 10]}
+
+
+def test_multiple():
+    df = rc.DataFrame(columns=['a', 'b'], sort=True)
+    bars_a = df.bars(2, 'a')
+    bars_b = df.bars(3, 'b')
+    df.append_rows([0, 1, 2, 3], {'a': [1, 2, 3, 4], 'b': [4, 3, 2, 1]})
+    assert bars_a.output.get_entire_column('close', as_list=True) == [2]
+    assert bars_b.output.get_entire_column('close', as_list=True) == [2]
+    bars_a.close()
+    df.append_row(6, {'a': 5, 'b': 0})
+    assert bars_a.output.get_entire_column('close', as_list=True) == [2, 4]
+    assert bars_b.output.get_entire_column('close', as_list=True) == [2, 1]
+
+
+def test_exceptions():
+    df = rc.DataFrame({'a': [1, 2]}, index=[2, 1], sort=False)
+    with pytest.raises(ValueError):
+        df.bars(1, 'a')
+
+    df = rc.DataFrame({'a': [1, 2]}, index=[1, 2], sort=True)
+    with pytest.raises(ValueError):
+        df.bars(1, 'b')
+    with pytest.raises(ValueError):
+        df.bars(1, 'a', volume='b')
+
+    bars = df.bars(1, 'a')
+    with pytest.raises(ValueError):
+        df.append_row(0, {'a': 3})
+
+    # a rejected row leaves the DataFrame and the bars unchanged
+    df.append_row(5, {'a': 3})
+    expected = rc.DataFrame({'a': [1, 2, 3]}, index=[1, 2, 5], sort=True)
+    current = bars.current
+    output = bars.output.to_dict()
+    with pytest.raises(ValueError):
+        df.append_row(4, {'a': 4, 'new': 1})
+    with pytest.raises(ValueError):
+        df.append_rows([6, 3], {'a': [5, 6]})
+    assert_frame_equal(df, expected)
+    assert bars.current == current
+    assert bars.output.to_dict() == output
+
+    # a row without a price is not added to the bars
+    df.append_row(4, {'a': None})
+    assert bars.current == current
@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+import raccoon as rc
+from raccoon.containers import Mask
+from raccoon.sort_utils import ColumnIndex
+
+
+def check_index(df, column):
+    # the index matches an index built from scratch
+    expected = ColumnIndex(df.get_entire_column(column, as_list=True), df.index)
+    assert sorted(zip(df._value_indexes[column].values, df._value_indexes[column].keys)) == \
+        sorted(zip(expected.values, expected.keys))
+    assert df._value_indexes[column].values == sorted(df._value_indexes[column].values)
+
+
+def test_column_index():
+    index = ColumnIndex([3, None, 1, 3, 2], ['a', 'b', 'c', 'd', 'e'])
+    assert len(index) == 4
+    assert index.values == [1, 2, 3, 3]
+    assert index.keys == ['c', 'e', 'a', 'd']
+    assert index.equal(3) == ['a', 'd']
+    assert index.equal(4) == []
+    assert index.between(2) == ['e', 'a', 'd']
+    assert index.between(stop=2) == ['c', 'e']
+    assert index.between(1.5, 2.5) == ['e']
+    assert index.top(2) == ['d', 'a']
+    assert index.top(10, largest=False) == ['c', 'e', 'a', 'd']
+    assert index.top(0) == []
+
+    index.add(2, 'f')
+    index.add(None, 'g')
+    assert index.keys == ['c', 'e', 'f', 'a', 'd']
+    index.replace(3, 0, 'a')
+    assert index.values == [0, 1, 2, 2, 3]
+    assert index.keys == ['a', 'c', 'e', 'f', 'd']
+    index.remove(2, 'e')
+    assert index.keys == ['a', 'c', 'f', 'd']
+    index.remove_keys({'a', 'd'})
+    assert index.values == [1, 2]
+    assert index.keys == ['c', 'f']
+
+    with pytest.raises(ValueError):
+        index.remove(5, 'c')
+
+
+def test_find():
+    df = rc.DataFrame({'price': [15, 10, 20, 12, None, 10], 'name': ['a', 'b', 'c', 'd', 'e', 'f']},
+                      columns=['price', 'name'], index=[1, 2, 3, 4, 5, 6], sort=False)
+    assert df.indexed_columns == []
+    df.create_index('price')
+    assert df.indexed_columns == ['price']
+
+    assert df.find('price', 10) == [2, 6]
+    assert df.find('price', 11) == []
+    assert df.find_range('price', 10, 15) == [2, 6, 4, 1]
+    assert df.find_range('price', start=13) == [1, 3]
+    assert df.find_range('price', stop=11) == [2, 6]
+    assert df.find_top('price', 2) == [3, 1]
+    assert df.find_top('price', 2, largest=False) == [2, 6]
+    assert df.get_rows(df.find_range('price', 12, 20), 'name', as_list=True) == ['d', 'a', 'c']
+
+    with pytest.raises(ValueError):
+        df.find('name', 'a')
+    with pytest.raises(ValueError):
+        df.create_index('bad')
+
+    df.drop_index('price')
+    assert df.indexed_columns == []
+    with pytest.raises(ValueError):
+        df.find('price', 10)
+    with pytest.raises(ValueError):
+        df.drop_index('price')
+
+
+def test_sync():
+    df = rc.DataFrame({'a': [5, 3, 4], 'b': [1, 2, 3]}, columns=['a', 'b'], index=[10, 20, 30], sort=True)
+    df.create_index('a')
+
+    df.set_cell(20, 'a', 6)
+    df.set_cell(25, 'a', 1)
+    df.set_row(10, {'a': 2, 'b': 0})
+    df.set_location(2, {'a': 7})
+    df.set_column([10, 40], 'a', [8, 9])
+    df.set_column(Mask([False, True, False, False, False]), 'a', 0)
+    df.set_locations([3], 'a', 3)
+    df[30, 'a'] = 4
+    check_index(df, 'a')
+    assert df.find_range('a') == [20, 30, 25, 10, 40]
+
+    df.append_row(50, {'a': 1})
+    df.append_rows([60, 70], {'a': [None, 2], 'b': [1, 1]})
+    df.append_rows([80], {'b': [1]})
+    check_index(df, 'a')
+    assert df.find('a', 1) == [50]
+
+    df.delete_rows([10])
+    check_index(df, 'a')
+    df.delete_rows([20, 50, 60])
+    check_index(df, 'a')
+    assert df.find_range('a') == [70, 30, 25, 40]
+
+    df.set_column(column='b', values=[3, 1, 2, 5, 4])
+    df.sort_columns('b')
+    check_index(df, 'a')
+
+    df.set_column(column='a', values=[4, 3, 2, 1, 0])
+    check_index(df, 'a')
+    assert df.find_top('a', 1) == df.index[:1]
+
+    df.rename_columns({'a': 'c', 'b': 'a'})
+    assert df.indexed_columns == ['c']
+    check_index(df, 'c')
+
+    df.index = [1, 2, 3, 4, 5]
+    check_index(df, 'c')
+    assert df.find('c', 4) == [1]
+
+    df.create_index('a')
+    df.delete_columns('c')
+    assert df.indexed_columns == ['a']
+
+    df.delete_all_rows()
+    assert df.find_range('a') == []
+
+
+def test_random():
+    random.seed(0)
+    df = rc.DataFrame({'a': [], 'b': []}, columns=['a', 'b'], sort=True)
+    df.create_index('a')
+    for i in range(500):
+        action = random.random()
+        if action < 0.4 or not len(df):
+            df.set_cell(random.randint(0, 100), 'a', random.choice([None, random.randint(0, 20)]))
+        elif action < 0.6:
+            df.set_cell(random.choice(df.index), 'b', 1)
+        elif action < 0.8:
+            df.delete_rows(random.sample(df.index, random.randint(1, min(3, len(df)))))
+        else:
+            locations = random.sample(range(len(df)), min(2, len(df)))
+            df.set_locations(locations, 'a', [random.randint(0, 20) for _ in locations])
+        check_index(df, 'a')
+
+
+def test_rolling():
+    df = rc.RollingDataFrame({'a': [1]}, index=[0], capacity=3)
+    with pytest.raises(ValueError):
+        df.create_index('a')
@@ -1,9 +1,12 @@
+import json
 from collections import OrderedDict
 from copy import deepcopy
+from io import StringIO
 
 import pytest
 
 import raccoon as rc
+from raccoon.containers import Mask
 from raccoon.utils import assert_frame_equal
 
 
@@ -107,6 +110,48 @@ def test_json_multi_index():
     assert_frame_equal(df, actual)
 
 
+class ShortReads(StringIO):
+    # file object that returns a few characters for each read so values are split across the reads
+    def read(self, size=-1):
+        return super(ShortReads, self).read(3)
+
+
+def test_json_file():
+    df = rc.DataFrame({'a': [1, 2.5, None, -4e-10], 'b': ['x,]', 'y"],', '', 'z'],
+                       'c': [[1, [2]], {'k': 'v'}, True, None]},
+                      index=[('a', 1), ('b', 2), ('c', 3), ('d', 4)], index_name=('first', 'second'),
+                      columns=['c', 'a', 'b'])
+
+    for rows in [1, 3, 100]:
+        file = StringIO()
+        df.to_json_file(file, rows=rows)
+        string = file.getvalue()
+
+        # same JSON as to_json() and can be read by from_json()
+        assert json.loads(string) == json.loads(df.to_json())
+        assert_frame_equal(df, rc.DataFrame.from_json(string))
+
+        assert_frame_equal(df, rc.DataFrame.from_json_file(StringIO(string)))
+        assert_frame_equal(df, rc.DataFrame.from_json_file(ShortReads(string)))
+
+    # reads the JSON from to_json()
+    assert_frame_equal(df, rc.DataFrame.from_json_file(ShortReads(df.to_json())))
+
+    # empty DataFrame
+    for df in [rc.DataFrame({'a': [], 'b': []}, columns=['a', 'b']), rc.DataFrame()]:
+        file = StringIO()
+        df.to_json_file(file)
+        assert_frame_equal(df, rc.DataFrame.from_json(file.getvalue()))
+        assert_frame_equal(df, rc.DataFrame.from_json_file(StringIO(file.getvalue())))
+
+    with pytest.raises(ValueError):
+        df.to_json_file(StringIO(), rows=0)
+
+    # incomplete JSON
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_json_file(StringIO('{"index": [1, 2'))
+
+
 def test_append():
     # duplicate indexes
     df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], index=[0, 1, 2])
@@ -157,6 +202,42 @@ def test_rename_columns():
     with pytest.raises(ValueError):
         df.rename_columns({'a2': 'a', 'bad': 'nogo'})
 
+    # swap names
+    df.rename_columns({'b2': 'a2', 'a2': 'b2'})
+    assert df.columns == ['a2', 'b2']
+    assert df.get_cell('a', 'a2') == 4
+    assert df.get_cell('a', 'b2') == 1
+
+
+def test_column_map():
+    def check_map():
+        assert df._column_map == {x: i for i, x in enumerate(df.columns)}
+
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': [7, 8, 9]}, columns=['c', 'a', 'b'])
+    check_map()
+    assert df.get_cell(1, 'a') == 2
+
+    df.set_cell(1, 'd', 10)
+    df.set_column(column='e', values=[1, 1, 1])
+    df.append_row(3, {'f': 4})
+    check_map()
+    assert df.columns == ['c', 'a', 'b', 'd', 'e', 'f']
+
+    df.delete_columns(['a', 'd'])
+    check_map()
+    assert df.get_location(1, ['b', 'e'], as_dict=True) == {'index': 1, 'b': 5, 'e': 1}
+
+    df.rename_columns({'c': 'z'})
+    check_map()
+    assert df.get_cell(0, 'z') == 7
+
+    df.columns = ['p', 'q', 'r', 's']
+    check_map()
+    assert df.get_cell(3, 's') == 4
+
+    with pytest.raises(ValueError):
+        df.get_cell(1, 'bad')
+
 
 def test_print():
     df = rc.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.55, 3.1], 'c': ['first', 'second', None]}, columns=['b', 'c', 'a'],
@@ -378,6 +459,35 @@ def test_isin():
     assert df.isin('second', ['a', 'b', None]) == [True, False, True, True, False]
 
 
+def test_mask():
+    df = rc.DataFrame({'a': [1, 2, 3, 4, 5], 'b': ['x', 'y', 'x', 'y', 'z']}, columns=['a', 'b'],
+                      index=[10, 11, 12, 13, 14], sort=False)
+
+    mask = df.equality('b', value='x') | df.isin('a', [4])
+    assert isinstance(mask, Mask)
+    assert mask == [True, False, True, True, False]
+    assert mask.popcount() == 3
+    assert isinstance(df.select_index(12), Mask)
+
+    assert df.get(mask, 'a', as_list=True) == [1, 3, 4]
+    assert df.get(~mask, ['a']).index == [11, 14]
+    assert df[mask, 'b'].index == [10, 12, 13]
+    assert df.get(columns=Mask([False, True])).columns == ['b']
+    assert df.get_matrix(mask, Mask([True, False])).data == [[1, 3, 4]]
+    assert df.get(12, Mask([True, False])).data == [[3]]
+
+    df.set(mask, 'a', 0)
+    assert df.data[0] == [0, 2, 0, 0, 5]
+    df.set_column(df.equality('a', value=0), 'c', [7, 8, 9])
+    assert df.data[2] == [7, None, 8, 9, None]
+
+    df.delete_rows(df.isin('b', ['y']))
+    assert df.index == [10, 12, 14]
+
+    with pytest.raises(ValueError):
+        df.get(Mask([True]), 'a')
+
+
 def test_reset_index():
     # no index defined
     df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'])
@@ -68,6 +68,29 @@ def test_delete_row_sorted():
     assert_frame_equal(df, rc.DataFrame(columns=['b', 'a'], sort=False))
 
 
+def test_delete_many_rows():
+    df = rc.DataFrame({'a': list(range(10)), 'b': list(range(10, 20))}, index=list(range(100, 110)), columns=['a', 'b'],
+                      hash_index=True)
+    link_index = df.index
+    link_col = df.get_entire_column('b', as_list=True)
+
+    # unordered and repeated index values
+    df.delete_rows([109, 101, 105, 101, 100])
+    assert df.index == [102, 103, 104, 106, 107, 108]
+    assert df.data == [[2, 3, 4, 6, 7, 8], [12, 13, 14, 16, 17, 18]]
+    assert df.get_cell(106, 'b') == 16
+
+    # the lists are modified in place
+    assert link_index is df.index
+    assert link_col == [12, 13, 14, 16, 17, 18]
+
+    df.delete_rows([False, True, True, False, False, True])
+    assert df.index == [102, 106, 107]
+    assert df.data == [[2, 6, 7], [12, 16, 17]]
+    assert df.get_cell(107, 'a') == 7
+    df.validate_integrity()
+
+
 def test_delete_all_rows():
     df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['a', 'b', 'c'], columns=['b', 'a'])
 
@@ -0,0 +1,110 @@
+import pytest
+
+import raccoon as rc
+from raccoon.containers import TypedList
+from raccoon.utils import assert_frame_equal
+
+
+def test_init():
+    df = rc.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [1, 2, 3], 'c': ['x', 'y', 'z']}, columns=['a', 'b', 'c'],
+                      dtypes={'a': 'd', 'b': 'q'})
+    assert df.dtypes == {'a': 'd', 'b': 'q'}
+    assert isinstance(df.data[0], TypedList)
+    assert isinstance(df.data[2], list)
+    assert df.data == [[1.0, 2.0, 3.0], [1, 2, 3], ['x', 'y', 'z']]
+
+    with pytest.raises(TypeError):
+        rc.DataFrame({'a': ['x']}, dtypes={'a': 'd'})
+
+    with pytest.raises(ValueError):
+        rc.DataFrame({'a': [1.0]}, dtypes={'b': 'd'})
+
+
+def test_set_dtypes():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'])
+    assert df.dtypes == {}
+
+    df.set_dtypes({'a': 'b', 'b': 'd'})
+    assert df.dtypes == {'a': 'b', 'b': 'd'}
+    assert df.get_entire_column('b', as_list=True) == [4.0, 5.0, 6.0]
+
+    df.set_dtypes({'a': None})
+    assert df.dtypes == {'b': 'd'}
+    assert type(df.data[0]) is list
+    assert df.data[0] == [1, 2, 3]
+
+
+def test_set_get():
+    df = rc.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [1, 2, 3]}, index=[10, 11, 12], columns=['a', 'b'],
+                      dtypes={'a': 'd', 'b': 'q'})
+
+    df.set_cell(11, 'a', 9.5)
+    assert df.get(11, 'a') == 9.5
+    with pytest.raises(TypeError):
+        df.set_cell(11, 'b', 'x')
+
+    # new rows are None
+    df.set_cell(13, 'a', 4.0)
+    assert df.get(13, 'b') is None
+    assert df.data[1].null_mask() == [False, False, False, True]
+
+    df.append_row(14, {'a': 5.0, 'b': 5})
+    assert df.dtypes == {'a': 'd', 'b': 'q'}
+    assert df.get_entire_column('b', as_list=True) == [1, 2, 3, None, 5]
+
+    df.set_column(column='b', values=[5, 4, 3, 2, 1])
+    assert isinstance(df.data[1], TypedList)
+    assert df.data[1] == [5, 4, 3, 2, 1]
+
+    df.set_column([10, 12], 'b', [0, 0])
+    assert df.data[1] == [0, 4, 0, 2, 1]
+
+    assert df.get_rows([11, 12], 'b', as_list=True) == [4, 0]
+    actual = df.get_rows([11, 12], 'a')
+    expected = rc.DataFrame({'a': [9.5, 3.0]}, index=[11, 12])
+    assert_frame_equal(actual, expected)
+
+    df.delete_rows([10, 13])
+    assert df.dtypes == {'a': 'd', 'b': 'q'}
+    assert df.data == [[9.5, 3.0, 5.0], [4, 0, 1]]
+
+
+def test_sort():
+    df = rc.DataFrame({'a': [3.0, 1.0, 2.0], 'b': [3, None, 2]}, index=[3, 1, 2], columns=['a', 'b'], sort=False,
+                      dtypes={'a': 'd', 'b': 'q'})
+    df.sort_index()
+    assert df.dtypes == {'a': 'd', 'b': 'q'}
+    assert df.data == [[1.0, 2.0, 3.0], [None, 2, 3]]
+
+    df.sort_columns('a', reverse=True)
+    assert df.dtypes == {'a': 'd', 'b': 'q'}
+    assert df.data == [[3.0, 2.0, 1.0], [3, 2, None]]
+
+
+def test_sorted_insert():
+    df = rc.DataFrame({'a': [1.0, 3.0]}, index=[1, 3], sort=True, dtypes={'a': 'd'})
+    df.set_cell(2, 'a', 2.0)
+    df.set_column([0, 4], 'a', [0.0, 4.0])
+    assert df.index == [0, 1, 2, 3, 4]
+    assert df.data[0] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert df.dtypes == {'a': 'd'}
+
+
+def test_buffer():
+    df = rc.DataFrame({'a': [1.0, 2.0, 3.0]}, dtypes={'a': 'd'})
+    view = memoryview(df.get_entire_column('a', as_list=True).array)
+    assert view.format == 'd'
+    assert view.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_json():
+    df = rc.DataFrame({'a': [1.0, None, 3.0], 'b': ['x', 'y', 'z']}, columns=['a', 'b'], dtypes={'a': 'd'})
+    actual = rc.DataFrame.from_json(df.to_json())
+    assert actual.dtypes == {'a': 'd'}
+    assert_frame_equal(actual, df)
+
+
+def test_rolling():
+    df = rc.RollingDataFrame({'a': [1.0]}, capacity=2)
+    with pytest.raises(ValueError):
+        df.set_dtypes({'a': 'd'})
@@ -0,0 +1,100 @@
+import pytest
+
+import raccoon as rc
+from raccoon import math_utils
+from raccoon.containers import ChunkedList
+
+
+def test_compile_expression():
+    columns, function, vectorize = math_utils.compile_expression('a + b * a')
+    assert columns == ['a', 'b']
+    assert function(2, 3) == 8
+    assert vectorize is True
+
+    assert math_utils.compile_expression('a + b * a') is math_utils.compile_expression('a + b * a')
+    assert math_utils.compile_expression('a > 1 and b')[2] is False
+    assert math_utils.compile_expression('not a')[2] is False
+    assert math_utils.compile_expression('0 < a < 1')[2] is False
+
+    for expression in ['a +', 'a.real', 'abs(a)', 'a[0]', 'lambda: a', '[a]', '1 + 2', 'a if b else c']:
+        with pytest.raises(ValueError):
+            math_utils.compile_expression(expression)
+
+
+def test_eval():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8], 'c': [0.5, 1.0, 1.5, 2.0]}, columns=['a', 'b', 'c'],
+                      index=[10, 11, 12, 13])
+
+    assert df.eval('a + b * c') == [3.5, 8.0, 13.5, 20.0]
+    assert df.eval('(a + b) * c') == [3.0, 8.0, 15.0, 24.0]
+    assert df.eval('a - 1') == [0, 1, 2, 3]
+    assert df.eval('b // a + b % a - a ** 2') == [4, -1, -6, -14]
+    assert df.eval('-a / 2') == [-0.5, -1.0, -1.5, -2.0]
+
+    # comparisons
+    assert df.eval('a * 2 >= b') == [False, False, False, True]
+    assert df.eval('a != 2') == [True, False, True, True]
+    assert df.eval('a > 1 and not b == 7') == [False, True, False, True]
+    assert df.eval('1 < a <= 3 or c == 2') == [False, True, True, True]
+
+    # indexes
+    assert df.eval('a + b', indexes=[11, 13]) == [8, 12]
+    assert df.eval('a + b', indexes=[True, False, True, False]) == [6, 10]
+
+    with pytest.raises(ValueError):
+        df.eval('a + bad')
+
+    with pytest.raises(ZeroDivisionError):
+        df.eval('a / (b - 6)')
+
+
+def test_eval_column():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], index=[10, 11, 12])
+
+    df.eval('a * b', 'c')
+    assert df.columns == ['a', 'b', 'c']
+    assert df.data == [[1, 2, 3], [4, 5, 6], [4, 10, 18]]
+
+    df.eval('c - a', 'c', indexes=[11, 12])
+    assert df.data == [[1, 2, 3], [4, 5, 6], [4, 8, 15]]
+
+    df.eval('a > 1', 'd', indexes=[False, True, True])
+    assert df.data[3] == [None, True, True]
+
+    # dropin
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], dropin=ChunkedList)
+    df.eval('a + b', 'c')
+    assert isinstance(df.data[2], ChunkedList)
+    assert df.data[2] == ChunkedList([5, 7, 9])
+
+    # dtypes
+    df = rc.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [1.0, 1.0, 1.0]}, columns=['a', 'b'], dtypes={'a': 'd', 'b': 'd'})
+    df.eval('a - b', 'b')
+    assert df.dtypes == {'a': 'd', 'b': 'd'}
+    assert df.data[1] == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.parametrize('use_numpy', [True, False], ids=['numpy', 'python'])
+def test_eval_numpy(use_numpy, monkeypatch):
+    np = pytest.importorskip('numpy')
+    if not use_numpy:
+        monkeypatch.setattr(math_utils, 'np', None)
+
+    df = rc.DataFrame({'a': [1.0, 2.0, 4.0], 'b': [2.0, 0.5, 0.0], 'i': [1, 2, 3]}, columns=['a', 'b', 'i'],
+                      dtypes={'a': 'd', 'b': 'd'})
+    assert df.eval('a * b + 1') == [3.0, 2.0, 1.0]
+    assert df.eval('a * b > 1') == [True, False, False]
+    assert df.eval('a * i') == [1.0, 4.0, 12.0]
+
+    # division by zero raises the same as python
+    with pytest.raises(ZeroDivisionError):
+        df.eval('a / b')
+
+    if use_numpy:
+        actual = df.eval('a * b', as_array=True)
+        assert isinstance(actual, np.ndarray)
+        assert actual.tolist() == [2.0, 1.0, 0.0]
+        assert df.eval('i * 2', as_array=True).tolist() == [2, 4, 6]
+    else:
+        with pytest.raises(ImportError):
+            df.eval('a * b', as_array=True)
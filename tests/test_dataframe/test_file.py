@@ -0,0 +1,149 @@
+import mmap
+from datetime import datetime
+
+import pytest
+
+import raccoon as rc
+from raccoon import columnar
+from raccoon.containers import ChunkedList
+from raccoon.utils import assert_frame_equal
+
+
+def test_file(tmp_path):
+    path = str(tmp_path / 'test.rc')
+    df = rc.DataFrame({'a': [1.5, None, 3.0], 'b': [('x', 1), datetime(2020, 1, 1), None], 'c': [1, 2, 3]},
+                      index=['x', 'y', 'z'], index_name='name', columns=['c', 'a', 'b'], dtypes={'a': 'd', 'c': 'q'})
+
+    df.to_file(path)
+    for memory_map in [True, False]:
+        actual = rc.DataFrame.from_file(path, memory_map=memory_map)
+        assert_frame_equal(df, actual)
+        assert actual.dtypes == {'a': 'd', 'c': 'q'}
+        assert actual.get_cell('x', 'b') == ('x', 1)
+        assert actual.get_cell('y', 'b') == datetime(2020, 1, 1)
+
+    # subset of columns
+    actual = rc.DataFrame.from_file(path, columns=['b', 'a'])
+    assert_frame_equal(df.get(columns=['b', 'a']), actual)
+
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_file(path, columns=['a', 'bad'])
+
+    # index of tuples, int, float and datetime
+    for index in [[('a', 1), ('b', 2)], [10, 20], [1.5, 2.5], [datetime(2020, 1, 1), datetime(2020, 1, 2)]]:
+        df = rc.DataFrame({'a': [1, 2]}, index=index, index_name=('first', 'second'), sort=True)
+        df.to_file(path)
+        actual = rc.DataFrame.from_file(path)
+        assert_frame_equal(df, actual)
+        assert actual.index == index
+
+    # empty DataFrame
+    df = rc.DataFrame(columns=['a', 'b'], dtypes={'a': 'd'})
+    df.to_file(path)
+    actual = rc.DataFrame.from_file(path)
+    assert_frame_equal(df, actual)
+    assert actual.dtypes == {'a': 'd'}
+
+    with open(path, 'wb') as file:
+        file.write(b'not a raccoon file')
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_file(path)
+
+    with pytest.raises(ValueError):
+        rc.DataFrame({'a': [1]}, dropin=ChunkedList).to_file(path)
+
+
+def test_file_memory_map(tmp_path):
+    path = str(tmp_path / 'test.rc')
+    df = rc.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [4, 5, 6]}, columns=['a', 'b'], dtypes={'a': 'd'})
+    df.to_file(path)
+
+    actual = rc.DataFrame.from_file(path)
+    assert isinstance(actual.get_entire_column('a', as_list=True).array, memoryview)
+    assert actual.sum('a') == 6.0
+
+    # changes copy the column into memory and do not change the file
+    actual.set_cell(1, 'a', 10.0)
+    actual.append_row(3, {'a': 4.0, 'b': 7})
+    assert actual.get_entire_column('a', as_list=True) == [1.0, 10.0, 3.0, 4.0]
+    assert_frame_equal(df, rc.DataFrame.from_file(path))
+
+    # writing over the file does not change a DataFrame that reads the old file
+    actual = rc.DataFrame.from_file(path)
+    actual.to_file(path)
+    rc.DataFrame({'a': [9.0], 'b': [9]}, columns=['a', 'b'], dtypes={'a': 'd'}).to_file(path)
+    assert_frame_equal(df, actual)
+
+
+def test_file_append(tmp_path):
+    path = str(tmp_path / 'test.rc')
+    df = rc.DataFrame({'a': [1.0, None], 'b': ['x', 'y']}, columns=['a', 'b'], index=[1, 2], sort=True,
+                      dtypes={'a': 'd'})
+
+    # append to a file that does not exist writes a new file
+    df.to_file(path, append=True)
+    assert_frame_equal(df, rc.DataFrame.from_file(path))
+
+    # columns without a dtype are converted to the dtype of the file
+    rc.DataFrame({'a': [3.0, 4.0], 'b': ['z', None]}, columns=['a', 'b'], index=[3, 4]).to_file(path, append=True)
+    rc.DataFrame(columns=['a', 'b']).to_file(path, append=True)
+    rc.DataFrame({'a': [None], 'b': [None]}, columns=['a', 'b'], index=[5.5]).to_file(path, append=True)
+
+    expected = rc.DataFrame({'a': [1.0, None, 3.0, 4.0, None], 'b': ['x', 'y', 'z', None, None]}, columns=['a', 'b'],
+                            index=[1, 2, 3, 4, 5.5], sort=True, dtypes={'a': 'd'})
+    actual = rc.DataFrame.from_file(path)
+    assert_frame_equal(expected, actual)
+    assert actual.dtypes == {'a': 'd'}
+    actual.validate_integrity()
+
+    # index must be after the end of a sorted file
+    with pytest.raises(ValueError):
+        rc.DataFrame({'a': [6.0], 'b': ['w']}, columns=['a', 'b'], index=[5]).to_file(path, append=True)
+
+    with pytest.raises(ValueError):
+        rc.DataFrame({'a': [6.0, 7.0], 'b': ['w', 'v']}, columns=['a', 'b'], index=[7, 6]).to_file(path, append=True)
+
+    # columns must be the same as the file
+    with pytest.raises(ValueError):
+        rc.DataFrame({'b': ['w'], 'a': [6.0]}, columns=['b', 'a'], index=[6]).to_file(path, append=True)
+
+    assert_frame_equal(expected, rc.DataFrame.from_file(path))
+
+
+def test_file_append_closes_map(tmp_path, monkeypatch):
+    # the memory map used to read the end of the file is closed before the rows are appended
+    maps = list()
+
+    class Map(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            maps.append(self)
+
+    monkeypatch.setattr(columnar.mmap, 'mmap', Map)
+    path = str(tmp_path / 'test.rc')
+    rc.DataFrame({'a': [1.0]}, index=[1], sort=True).to_file(path)
+    rc.DataFrame({'a': [2.0]}, index=[2]).to_file(path, append=True)
+    rc.DataFrame({'a': [3.0]}, index=[3]).to_file(path, append=True)
+    with pytest.raises(ValueError):
+        rc.DataFrame({'b': [4.0]}, index=[4]).to_file(path, append=True)
+    with pytest.raises(ValueError):
+        rc.DataFrame({'a': [3.0]}, index=[3]).to_file(path, append=True)
+    assert len(maps) == 4
+    assert all(x.closed for x in maps)
+    monkeypatch.undo()
+
+    assert_frame_equal(rc.DataFrame({'a': [1.0, 2.0, 3.0]}, index=[1, 2, 3], sort=True), rc.DataFrame.from_file(path))
+
+
+def test_file_rolling(tmp_path):
+    path = str(tmp_path / 'test.rc')
+    df = rc.RollingDataFrame({'a': [1.0, 2.0]}, index=[1, 2], sort=True, capacity=3)
+    df.to_file(path)
+    df.append_row(3, {'a': 3.0})
+    df.append_row(4, {'a': 4.0})
+    df.tail(2).to_file(path, append=True)
+
+    expected = rc.DataFrame({'a': [1.0, 2.0, 3.0, 4.0]}, index=[1, 2, 3, 4], sort=True)
+    assert_frame_equal(expected, rc.DataFrame.from_file(path))
+
+    with pytest.raises(ValueError):
+        rc.RollingDataFrame.from_file(path)
@@ -68,6 +68,13 @@ def test_get_rows():
     # get entire column
     assert df.get(columns='b', as_list=True) == [4, 5, 6, 7]
 
+    # entire column as a DataFrame does not share the lists
+    for actual in [df.get(columns='b'), df.get([True] * 4, 'b')]:
+        actual.set_cell(10, 'b', 100)
+        actual.index[0] = 'x'
+        assert df.data[1] == [4, 5, 6, 7]
+        assert df.index == [10, 11, 12, 99]
+
     # items not in index raise errors
     with pytest.raises(ValueError):
         df.get([11, 88], 'c', as_list=True)
@@ -299,6 +306,50 @@ def test_get_locations():
     # single row, multiple columns
     assert_frame_equal(df.get_locations([2]), rc.DataFrame({'a': [3], 'b': [7]}, index=[6]))
 
+    # slices
+    assert_frame_equal(df.get_locations(slice(1, 3)), rc.DataFrame({'a': [2, 3], 'b': [6, 7]}, index=[4, 6]))
+    assert_frame_equal(df.get_locations(slice(-1, None), ['b']), rc.DataFrame({'b': [8]}, index=[8]))
+    assert df.get_locations(slice(None, None, 2), 'a', as_list=True) == [1, 3]
+    assert_frame_equal(df.get_locations(slice(3, 1)), rc.DataFrame(columns=['a', 'b'], sort=df.sort))
+
+    # negative locations and boolean columns
+    assert_frame_equal(df.get_locations([-1, 0], [False, True]), rc.DataFrame({'b': [8, 5]}, index=[8, 2]))
+
+    with pytest.raises(IndexError):
+        df.get_locations([0, 9])
+    with pytest.raises(ValueError):
+        df.get_locations([0], 'bad')
+
+
+def test_iloc():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, index=[2, 4, 6, 8], columns=['a', 'b'], sort=True)
+
+    assert_frame_equal(df.iloc[1], rc.DataFrame({'a': [2], 'b': [6]}, index=[4], columns=['a', 'b'], sort=True))
+    assert df.iloc[-1, 'b'] == 8
+    assert_frame_equal(df.iloc[1:3], rc.DataFrame({'a': [2, 3], 'b': [6, 7]}, index=[4, 6], columns=['a', 'b'],
+                                                  sort=True))
+    assert_frame_equal(df.iloc[[0, 3], ['b']], rc.DataFrame({'b': [5, 8]}, index=[2, 8], sort=True))
+    assert_frame_equal(df.iloc[-2:, 'a'], rc.DataFrame({'a': [3, 4]}, index=[6, 8], sort=True))
+
+    df.iloc[0, 'a'] = 10
+    df.iloc[1:3, 'b'] = [60, 70]
+    df.iloc[[-1], 'c'] = ['z']
+    assert df.to_dict(index=False) == {'a': [10, 2, 3, 4], 'b': [5, 60, 70, 8], 'c': [None, None, None, 'z']}
+
+    with pytest.raises(ValueError):
+        df.iloc[0] = 1
+
+
+def test_iloc_numpy():
+    np = pytest.importorskip('numpy')
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=[2, 4, 6], columns=['a', 'b'], sort=True)
+
+    assert_frame_equal(df.iloc[np.int64(1)], rc.DataFrame({'a': [2], 'b': [5]}, index=[4], columns=['a', 'b'],
+                                                          sort=True))
+    assert df.iloc[np.int32(-1), 'b'] == 6
+    df.iloc[np.int64(0), 'a'] = 10
+    assert df.get_entire_column('a', as_list=True) == [10, 2, 3]
+
 
 def test_get_slice():
     # fails for non-sort DataFrame
@@ -518,9 +569,55 @@ def test_head():
 
 def test_tail():
     df = rc.DataFrame({1: [0, 1, 2], 2: [3, 4, 5]}, columns=[1, 2], sort=False)
+    assert_frame_equal(rc.DataFrame(sort=False).tail(5), rc.DataFrame(sort=False))
 
     assert_frame_equal(df.tail(0), rc.DataFrame(columns=[1, 2], sort=False))
     assert_frame_equal(df.tail(1), rc.DataFrame({1: [2], 2: [5]}, columns=[1, 2], index=[2], sort=False))
     assert_frame_equal(df.tail(2), rc.DataFrame({1: [1, 2], 2: [4, 5]}, columns=[1, 2], index=[1, 2], sort=False))
     assert_frame_equal(df.tail(3), rc.DataFrame({1: [0, 1, 2], 2: [3, 4, 5]}, columns=[1, 2], sort=False))
     assert_frame_equal(df.tail(999), rc.DataFrame({1: [0, 1, 2], 2: [3, 4, 5]}, columns=[1, 2], sort=False))
+
+
+def test_get_asof():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, index=[2, 4, 6, 8], columns=['a', 'b'], sort=True)
+
+    assert df.get_asof(2, 'a') == 1
+    assert df.get_asof(5, 'b') == 6
+    assert df.get_asof(100, 'a') == 4
+    assert df.get_asof(7, as_dict=True) == {'index': 6, 'a': 3, 'b': 7}
+    assert df.get_asof(7, ['b'], as_dict=True) == {'index': 6, 'b': 7}
+    assert_frame_equal(df.get_asof(3), rc.DataFrame({'a': [1], 'b': [5]}, index=[2], columns=['a', 'b'], sort=True))
+
+    with pytest.raises(ValueError):
+        df.get_asof(1, 'a')
+
+    with pytest.raises(ValueError):
+        rc.DataFrame(columns=['a'], sort=True).get_asof(1, 'a')
+
+    # fails for non-sort DataFrame
+    with pytest.raises(RuntimeError):
+        rc.DataFrame({'a': [1, 2]}, index=[1, 2], sort=False).get_asof(1)
+
+
+def test_get_asof_many():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, index=[2, 4, 6, 8], columns=['a', 'b'],
+                      index_name='time', sort=True)
+
+    assert df.get_asof_many([1, 2, 3, 9], 'a', as_list=True) == [None, 1, 1, 4]
+    assert df.get_asof_many([9, 3, 1, 5], 'b', as_list=True) == [8, 5, None, 6]
+    assert df.get_asof_many([], 'b', as_list=True) == []
+
+    expected = rc.DataFrame({'a': [None, 1, 2], 'b': [None, 5, 6]}, index=[0, 3, 5], columns=['a', 'b'],
+                            index_name='time', sort=True)
+    assert_frame_equal(df.get_asof_many([5, 0, 3]), expected)
+
+    expected = rc.DataFrame({'b': [6, 8]}, index=[4, 10], index_name='time', sort=True)
+    assert_frame_equal(df.get_asof_many([4, 10], 'b'), expected)
+    assert_frame_equal(df.get_asof_many([4, 10], ['b']), expected)
+
+    with pytest.raises(ValueError):
+        df.get_asof_many([1], 'c')
+
+    # fails for non-sort DataFrame
+    with pytest.raises(RuntimeError):
+        rc.DataFrame({'a': [1, 2]}, index=[1, 2], sort=False).get_asof_many([1], 'a')
@@ -0,0 +1,90 @@
+import pytest
+
+import raccoon as rc
+from raccoon.containers import ChunkedList
+from raccoon.utils import assert_frame_equal
+
+
+def test_groups():
+    df = rc.DataFrame({'k': ['b', 'a', 'b', 'c', 'a'], 'j': [1, 1, 2, 1, 1], 'v': [1, 2, 3, 4, 5]},
+                      columns=['k', 'j', 'v'], index=[10, 11, 12, 13, 14], sort=False)
+
+    group = df.groupby('k')
+    assert len(group) == 3
+    assert group.groups == {'b': [0, 2], 'a': [1, 4], 'c': [3]}
+    assert list(group.groups.keys()) == ['b', 'a', 'c']
+
+    group = df.groupby(['k', 'j'])
+    assert group.groups == {('b', 1): [0], ('a', 1): [1, 4], ('b', 2): [2], ('c', 1): [3]}
+
+    with pytest.raises(ValueError):
+        df.groupby('bad')
+
+
+def test_agg():
+    df = rc.DataFrame({'k': ['b', 'a', 'b', 'c', 'a'], 'v': [1, 2, 3, 4, None], 'w': [1.0, 2.0, 3.0, 4.0, 5.0]},
+                      columns=['k', 'v', 'w'], index=[10, 11, 12, 13, 14], sort=False)
+
+    actual = df.groupby('k').agg({'v': 'sum', 'w': 'mean'})
+    expected = rc.DataFrame({'v': [4, 2, 4], 'w': [2.0, 3.5, 4.0]}, columns=['v', 'w'], index=['b', 'a', 'c'],
+                            index_name='k', sort=False)
+    assert_frame_equal(actual, expected)
+
+    actual = df.groupby('k').agg({'v': ['count', 'min', 'max', 'std'], 'w': len})
+    expected = rc.DataFrame({('v', 'count'): [2, 1, 1], ('v', 'min'): [1, 2, 4], ('v', 'max'): [3, 2, 4],
+                             ('v', 'std'): [2 ** 0.5, None, None], 'w': [2, 2, 1]},
+                            columns=[('v', 'count'), ('v', 'min'), ('v', 'max'), ('v', 'std'), 'w'],
+                            index=['b', 'a', 'c'], index_name='k', sort=False)
+    assert_frame_equal(actual, expected)
+
+    actual = df.groupby('k').agg({'w': [sum, 'max']})
+    assert actual.columns == [('w', 'sum'), ('w', 'max')]
+    assert actual.data == [[4.0, 7.0, 4.0], [3.0, 5.0, 4.0]]
+
+    with pytest.raises(ValueError):
+        df.groupby('k').agg({'v': 'median'})
+
+    with pytest.raises(ValueError):
+        df.groupby('k').agg({'bad': 'sum'})
+
+    with pytest.raises(ValueError):
+        df.groupby('k').agg({})
+
+
+def test_agg_multiple_keys_sorted():
+    # the sort of the DataFrame is for its index, the groups are in the order they first appear
+    df = rc.DataFrame({'k': ['b', 'a', 'b', 'a'], 'j': [2, 1, 1, 1], 'v': [1, 2, 3, 4]}, columns=['k', 'j', 'v'],
+                      sort=True)
+    actual = df.groupby(['k', 'j']).agg({'v': 'sum'})
+    expected = rc.DataFrame({'v': [1, 6, 3]}, index=[('b', 2), ('a', 1), ('b', 1)], index_name=('k', 'j'),
+                            sort=False)
+    assert_frame_equal(actual, expected)
+    assert actual.sort is False
+
+
+def test_agg_none_mixed_keys():
+    df = rc.DataFrame({'k': ['b', None, 'b', 1, None], 'v': [1, 2, 3, 4, 5]}, columns=['k', 'v'])
+    assert df.sort is True
+    actual = df.groupby('k').agg({'v': 'sum'})
+    expected = rc.DataFrame({'v': [4, 7, 4]}, index=['b', None, 1], index_name='k', sort=False)
+    assert_frame_equal(actual, expected)
+
+    actual = df.groupby(['k', 'v']).agg({'v': 'count'})
+    assert actual.index == [('b', 1), (None, 2), ('b', 3), (1, 4), (None, 5)]
+
+
+def test_agg_empty_dropin_dtypes():
+    df = rc.DataFrame(columns=['k', 'v'])
+    actual = df.groupby('k').agg({'v': 'sum'})
+    assert actual.index == []
+    assert actual.columns == ['v']
+
+    df = rc.DataFrame({'k': [1, 2, 1], 'v': [1, 2, 3]}, columns=['k', 'v'], dropin=ChunkedList)
+    actual = df.groupby(ChunkedList(['k'])).agg({'v': 'max'})
+    assert actual.index == [(1,), (2,)]
+    assert actual.data == [[3, 2]]
+
+    df = rc.DataFrame({'k': [1, 2, 1], 'v': [1.0, 2.0, None]}, columns=['k', 'v'], dtypes={'k': 'q', 'v': 'd'})
+    actual = df.groupby('k').agg({'v': ['sum', 'count']})
+    assert actual.index == [1, 2]
+    assert actual.data == [[1.0, 2.0], [1, 1]]
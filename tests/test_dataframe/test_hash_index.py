@@ -0,0 +1,115 @@
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def check_map(df):
+    assert df.hash_index
+    assert df._index_map == {x: i for i, x in enumerate(df.index)}
+
+
+def test_default():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=['x', 'y', 'z'])
+    assert df.hash_index is False
+    assert df._index_map is None
+
+    df.hash_index = True
+    check_map(df)
+
+    df.hash_index = False
+    assert df._index_map is None
+
+
+def test_get():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['x', 'y', 'z'], columns=['a', 'b'], hash_index=True)
+    check_map(df)
+
+    assert df.get_cell('y', 'b') == 5
+    assert df.get_rows(['z', 'x'], 'a', as_list=True) == [3, 1]
+    assert df.get_columns('z', ['b'], as_dict=True) == {'index': 'z', 'b': 6}
+    assert_frame_equal(df.get_matrix(['y', 'z'], ['b']),
+                       rc.DataFrame({'b': [5, 6]}, index=['y', 'z'], columns=['b']))
+    assert df.select_index('y') == [False, True, False]
+    assert_frame_equal(df['x':'y'], rc.DataFrame({'a': [1, 2], 'b': [4, 5]}, index=['x', 'y'], columns=['a', 'b']))
+
+    with pytest.raises(ValueError):
+        df.get_cell('bad', 'a')
+
+    with pytest.raises(IndexError):
+        df['x':'bad']
+
+
+def test_set():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=['x', 'y', 'z'], hash_index=True)
+
+    df.set_cell('y', 'a', 22)
+    df.set_cell('w', 'a', 44)
+    check_map(df)
+
+    df.set_row('v', {'a': 55})
+    df.set_row('x', {'a': 11})
+    check_map(df)
+
+    df.set_column(['z', 'u', 't'], 'b', [7, 8, 9])
+    check_map(df)
+
+    df.append_row('s', {'a': 10})
+    df.append_rows(['r', 'q'], {'a': [11, 12]})
+    check_map(df)
+
+    assert df.get_cell('q', 'a') == 12
+    assert df.get_rows(['x', 'y', 'z', 'u'], 'b', as_list=True) == [None, None, 7, 8]
+
+
+def test_sorted():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[2, 4, 6], sort=True, hash_index=True)
+    check_map(df)
+
+    df.set_cell(5, 'a', 55)
+    df.set_cell(1, 'a', 11)
+    df.set_row(3, {'a': 33})
+    df.set_column([0, 7], 'b', [10, 70])
+    check_map(df)
+    assert df.index == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert df.get_rows([3, 5], 'a', as_list=True) == [33, 55]
+
+
+def test_delete_and_sort():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, index=['d', 'b', 'a', 'c'], columns=['a', 'b'],
+                      hash_index=True)
+
+    df.delete_rows(['b'])
+    check_map(df)
+    assert df.get_cell('c', 'a') == 4
+
+    df.sort_index()
+    check_map(df)
+    assert df.index == ['a', 'c', 'd']
+    assert df.get_cell('d', 'b') == 5
+
+    df.sort_columns('b')
+    check_map(df)
+    assert df.index == ['d', 'a', 'c']
+
+    df.reset_index()
+    check_map(df)
+    assert df.get_cell(2, 'index_0') == 'c'
+
+    df.delete_columns(['a', 'b', 'index_0'])
+    check_map(df)
+
+    df.set_cell('new', 'z', 1)
+    check_map(df)
+
+    df.delete_all_rows()
+    check_map(df)
+    assert df._index_map == {}
+
+
+def test_json():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=['x', 'y', 'z'], hash_index=True)
+    actual = rc.DataFrame.from_json(df.to_json())
+    assert actual.hash_index
+    check_map(actual)
+    assert_frame_equal(df, actual)
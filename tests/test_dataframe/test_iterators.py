@@ -1,6 +1,9 @@
 from collections import namedtuple
 
+import pytest
+
 import raccoon as rc
+from raccoon.containers import ChunkedList
 
 
 def test_iterrows():
@@ -57,3 +60,70 @@ def test_itertuples():
         actual.append(x)
 
     assert actual == expected
+
+
+def test_iterrows_columns():
+    df = rc.DataFrame({'first': [1, 2], 'second': ['a', 2], 'third': [3, 4]}, index=['hi', 'bye'],
+                      index_name='greet', columns=['first', 'second', 'third'])
+
+    assert list(df.iterrows(columns=['third', 'first'])) == [{'greet': 'hi', 'third': 3, 'first': 1},
+                                                             {'greet': 'bye', 'third': 4, 'first': 2}]
+    assert list(df.iterrows(index=False, columns=['second'])) == [{'second': 'a'}, {'second': 2}]
+    assert list(df.iterrows(index=False, columns=[])) == [{}, {}]
+
+    with pytest.raises(ValueError):
+        df.iterrows(columns=['bad'])
+
+
+def test_itertuples_plain_and_cached():
+    df = rc.DataFrame({'first': [1, 2], 'second': ['a', 2]}, index=['hi', 'bye'], index_name='greet',
+                      columns=['first', 'second'])
+
+    # plain tuples
+    actual = list(df.itertuples(name=None))
+    assert actual == [('hi', 1, 'a'), ('bye', 2, 2)]
+    assert type(actual[0]) is tuple
+    assert list(df.itertuples(index=False, name=None, columns=['second'])) == [('a',), (2,)]
+
+    # column projection
+    actual = list(df.itertuples(columns=['second']))
+    assert actual[0].greet == 'hi'
+    assert actual[0].second == 'a'
+    assert actual[0]._fields == ('greet', 'second')
+
+    # the namedtuple class is created once
+    assert type(next(df.itertuples())) is type(next(df.itertuples()))
+    assert type(next(df.itertuples())) is not type(next(df.itertuples(name='Other')))
+
+    # empty
+    assert list(rc.DataFrame(columns=['a']).itertuples()) == []
+
+
+def test_iterbatches():
+    df = rc.DataFrame({'first': [1, 2, 3, 4, 5], 'second': ['a', 'b', 'c', 'd', 'e']}, columns=['first', 'second'],
+                      index=[10, 11, 12, 13, 14])
+
+    actual = list(df.iterbatches(2))
+    assert actual == [{'index': [10, 11], 'first': [1, 2], 'second': ['a', 'b']},
+                      {'index': [12, 13], 'first': [3, 4], 'second': ['c', 'd']},
+                      {'index': [14], 'first': [5], 'second': ['e']}]
+
+    # batches are copies
+    actual[0]['first'][0] = 99
+    assert df.get_cell(10, 'first') == 1
+
+    assert list(df.iterbatches(10, index=False, columns=['second'])) == [{'second': ['a', 'b', 'c', 'd', 'e']}]
+    assert list(rc.DataFrame(columns=['a']).iterbatches(3)) == []
+
+    with pytest.raises(ValueError):
+        list(df.iterbatches(0))
+
+
+def test_iterators_dropin():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], dropin=ChunkedList, dtypes={'b': 'q'})
+
+    assert list(df.itertuples(name=None)) == [(0, 1, 4), (1, 2, 5), (2, 3, 6)]
+    assert list(df.iterrows(index=False)) == [{'a': 1, 'b': 4}, {'a': 2, 'b': 5}, {'a': 3, 'b': 6}]
+    actual = list(df.iterbatches(2))
+    assert actual == [{'index': [0, 1], 'a': [1, 2], 'b': [4, 5]}, {'index': [2], 'a': [3], 'b': [6]}]
+    assert all(type(x) is list for x in actual[0].values())
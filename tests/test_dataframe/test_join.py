@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+import raccoon as rc
+from raccoon.containers import ChunkedList
+from raccoon.utils import assert_frame_equal
+
+
+def test_join_index_sorted():
+    left = rc.DataFrame({'a': [1, 2, 3], 'x': [1, 1, 1]}, index=[1, 2, 4], columns=['a', 'x'], sort=True)
+    right = rc.DataFrame({'b': [10, 30, 50], 'x': [2, 2, 2]}, index=[1, 3, 4], columns=['b', 'x'], sort=True)
+
+    actual = left.join(right)
+    expected = rc.DataFrame({'a': [1, 3], 'x_left': [1, 1], 'b': [10, 50], 'x_right': [2, 2]}, index=[1, 4],
+                            columns=['a', 'x_left', 'b', 'x_right'], sort=True)
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, 'left', suffixes=('_l', '_r'))
+    expected = rc.DataFrame({'a': [1, 2, 3], 'x_l': [1, 1, 1], 'b': [10, None, 50], 'x_r': [2, None, 2]},
+                            index=[1, 2, 4], columns=['a', 'x_l', 'b', 'x_r'], sort=True)
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, 'outer')
+    expected = rc.DataFrame({'a': [1, 2, None, 3], 'x_left': [1, 1, None, 1], 'b': [10, None, 30, 50],
+                             'x_right': [2, None, 2, 2]}, index=[1, 2, 3, 4],
+                            columns=['a', 'x_left', 'b', 'x_right'], sort=True)
+    assert_frame_equal(actual, expected)
+
+    with pytest.raises(ValueError):
+        left.join(right, 'right')
+
+
+def test_join_index_hash():
+    left = rc.DataFrame({'a': [3, 2, 1]}, index=[4, 2, 1], sort=False, index_name='key')
+    right = rc.DataFrame({'b': [10, 30, 50]}, index=[1, 3, 4], sort=True)
+
+    actual = left.join(right)
+    expected = rc.DataFrame({'a': [3, 1], 'b': [50, 10]}, index=[4, 1], columns=['a', 'b'], sort=False,
+                            index_name='key')
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, 'outer')
+    expected = rc.DataFrame({'a': [3, 2, 1, None], 'b': [50, None, 10, 30]}, index=[4, 2, 1, 3],
+                            columns=['a', 'b'], sort=False, index_name='key')
+    assert_frame_equal(actual, expected)
+
+    # sorted left side with an unsorted right side stays sorted for inner and left
+    actual = right.join(left, 'left')
+    expected = rc.DataFrame({'b': [10, 30, 50], 'a': [1, None, 3]}, index=[1, 3, 4], columns=['b', 'a'], sort=True)
+    assert_frame_equal(actual, expected)
+
+
+def test_join_merge_matches_hash():
+    random.seed(0)
+    for how in ['inner', 'left', 'outer']:
+        left_index = sorted(random.sample(range(100), 40))
+        right_index = sorted(random.sample(range(100), 40))
+        left = rc.DataFrame({'a': list(range(40))}, index=left_index, sort=True)
+        right = rc.DataFrame({'b': list(range(40))}, index=right_index, sort=True)
+        merged = left.join(right, how)
+
+        left.sort = False
+        hashed = left.join(right, how)
+        hashed.sort_index()
+        assert merged.index == hashed.index
+        assert merged.data == hashed.data
+
+
+def test_join_columns():
+    left = rc.DataFrame({'k': ['p', 'q', 'p'], 'a': [1, 2, 3]}, columns=['k', 'a'])
+    right = rc.DataFrame({'k': ['p', 'p', 'z'], 'a': [10, 30, 50]}, columns=['a', 'k'])
+
+    actual = left.join(right, on='k')
+    expected = rc.DataFrame({'k': ['p', 'p', 'p', 'p'], 'a_left': [1, 1, 3, 3], 'a_right': [10, 30, 10, 30]},
+                            columns=['k', 'a_left', 'a_right'])
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, 'outer', on=['k'])
+    expected = rc.DataFrame({'k': ['p', 'p', 'q', 'p', 'p', 'z'], 'a_left': [1, 1, 2, 3, 3, None],
+                             'a_right': [10, 30, None, 10, 30, 50]}, columns=['k', 'a_left', 'a_right'])
+    assert_frame_equal(actual, expected)
+
+    # multiple key columns
+    left = rc.DataFrame({'k': [1, 1, 2], 'j': ['a', 'b', 'a'], 'v': [1, 2, 3]}, columns=['k', 'j', 'v'])
+    right = rc.DataFrame({'k': [1, 2], 'j': ['b', 'a'], 'w': [20, 30]}, columns=['k', 'j', 'w'])
+    actual = left.join(right, 'left', on=['k', 'j'])
+    expected = rc.DataFrame({'k': [1, 1, 2], 'j': ['a', 'b', 'a'], 'v': [1, 2, 3], 'w': [None, 20, 30]},
+                            columns=['k', 'j', 'v', 'w'])
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, on=['k', 'j'])
+    assert actual.data == [[1, 2], ['b', 'a'], [2, 3], [20, 30]]
+
+    # no matches
+    right = rc.DataFrame({'k': [9], 'j': ['z'], 'w': [1]}, columns=['k', 'j', 'w'])
+    actual = left.join(right, on=['k', 'j'])
+    assert actual.columns == ['k', 'j', 'v', 'w']
+    assert actual.index == []
+
+    with pytest.raises(ValueError):
+        left.join(right, on='bad')
+
+
+def test_join_dtypes_dropin():
+    left = rc.DataFrame({'a': [1.0, 2.0]}, index=[1, 2], dtypes={'a': 'd'}, sort=True)
+    right = rc.DataFrame({'b': [1, 3]}, index=[2, 3], dtypes={'b': 'q'}, sort=True)
+    actual = left.join(right, 'outer')
+    assert actual.dtypes == {'a': 'd', 'b': 'q'}
+    assert actual.data == [[1.0, 2.0, None], [None, 1, 3]]
+
+    left = rc.DataFrame({'a': [1, 2]}, index=ChunkedList([1, 2]), dropin=ChunkedList, sort=True)
+    right = rc.DataFrame({'b': [5, 6]}, index=ChunkedList([2, 3]), dropin=ChunkedList, sort=True)
+    actual = left.join(right, 'left')
+    assert actual.index == [1, 2]
+    assert actual.data == [[1, 2], [None, 5]]
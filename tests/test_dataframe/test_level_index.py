@@ -0,0 +1,148 @@
+import pytest
+
+import raccoon as rc
+
+
+def check_map(df):
+    assert df.level_index
+    df._level_locations(())  # an insert before the end rebuilds the level maps on the next lookup
+    expected = list()
+    for i, index in enumerate(df.index):
+        for level, value in enumerate(index):
+            if level == len(expected):
+                expected.append(dict())
+            expected[level].setdefault(value, set()).add(i)
+    assert df._level_map == expected
+
+
+def scan(df, compare):
+    # select_index without the level index
+    level_map = df._level_map
+    df._level_map = None
+    result = df.select_index(compare, 'value')
+    df._level_map = level_map
+    return result
+
+
+def make_index():
+    return [(s, d, v) for s in ['AAPL', 'MSFT', 'IBM'] for d in [1, 2, 3] for v in ['X', 'Y']]
+
+
+def test_default():
+    df = rc.DataFrame({'a': [1, 2]}, index=[('x', 1), ('y', 2)])
+    assert df.level_index is False
+    assert df._level_map is None
+
+    df.level_index = True
+    check_map(df)
+
+    df.level_index = False
+    assert df._level_map is None
+
+    with pytest.raises(TypeError):
+        rc.DataFrame({'a': [1, 2]}, level_index=True)
+
+
+def test_select_index():
+    index = make_index()
+    df = rc.DataFrame({'a': list(range(len(index)))}, index=index, index_name=('sym', 'date', 'venue'),
+                      level_index=True)
+    check_map(df)
+
+    for compare in [('AAPL', None, 'X'), ('MSFT', 2, 'Y'), (None, 3, None), (None, None, None), ('GOOG', None, None),
+                    ('IBM', 4, 'X'), (None, None, 'Y')]:
+        assert df.select_index(compare, 'value') == scan(df, compare)
+        assert df.select_index(compare) == [x in scan(df, compare) for x in df.index]
+
+    assert df.select_index(('AAPL', None, 'X'), 'value') == [('AAPL', 1, 'X'), ('AAPL', 2, 'X'), ('AAPL', 3, 'X')]
+    assert df.select_index(('IBM', 2, 'Y', 'extra'), 'value') == []
+    assert df.select_index(('IBM', 2, 'Y'), 'boolean').count(True) == 1
+    assert df.select_index(('IBM', 2, 'Y')) == df.select_index(('IBM', 2, 'Y'), 'boolean')
+
+
+def test_sync():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[('b', 2), ('a', 1), ('c', 3)], sort=False, level_index=True)
+
+    df.set_cell(('d', 1), 'a', 4)
+    df.set_row(('e', 2), {'a': 5})
+    df.set_column([('a', 1), ('f', 3), ('g', 1)], 'a', [11, 6, 7])
+    df.append_row(('h', 2), {'a': 8})
+    df.append_rows([('i', 3), ('j', 1)], {'a': [9, 10]})
+    check_map(df)
+    assert df.select_index((None, 1), 'value') == [('a', 1), ('d', 1), ('g', 1), ('j', 1)]
+
+    df.delete_rows([('a', 1), ('e', 2)])
+    check_map(df)
+    assert df.select_index((None, 1), 'value') == [('d', 1), ('g', 1), ('j', 1)]
+
+    df.sort_index()
+    check_map(df)
+    df.sort_columns('a', reverse=True)
+    check_map(df)
+    assert df.select_index((None, 2), 'value') == [('h', 2), ('b', 2)]
+
+    df.delete_all_rows()
+    check_map(df)
+    assert df.select_index((None, 2), 'value') == []
+
+    with pytest.raises(TypeError):
+        df.append_row('not a tuple', {'a': 1})
+
+
+def test_sorted():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[('b', 2), ('d', 1), ('f', 3)], sort=True, level_index=True)
+
+    df.set_cell(('c', 1), 'a', 4)
+    df.set_cell(('a', 3), 'a', 5)
+    check_map(df)
+    df.set_column([('e', 3), ('g', 2), ('a', 0)], 'a', [6, 7, 8])
+    check_map(df)
+    assert df.select_index((None, 3), 'value') == [('a', 3), ('e', 3), ('f', 3)]
+    assert df.get(df.select_index(('c', None)), 'a', as_list=True) == [4]
+
+    # inserts before the end only mark the level maps to be rebuilt, appends after that wait for the rebuild
+    df.set_cell(('b', 4), 'a', 9)
+    df.set_row(('c', 4), {'a': 10})
+    assert df._level_stale is True
+    df.append_row(('h', 4), {'a': 11})
+    assert df.select_index((None, 4), 'value') == [('b', 4), ('c', 4), ('h', 4)]
+    assert df._level_stale is False
+    check_map(df)
+
+
+def test_not_tuple():
+    # an index value that is not a tuple is rejected before any change
+    df = rc.DataFrame({'a': [1, 2]}, index=[('a', 1), ('b', 2)], sort=False, level_index=True, hash_index=True)
+    with pytest.raises(TypeError):
+        df.append_row('c', {'a': 3})
+    with pytest.raises(TypeError):
+        df.append_rows([('c', 3), 'd'], {'a': [3, 4]})
+    with pytest.raises(TypeError):
+        df.set_cell('c', 'a', 3)
+    assert df.index == [('a', 1), ('b', 2)]
+    assert df.get_entire_column('a', as_list=True) == [1, 2]
+    assert df._index_map == {('a', 1): 0, ('b', 2): 1}
+    check_map(df)
+
+    df = rc.DataFrame({'a': [1, 3]}, index=[('a', 1), ('c', 3)], sort=True, level_index=True)
+    with pytest.raises(TypeError):
+        df.set_cell('b', 'a', 2)
+    with pytest.raises(TypeError):
+        df.set_column([('b', 2), 'ba'], 'a', [2, 2])
+    assert df.index == [('a', 1), ('c', 3)]
+    check_map(df)
+
+
+def test_reset_index_json():
+    df = rc.DataFrame({'a': [1, 2]}, index=[('x', 1), ('y', 2)], index_name=('s', 'n'), level_index=True)
+
+    actual = rc.DataFrame.from_json(df.to_json())
+    check_map(actual)
+    assert actual.select_index(('y', None), 'value') == [('y', 2)]
+
+    df.reset_index()
+    assert df.level_index is False
+    assert df.index == [0, 1]
+
+    with pytest.raises(ValueError):
+        rc.RollingDataFrame(capacity=2).level_index = True
@@ -0,0 +1,144 @@
+import pytest
+
+import raccoon as rc
+from raccoon import math_utils
+from raccoon.containers import Mask
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(math_utils, 'np', None)
+    return request.param
+
+
+def test_to_array(use_numpy):
+    actual = math_utils.to_array([1, 2, 3])
+    if not use_numpy:
+        assert actual is None
+        return
+    assert actual.dtype == np.int64
+    assert math_utils.to_array([1.5, 2]).dtype == np.float64
+
+    # not numeric
+    assert math_utils.to_array([1, None]) is None
+    assert math_utils.to_array(['a', 'b']) is None
+    assert math_utils.to_array([True, False]) is None
+    assert math_utils.to_array([2 ** 70, 1]) is None
+
+    # TypedList is read without a copy
+    df = rc.DataFrame({'a': [1.0, 2.0]}, dtypes={'a': 'd'})
+    column = df.get_entire_column('a', as_list=True)
+    actual = math_utils.to_array(column)
+    column[0] = 5.0
+    assert actual.tolist() == [5.0, 2.0]
+    assert math_utils.to_array(rc.DataFrame({'a': [1.0, None]}, dtypes={'a': 'd'}).data[0]) is None
+
+
+def test_arithmetic(use_numpy):
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8], 'f': [0.5, 1.5, 2.5, 3.5]}, columns=['a', 'b', 'f'])
+
+    actual = df.add('a', 'b')
+    assert actual == [6, 8, 10, 12]
+    assert type(actual) is list and all(type(x) is int for x in actual)
+    assert df.subtract('a', 'b', [1, 2]) == [-4, -4]
+    assert df.multiply('a', 'f', [True, False, False, True]) == [0.5, 14.0]
+    assert df.divide('a', 'b') == [1 / 5, 2 / 6, 3 / 7, 4 / 8]
+
+    # integers that could overflow int64 keep the exact python result
+    df = rc.DataFrame({'a': [2 ** 62, 3], 'b': [2 ** 62, 2 ** 40]}, columns=['a', 'b'])
+    assert df.add('a', 'b') == [2 ** 63, 3 + 2 ** 40]
+    assert df.multiply('a', 'b') == [2 ** 124, 3 * 2 ** 40]
+
+    # division by zero raises the same as python
+    df = rc.DataFrame({'a': [1, 2], 'b': [1, 0]}, columns=['a', 'b'])
+    with pytest.raises(ZeroDivisionError):
+        df.divide('a', 'b')
+
+    # not numeric
+    df = rc.DataFrame({'a': ['a', 'b'], 'b': ['c', 'd']}, columns=['a', 'b'])
+    assert df.add('a', 'b') == ['ac', 'bd']
+
+    # typed columns
+    df = rc.DataFrame({'a': [1.0, 2.0], 'b': [1, 2]}, columns=['a', 'b'], dtypes={'a': 'f', 'b': 'b'})
+    assert df.add('a', 'b') == [2.0, 4.0]
+    assert df.multiply('b', 'b') == [1, 4]
+
+
+def test_as_array(use_numpy):
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': ['x', 'y', 'x']}, columns=['a', 'b', 'c'])
+    if not use_numpy:
+        with pytest.raises(ImportError):
+            df.add('a', 'b', as_array=True)
+        with pytest.raises(ImportError):
+            df.equality('a', value=1, as_array=True)
+        with pytest.raises(ImportError):
+            df.isin('a', [1], as_array=True)
+        return
+
+    actual = df.add('a', 'b', as_array=True)
+    assert isinstance(actual, np.ndarray)
+    assert actual.tolist() == [5, 7, 9]
+    assert df.divide('b', 'a', as_array=True).tolist() == [4.0, 2.5, 2.0]
+    assert df.add('c', 'c', as_array=True).tolist() == ['xx', 'yy', 'xx']
+
+    actual = df.equality('a', value=2, as_array=True)
+    assert actual.dtype == bool
+    assert actual.tolist() == [False, True, False]
+    assert df.equality('c', value='x', as_array=True).tolist() == [True, False, True]
+
+    assert df.isin('a', [1, 3], as_array=True).tolist() == [True, False, True]
+    assert df.isin('c', ['y'], as_array=True).tolist() == [False, True, False]
+
+
+def test_equality_isin(use_numpy):
+    df = rc.DataFrame({'a': [1, 2, 3, 2], 'b': [1.0, 2.5, None, 2.5], 'c': ['x', 2, 'y', 2]}, columns=['a', 'b', 'c'])
+
+    actual = df.equality('a', value=2)
+    assert isinstance(actual, Mask)
+    assert actual == [False, True, False, True]
+    assert df.equality('a', [0, 1], 2) == [False, True]
+    assert df.equality('a', value=2.0) == [False, True, False, True]
+    assert df.equality('a', value=2 ** 70) == [False] * 4
+    assert df.equality('b', value=2.5) == [False, True, False, True]
+    assert df.equality('c', value=2) == [False, True, False, True]
+
+    actual = df.isin('a', [2, 3])
+    assert isinstance(actual, Mask)
+    assert actual == [False, True, True, True]
+    assert df.isin('a', []) == [False] * 4
+    assert df.isin('a', [1, 'x']) == [True, False, False, False]
+    assert df.isin('c', ['x', 2]) == [True, True, False, True]
+
+
+def test_equality_isin_lists(monkeypatch):
+    # python lists only use NumPy for array results, typed columns use NumPy for masks too
+    arrays = list()
+    to_array = math_utils.to_array
+    monkeypatch.setattr(math_utils, 'to_array', lambda values: arrays.append(values) or to_array(values))
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.0, 3.0]}, columns=['a', 'b'], dtypes={'b': 'd'})
+
+    assert df.equality('a', value=2) == [False, True, False]
+    assert df.isin('a', [1, 3]) == [True, False, True]
+    assert arrays == []
+
+    assert df.equality('a', value=2, as_array=True).tolist() == [False, True, False]
+    assert df.equality('b', value=2.0) == [False, True, False]
+    assert df.isin('b', [1.0, 3.0]) == [True, False, True]
+    assert len(arrays) == 3
+
+
+def test_series(use_numpy):
+    srs = rc.Series([1, 2, 3, 2])
+
+    actual = srs.equality(value=2)
+    assert isinstance(actual, Mask)
+    assert actual == [False, True, False, True]
+    assert srs.equality([1, 2], 2) == [True, False]
+    assert srs.isin([1, 3]) == [True, False, True, False]
+
+    if use_numpy:
+        assert srs.equality(value=2, as_array=True).tolist() == [False, True, False, True]
+        assert srs.isin([1, 3], as_array=True).tolist() == [True, False, True, False]
@@ -0,0 +1,78 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def test_numeric():
+    df = rc.DataFrame({'a': [1, 2, 3, None, 5], 'b': [1.0, 2.0, 3.0, 4.0, 5.0]}, columns=['a', 'b'],
+                      index=[0.5, 1.2, 2.9, 3.0, 7.1], sort=True)
+
+    resample = df.resample(2)
+    assert len(resample) == 3
+    assert resample.groups == {0: range(0, 2), 2: range(2, 4), 6: range(4, 5)}
+
+    actual = resample.agg({'a': 'sum', 'b': ['count', 'mean']})
+    expected = rc.DataFrame({'a': [3, 3, 5], ('b', 'count'): [2, 2, 1], ('b', 'mean'): [1.5, 3.5, 5.0]},
+                            columns=['a', ('b', 'count'), ('b', 'mean')], index=[0, 2, 6], sort=True)
+    assert_frame_equal(actual, expected)
+
+    # origin moves the bucket edges
+    assert df.resample(2, origin=1).groups == {-1: range(0, 1), 1: range(1, 3), 3: range(3, 4), 7: range(4, 5)}
+
+    # every row in its own bucket
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[1, 2, 3], sort=True)
+    assert df.resample(1).groups == {1: range(0, 1), 2: range(1, 2), 3: range(2, 3)}
+
+
+def test_datetime():
+    index = [datetime(2020, 1, 1, 9, 30, 0), datetime(2020, 1, 1, 9, 30, 10), datetime(2020, 1, 1, 9, 30, 50),
+             datetime(2020, 1, 1, 9, 31, 5), datetime(2020, 1, 1, 9, 33, 1)]
+    df = rc.DataFrame({'price': [10, 11, 9, 12, 13], 'size': [1, 2, 3, 4, 5]}, columns=['price', 'size'],
+                      index=index, index_name='time', sort=True)
+
+    actual = df.resample(timedelta(minutes=1)).agg({'price': ['first', 'max', 'min', 'last'], 'size': 'sum'})
+    expected = rc.DataFrame({('price', 'first'): [10, 12, 13], ('price', 'max'): [11, 12, 13],
+                             ('price', 'min'): [9, 12, 13], ('price', 'last'): [9, 12, 13], 'size': [6, 4, 5]},
+                            columns=[('price', 'first'), ('price', 'max'), ('price', 'min'), ('price', 'last'),
+                                     'size'],
+                            index=[datetime(2020, 1, 1, 9, 30), datetime(2020, 1, 1, 9, 31),
+                                   datetime(2020, 1, 1, 9, 33)], index_name='time', sort=True)
+    assert_frame_equal(actual, expected)
+
+    # timezone aware
+    index = [datetime(2020, 1, 1, 9, 30, 5, tzinfo=timezone.utc), datetime(2020, 1, 1, 10, 45, tzinfo=timezone.utc)]
+    df = rc.DataFrame({'a': [1, 2]}, index=index, sort=True)
+    assert list(df.resample(timedelta(hours=1)).groups) == [datetime(2020, 1, 1, 9, tzinfo=timezone.utc),
+                                                            datetime(2020, 1, 1, 10, tzinfo=timezone.utc)]
+
+    # dates
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[date(2020, 1, 1), date(2020, 1, 2), date(2020, 1, 9)], sort=True)
+    assert df.resample(timedelta(days=2)).agg({'a': 'sum'}).to_dict(index=False) == {'a': [3, 3]}
+
+
+def test_first_last():
+    df = rc.DataFrame({'a': [None, 2, 3, None]}, index=[0, 1, 2, 3], sort=True)
+    actual = df.resample(10).agg({'a': ['first', 'last']})
+    assert actual.get_cell(0, ('a', 'first')) == 2
+    assert actual.get_cell(0, ('a', 'last')) == 3
+
+    actual = df.resample(1).agg({'a': 'first'})
+    assert actual.to_dict(index=False) == {'a': [None, 2, 3, None]}
+
+
+def test_exceptions():
+    df = rc.DataFrame({'a': [1, 2]}, index=[2, 1], sort=False)
+    with pytest.raises(ValueError):
+        df.resample(1)
+
+
+def test_empty():
+    df = rc.DataFrame(columns=['a'], sort=True)
+    resample = df.resample(1)
+    assert len(resample) == 0
+    actual = resample.agg({'a': 'sum'})
+    assert actual.index == []
+    assert actual.columns == ['a']
@@ -0,0 +1,185 @@
+from io import StringIO
+
+import pytest
+
+import raccoon as rc
+from raccoon.containers import RingBuffer
+from raccoon.utils import assert_frame_equal
+
+
+def check_rings(df):
+    assert isinstance(df.index, RingBuffer)
+    assert all([isinstance(x, RingBuffer) for x in df.data])
+    assert all([x.capacity == df.capacity for x in df.data])
+    df.validate_integrity()
+
+
+def test_initialize():
+    df = rc.RollingDataFrame(capacity=3)
+    check_rings(df)
+    assert df.capacity == 3
+    assert not df.full
+    assert df.hash_index is False
+    assert df.dropin is None
+
+    df = rc.RollingDataFrame({'a': [1, 2, 3, 4, 5], 'b': [6, 7, 8, 9, 10]}, index=[9, 8, 7, 6, 5], columns=['a', 'b'],
+                             capacity=3, sort=True)
+    check_rings(df)
+    assert df.full
+    assert df.index == [5, 6, 7]
+    assert df.data == [[5, 4, 3], [10, 9, 8]]
+
+    df = rc.RollingDataFrame(columns=['a', 'b'], index=[1, 2], capacity=2)
+    check_rings(df)
+    assert df.data == [[None, None], [None, None]]
+
+    with pytest.raises(ValueError):
+        rc.RollingDataFrame()
+
+    with pytest.raises(ValueError):
+        rc.RollingDataFrame(capacity=0)
+
+    with pytest.raises(ValueError):
+        df.hash_index = True
+    df.hash_index = False
+
+
+def test_append_row_evicts():
+    df = rc.RollingDataFrame(columns=['a', 'b'], capacity=3, sort=False)
+    for x in range(3):
+        df.append_row(x, {'a': x, 'b': -x})
+    assert df.full
+    assert df.index == [0, 1, 2]
+
+    df.append_row(3, {'a': 3, 'c': 'new'})
+    check_rings(df)
+    assert df.index == [1, 2, 3]
+    assert df.columns == ['a', 'b', 'c']
+    assert df.data == [[1, 2, 3], [-1, -2, None], [None, None, 'new']]
+
+    with pytest.raises(IndexError):
+        df.append_row(2, {'a': 0})
+
+
+def test_append_rows_evicts():
+    df = rc.RollingDataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], capacity=3, sort=False)
+    df.append_rows([3, 4], {'a': [7, 8], 'b': [9]})
+    check_rings(df)
+    assert df.index == [2, 3, 4]
+    assert df.data == [[3, 7, 8], [6, 9, None]]
+
+    df.append_rows([5, 6, 7, 8], {'a': [1, 2, 3, 4]})
+    check_rings(df)
+    assert df.index == [6, 7, 8]
+    assert df.data == [[2, 3, 4], [None, None, None]]
+
+
+def test_set_evicts():
+    df = rc.RollingDataFrame({'a': [1, 2]}, index=[10, 20], capacity=3, sort=True)
+
+    df.set_cell(15, 'a', 15)
+    assert df.index == [10, 15, 20]
+
+    df.set_cell(30, 'a', 3)
+    df.set_row(40, {'a': 4})
+    df.set(50, 'b', 'x')
+    check_rings(df)
+    assert df.index == [30, 40, 50]
+    assert df.data == [[3, 4, None], [None, None, 'x']]
+
+    df.set_column([60, 40], 'a', [6, 44])
+    check_rings(df)
+    assert df.index == [40, 50, 60]
+    assert df.data == [[44, None, 6], [None, 'x', None]]
+
+    # no room to insert before the end when full
+    with pytest.raises(IndexError):
+        df.set_cell(45, 'a', 0)
+
+    df = rc.RollingDataFrame({'a': [1, 2]}, index=['x', 'y'], capacity=2, sort=False)
+    df.set_cell('z', 'a', 3)
+    df.set_column(values=[7, 8], column='b')
+    df.set_column(column='a', values=0)
+    check_rings(df)
+    assert df.index == ['y', 'z']
+    assert df.data == [[0, 0], [7, 8]]
+
+
+def test_get():
+    df = rc.RollingDataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, columns=['a', 'b'], capacity=3, sort=True)
+
+    expected = rc.DataFrame({'a': [2, 3, 4]}, index=[0, 1, 2], sort=True)
+    assert_frame_equal(df.get_entire_column('a'), expected)
+    assert_frame_equal(df.get(indexes=[True, True, True], columns='a'), expected)
+    assert df['a'].data == [[2, 3, 4]]
+    assert df.get_entire_column('a', as_list=True) is df.data[0]
+
+    assert df.get(1, 'b') == 7
+    assert df.get(2, as_dict=True) == {'index': 2, 'a': 4, 'b': 8}
+    assert df.get_location(-1, 'a') == 4
+    assert_frame_equal(df[1:2], rc.DataFrame({'a': [3, 4], 'b': [7, 8]}, columns=['a', 'b'], index=[1, 2], sort=True))
+    assert df.head(1).index == [0]
+    assert df.tail(1).index == [2]
+
+
+def test_delete_sort():
+    df = rc.RollingDataFrame({'a': [3, 1, 2], 'b': [4, 5, 6]}, columns=['a', 'b'], index=['x', 'y', 'z'], capacity=3)
+    df.sort_columns('a')
+    check_rings(df)
+    assert df.index == ['y', 'z', 'x']
+
+    df.delete_rows(['y', 'x'])
+    check_rings(df)
+    assert df.index == ['z']
+    assert df.data == [[2], [6]]
+
+    df.delete_all_rows()
+    check_rings(df)
+    assert df.index == []
+
+    df.append_rows([1, 2], {'a': [1, 2], 'b': [3, 4]})
+    df.reset_index()
+    check_rings(df)
+    assert df.columns == ['a', 'b', 'index_0']
+    assert df.index == [0, 1]
+
+    df.delete_columns(['a', 'b', 'index_0'])
+    check_rings(df)
+    assert df.index == []
+
+
+def test_view_series():
+    df = rc.RollingDataFrame(columns=['a'], capacity=3, sort=True)
+    for x in range(3):
+        df.append_row(x, {'a': x * 10})
+
+    view = rc.ViewSeries.from_dataframe(df, 'a', offset=1)
+    assert view.value(1) == 0
+    assert view.value(3) == 20
+    assert view[1:3] == [0, 10, 20]
+
+    df.append_row(3, {'a': 30})
+    df.set_cell(4, 'a', 40)
+    assert view.index == [2, 3, 4]
+    assert view.value(1) == 20
+    assert view.value(3) == 40
+    assert view.value(4, int_as_index=True) == 40
+    assert view.get(3) == 30
+    assert view.value(0) == 40  # offset semantics are the same as for a list, -1 is the last value
+
+
+def test_json():
+    df = rc.RollingDataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['b', 'a'], index_name='i', capacity=5)
+    df.append_row(3, {'a': 7})
+
+    actual = rc.RollingDataFrame.from_json(df.to_json())
+    check_rings(actual)
+    assert actual.capacity == 5
+    assert_frame_equal(actual, df)
+
+    file = StringIO()
+    df.to_json_file(file)
+    actual = rc.RollingDataFrame.from_json_file(StringIO(file.getvalue()))
+    check_rings(actual)
+    assert actual.capacity == 5
+    assert_frame_equal(actual, df)
@@ -199,6 +199,27 @@ def test_set_column_sorted():
         actual.set(columns='e', values=[1, 2, 3, 4])
 
 
+def test_set_column_sorted_bulk_insert():
+    actual = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=[10, 20, 30], columns=['a', 'b'], sort=True)
+    link_index = actual.index
+    link_col = actual.get_entire_column('a', as_list=True)
+
+    # new rows before, between and after the existing rows, with an existing row and a duplicate
+    actual.set(columns='b', indexes=[35, 5, 15, 20, 25, 16, 5], values=[350, 50, 150, 200, 250, 160, 51])
+    assert actual.index == [5, 10, 15, 16, 20, 25, 30, 35]
+    assert actual.data == [[None, 1, None, None, 2, None, 3, None], [51, 4, 150, 160, 200, 250, 6, 350]]
+
+    # the index and column lists are updated in place
+    assert link_index is actual.index
+    assert link_col == [None, 1, None, None, 2, None, 3, None]
+
+    # new rows and a new column
+    actual.set(columns='c', indexes=[1, 40], values=['x', 'y'])
+    assert actual.index == [1, 5, 10, 15, 16, 20, 25, 30, 35, 40]
+    assert actual.get_entire_column('c', as_list=True) == ['x'] + [None] * 8 + ['y']
+    actual.validate_integrity()
+
+
 def test_set_col_index_subset():
     actual = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': [7, 8, 9]}, index=[10, 11, 12], columns=['a', 'b', 'c'],
                           sort=False)
@@ -351,6 +372,34 @@ def test_set_locations():
     df.set_locations([1, 3], 'a', -10)
     assert_frame_equal(df, rc.DataFrame({'a': [-1, -10, -3, -10], 'b': [5, 6, 7, 8]}, index=[2, 4, 6, 8]))
 
+    # slices
+    df.set_locations(slice(1, 3), 'b', [60, 70])
+    df.set_locations(slice(None, None, 3), 'a', 0)
+    df.set_locations(slice(-1, None), 'c', ['z'])
+    assert_frame_equal(df, rc.DataFrame({'a': [0, -10, -3, 0], 'b': [5, 60, 70, 8], 'c': [None, None, None, 'z']},
+                                        index=[2, 4, 6, 8], columns=['a', 'b', 'c']))
+
+    # nothing is set if any location is out of range
+    with pytest.raises(IndexError):
+        df.set_locations([1, 10], 'a', [9, 99])
+    with pytest.raises(IndexError):
+        df.set_locations([-5], 'a', 9)
+    assert df.get_entire_column('a', as_list=True) == [0, -10, -3, 0]
+
+    with pytest.raises(ValueError):
+        df.set_locations(slice(0, 2), 'a', [1, 2, 3])
+
+    # a range of negative locations
+    df.set_locations(range(-2, 0), 'b', [-7, -8])
+    assert df.get_entire_column('b', as_list=True) == [5, 60, -7, -8]
+
+    # typed columns
+    df = rc.DataFrame({'a': [1.0, None, 3.0, 4.0]}, index=[2, 4, 6, 8], dtypes={'a': 'd'})
+    df.set_locations(slice(0, 2), 'a', [1.5, 2.5])
+    df.set_locations(slice(2, None), 'a', [None, 4.5])
+    assert df.get_entire_column('a', as_list=True) == [1.5, 2.5, None, 4.5]
+    assert df.dtypes == {'a': 'd'}
+
 
 def test_set_from_blank_df():
     # single cell
@@ -447,6 +496,63 @@ def test_append_rows():
         actual.append_rows([16, 17], {'a': [14, 15, 999]})
 
 
+def test_append_duplicates():
+    for sort, hash_index in [(False, False), (False, True), (True, False), (True, True)]:
+        actual = rc.DataFrame({'a': [1, 3]}, index=[10, 12], sort=sort, hash_index=hash_index)
+
+        actual.append_row(14, {'a': 5})
+        actual.append_rows([20, 22], {'a': [7, 6]})
+        if not sort:  # new index in the middle of the existing index
+            actual.append_row(11, {'a': 2})
+
+        for index in [10, 12, 14, 20, 22]:
+            with pytest.raises(IndexError):
+                actual.append_row(index, {'a': 0})
+
+        # duplicates with the existing index or within the new indexes
+        with pytest.raises(IndexError):
+            actual.append_rows([30, 12], {'a': [0, 0]})
+        with pytest.raises(IndexError):
+            actual.append_rows([30, 30], {'a': [0, 0]})
+
+        assert actual.index == ([10, 12, 14, 20, 22] if sort else [10, 12, 14, 20, 22, 11])
+        actual.validate_integrity()
+
+        # append of DataFrames
+        with pytest.raises(ValueError):
+            actual.append(rc.DataFrame({'a': [0, 0]}, index=[40, 14]))
+        actual.append(rc.DataFrame({'a': [0, 0]}, index=[40, 41]))
+        assert actual.index[-2:] == [40, 41]
+
+
+def test_append_duplicates_out_of_order():
+    # append_row leaves a sorted object out of order, so the last index value is not the largest
+    actual = rc.DataFrame({'a': [1, 2]}, index=[1, 5], sort=True)
+    actual.append_row(3, {'a': 3})
+    assert actual.index == [1, 5, 3]
+
+    with pytest.raises(IndexError):
+        actual.append_row(5, {'a': 3})
+
+    with pytest.raises(IndexError):
+        actual.append_rows([4, 5], {'a': [4, 6]})
+    assert actual.index == [1, 5, 3]
+
+    # sorting puts the object back in order
+    actual.sort_index()
+    actual.append_row(6, {'a': 3})
+    assert actual.index == [1, 3, 5, 6]
+    with pytest.raises(IndexError):
+        actual.append_row(5, {'a': 3})
+
+    # append_rows leaves a sorted object out of order
+    actual = rc.DataFrame({'a': [1, 2]}, index=[1, 5], sort=True)
+    actual.append_rows([2, 3], {'a': [2, 3]})
+    assert actual.index == [1, 5, 2, 3]
+    with pytest.raises(IndexError):
+        actual.append_row(5, {'a': 3})
+
+
 def test_bar():
     df = rc.DataFrame(columns=['datetime', 'open', 'high', 'low', 'close', 'volume'], sort=True)
     for x in range(10):
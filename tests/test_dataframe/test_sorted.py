@@ -33,3 +33,65 @@ def test_sorted_index():
 
     with pytest.raises(ValueError):
         rc.dataframe.sorted_index(a, 3)
+
+
+def test_sorted_insert_locations():
+    a = [1, 3, 5, 7]
+
+    assert rc.sort_utils.sorted_insert_locations(a, []) == []
+    assert rc.sort_utils.sorted_insert_locations(a, [0, 2, 4, 8]) == [0, 1, 2, 4]
+    assert rc.sort_utils.sorted_insert_locations(a, [2, 2.5, 6]) == [1, 1, 3]
+    assert rc.sort_utils.sorted_insert_locations([], [1, 2]) == [0, 0]
+
+
+def test_splice_values():
+    a = [1, 3, 5, 7]
+
+    new = [0, 2, 4, 8]
+    actual = rc.sort_utils.splice_values(a, rc.sort_utils.sorted_insert_locations(a, new), new)
+    assert actual == [0, 1, 2, 3, 4, 5, 7, 8]
+
+    actual = rc.sort_utils.splice_values(a, [1, 1, 3], ['x', 'y', 'z'])
+    assert actual == [1, 'x', 'y', 3, 5, 'z', 7]
+
+    assert rc.sort_utils.splice_values(a, [], []) == a
+
+
+def test_sorted_asof():
+    a = [1, 3, 3, 5, 7]
+
+    assert rc.sort_utils.sorted_asof(a, 0) == -1
+    assert rc.sort_utils.sorted_asof(a, 1) == 0
+    assert rc.sort_utils.sorted_asof(a, 2) == 0
+    assert rc.sort_utils.sorted_asof(a, 3) == 2
+    assert rc.sort_utils.sorted_asof(a, 6) == 3
+    assert rc.sort_utils.sorted_asof(a, 100) == 4
+    assert rc.sort_utils.sorted_asof([], 1) == -1
+
+
+def test_sorted_asof_locations():
+    a = [1, 3, 5, 7]
+
+    assert rc.sort_utils.sorted_asof_locations(a, []) == []
+    assert rc.sort_utils.sorted_asof_locations(a, [0, 1, 2, 5, 5, 9]) == [-1, 0, 0, 2, 2, 3]
+    assert rc.sort_utils.sorted_asof_locations(a, [9, 0, 4, 1]) == [3, -1, 1, 0]
+    assert rc.sort_utils.sorted_asof_locations([], [1, 2]) == [-1, -1]
+
+    new = list(range(-1, 10))
+    assert rc.sort_utils.sorted_asof_locations(a, new) == [rc.sort_utils.sorted_asof(a, x) for x in new]
+
+
+def test_sorted_merge_locations():
+    left = [1, 2, 4, 6]
+    right = [0, 2, 3, 4, 7]
+
+    assert rc.sort_utils.sorted_merge_locations(left, right, 'inner') == ([2, 4], [1, 2], [1, 3])
+    assert rc.sort_utils.sorted_merge_locations(left, right, 'left') == ([1, 2, 4, 6], [0, 1, 2, 3],
+                                                                         [None, 1, 3, None])
+    assert rc.sort_utils.sorted_merge_locations(left, right, 'outer') == \
+        ([0, 1, 2, 3, 4, 6, 7], [None, 0, 1, None, 2, 3, None], [0, None, 1, 2, 3, None, 4])
+
+    assert rc.sort_utils.sorted_merge_locations([], right, 'inner') == ([], [], [])
+    assert rc.sort_utils.sorted_merge_locations([], right, 'left') == ([], [], [])
+    assert rc.sort_utils.sorted_merge_locations(left, [], 'left') == (left, [0, 1, 2, 3], [None] * 4)
+    assert rc.sort_utils.sorted_merge_locations([], [1], 'outer') == ([1], [None], [0])
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+import pytest
+
+import raccoon as rc
+from raccoon.containers import ChunkedList
+from raccoon.utils import assert_frame_equal
+
+
+@pytest.fixture(params=['sort', 'hash', 'unsorted'])
+def df(request):
+    return rc.DataFrame({'a': [1, 2, 3, 4, 5], 'b': [6, 7, 8, 9, 10], 'c': list('vwxyz')}, columns=['a', 'b', 'c'],
+                        index=[10, 11, 12, 13, 14], sort=request.param == 'sort',
+                        hash_index=request.param == 'hash')
+
+
+def test_view(df):
+    view = df.view(1, 4, ['c', 'a'])
+    assert isinstance(view, rc.ViewDataFrame)
+    assert len(view) == 3
+    assert view.dataframe is df
+    assert view.start == 1
+    assert view.stop == 4
+    assert view.columns == ['c', 'a']
+    assert view.index == [11, 12, 13]
+    assert view.index_name == 'index'
+    assert view.sort == df.sort
+
+    # defaults and negative locations
+    view = df.view()
+    assert view.index == df.index
+    assert view.columns == ['a', 'b', 'c']
+    assert df.view(-2).index == [13, 14]
+    assert df.view(stop=-3).index == [10, 11]
+    assert len(df.view(4, 2)) == 0
+
+    with pytest.raises(ValueError):
+        df.view(columns=['a', 'bad'])
+
+
+def test_get_cell(df):
+    view = df.view(1, 4, ['c', 'a'])
+    assert view.get_cell(11, 'a') == 2
+    assert view.get_cell(13, 'c') == 'y'
+
+    with pytest.raises(ValueError):
+        view.get_cell(10, 'a')  # index not in view
+    with pytest.raises(ValueError):
+        view.get_cell(14, 'a')
+    with pytest.raises(ValueError):
+        view.get_cell(99, 'a')
+    with pytest.raises(ValueError):
+        view.get_cell(11, 'b')  # column not in view
+
+
+def test_get_location(df):
+    view = df.view(1, 4, ['c', 'a'])
+    assert view.get_location(0, 'a') == 2
+    assert view.get_location(-1, 'c') == 'y'
+    assert view.get_location(1, as_dict=True) == {'index': 12, 'c': 'x', 'a': 3}
+    assert view.get_location(1, ['a'], as_dict=True, index=False) == {'a': 3}
+
+    actual = view.get_location(2)
+    expected = rc.DataFrame({'c': ['y'], 'a': [4]}, columns=['c', 'a'], index=[13], sort=df.sort)
+    assert_frame_equal(actual, expected)
+
+    with pytest.raises(IndexError):
+        view.get_location(3)
+    with pytest.raises(IndexError):
+        view.get_location(-4)
+    with pytest.raises(ValueError):
+        view.get_location(0, 'b')
+    with pytest.raises(ValueError):
+        view.get_location(0, ['a', 'b'])
+
+
+def test_iterrows_to_dict(df):
+    view = df.view(1, 3, ['c', 'a'])
+    assert list(view.iterrows()) == [{'index': 11, 'c': 'w', 'a': 2}, {'index': 12, 'c': 'x', 'a': 3}]
+    assert list(view.iterrows(index=False)) == [{'c': 'w', 'a': 2}, {'c': 'x', 'a': 3}]
+    assert list(df.view(2, 2).iterrows()) == []
+    assert list(df.view(1, 3, []).iterrows(index=False)) == [{}, {}]
+
+    assert view.to_dict() == {'index': [11, 12], 'c': ['w', 'x'], 'a': [2, 3]}
+    actual = view.to_dict(index=False, ordered=True)
+    assert actual == OrderedDict([('c', ['w', 'x']), ('a', [2, 3])])
+    assert list(actual.keys()) == ['c', 'a']
+    assert view.get_entire_column('a') == [2, 3]
+
+    expected = rc.DataFrame({'c': ['w', 'x'], 'a': [2, 3]}, columns=['c', 'a'], index=[11, 12], sort=df.sort)
+    assert_frame_equal(view.to_dataframe(), expected)
+
+
+def test_live(df):
+    view = df.view(0, 2, ['a'])
+    df.set_cell(11, 'a', 100)
+    assert view.get_cell(11, 'a') == 100
+    df.set_column(column='a', values=[5, 4, 3, 2, 1])  # replaces the column list
+    assert view.get_entire_column('a') == [5, 4]
+
+    # the view is of fixed locations
+    df.delete_rows([10])
+    assert view.index == [11, 12]
+
+
+def test_get_slice():
+    df = rc.DataFrame({'a': [1, 2, 3, 4, 5]}, index=[10, 11, 12, 13, 14], sort=True)
+    view = df.get_slice(11, 13, as_view=True)
+    assert isinstance(view, rc.ViewDataFrame)
+    assert view.to_dict() == df.get_slice(11, 13).to_dict()
+    assert df.get_slice(10.5, None, ['a'], as_view=True).index == [11, 12, 13, 14]
+    assert len(df.get_slice(20, 30, as_view=True)) == 0
+
+
+def test_dropin():
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[1, 2, 3], dropin=ChunkedList)
+    view = df.view(1)
+    assert view.to_dict() == {'index': [2, 3], 'a': [2, 3]}
+    assert isinstance(view.to_dict()['a'], list)
+    assert view.get_cell(3, 'a') == 3
+
+
+def test_print(capsys):
+    df = rc.DataFrame({'a': [1, 2, 3]}, index=[1, 2, 3])
+    view = df.view(1)
+    view.print()
+    captured = capsys.readouterr()
+    assert captured.out == str(view) + '\n'
+    assert '  index    a' in captured.out
+    assert 'dataframe id' in repr(view)
@@ -0,0 +1,234 @@
+"""
+unit tests for the ChunkedList container
+"""
+
+import pickle
+import random
+
+import pytest
+
+from raccoon.containers import ChunkedList
+
+
+def check_equal(actual, expected):
+    assert len(actual) == len(expected)
+    assert list(actual) == expected
+    assert actual == expected
+    assert [actual[i] for i in range(len(expected))] == expected
+    assert [actual[-i] for i in range(1, len(expected) + 1)] == [expected[-i] for i in range(1, len(expected) + 1)]
+    assert all([len(x) > 0 for x in actual._lists])
+
+
+def test_init():
+    actual = ChunkedList()
+    assert actual == []
+    assert len(actual) == 0
+    assert not actual
+
+    actual = ChunkedList([1, 2, 3])
+    check_equal(actual, [1, 2, 3])
+
+    actual = ChunkedList(range(25), load=4)
+    check_equal(actual, list(range(25)))
+    assert len(actual._lists) == 7
+
+    with pytest.raises(ValueError):
+        ChunkedList(load=1)
+
+
+def test_getitem():
+    expected = list(range(100))
+    actual = ChunkedList(expected, load=4)
+
+    assert actual[0] == 0
+    assert actual[50] == 50
+    assert actual[-1] == 99
+
+    with pytest.raises(IndexError):
+        actual[100]
+
+    with pytest.raises(IndexError):
+        actual[-101]
+
+    for start, stop, step in [(None, None, None), (3, 17, None), (10, 90, 3), (None, None, -1), (-10, None, None),
+                              (50, 10, None), (90, 200, None)]:
+        result = actual[start:stop:step]
+        assert isinstance(result, ChunkedList)
+        assert result == expected[start:stop:step]
+
+
+def test_setitem():
+    expected = list(range(20))
+    actual = ChunkedList(expected, load=2)
+
+    actual[5] = 'five'
+    actual[-1] = 'last'
+    expected[5] = 'five'
+    expected[-1] = 'last'
+    check_equal(actual, expected)
+
+    actual[2:8] = ['a', 'b']
+    expected[2:8] = ['a', 'b']
+    check_equal(actual, expected)
+
+    with pytest.raises(IndexError):
+        actual[100] = 1
+
+
+def test_delitem():
+    expected = list(range(50))
+    actual = ChunkedList(expected, load=4)
+
+    del actual[10]
+    del expected[10]
+    del actual[-1]
+    del expected[-1]
+    check_equal(actual, expected)
+
+    del actual[5:25]
+    del expected[5:25]
+    check_equal(actual, expected)
+
+    del actual[::2]
+    del expected[::2]
+    check_equal(actual, expected)
+
+    while expected:
+        del actual[0]
+        del expected[0]
+        check_equal(actual, expected)
+
+    with pytest.raises(IndexError):
+        del actual[0]
+
+    actual = ChunkedList(range(10))
+    del actual[:]
+    check_equal(actual, [])
+
+
+def test_insert_append_extend():
+    expected = list()
+    actual = ChunkedList(load=3)
+
+    actual.append(1)
+    expected.append(1)
+    actual.insert(0, 0)
+    expected.insert(0, 0)
+    actual.insert(100, 2)
+    expected.insert(100, 2)
+    actual.insert(-1, 'x')
+    expected.insert(-1, 'x')
+    actual.insert(-100, 'y')
+    expected.insert(-100, 'y')
+    check_equal(actual, expected)
+
+    actual.extend(range(20))
+    expected.extend(range(20))
+    check_equal(actual, expected)
+
+    actual.extend([])
+    check_equal(actual, expected)
+
+    for x in range(30):
+        actual.append(x)
+        expected.append(x)
+        actual.insert(x, -x)
+        expected.insert(x, -x)
+        check_equal(actual, expected)
+
+
+def test_random_operations():
+    random.seed(42)
+    expected = list()
+    actual = ChunkedList(load=8)
+    for x in range(3000):
+        action = random.random()
+        if action < 0.4:
+            i = random.randint(-len(expected) - 2, len(expected) + 2)
+            actual.insert(i, x)
+            expected.insert(i, x)
+        elif action < 0.6:
+            actual.append(x)
+            expected.append(x)
+        elif action < 0.85 and expected:
+            i = random.randrange(len(expected))
+            del actual[i]
+            del expected[i]
+        elif expected:
+            i = random.randrange(len(expected))
+            assert actual[i] == expected[i]
+            actual[i] = -x
+            expected[i] = -x
+    check_equal(actual, expected)
+
+
+def test_search():
+    actual = ChunkedList(['a', 'b', 'c', 'b', 'a'] * 5, load=3)
+    expected = ['a', 'b', 'c', 'b', 'a'] * 5
+
+    assert 'c' in actual
+    assert 'z' not in actual
+    assert actual.count('b') == 10
+    assert actual.index('c') == 2
+    assert actual.index('c', 3) == expected.index('c', 3)
+    assert actual.index('a', 5, 10) == 5
+    assert actual.index('a', 6, 10) == 9
+
+    with pytest.raises(ValueError):
+        actual.index('z')
+
+    with pytest.raises(ValueError):
+        actual.index('c', 3, 6)
+
+
+def test_copy_and_operators():
+    actual = ChunkedList(range(10), load=3)
+
+    copy = actual.copy()
+    assert isinstance(copy, ChunkedList)
+    copy.append(10)
+    assert actual == list(range(10))
+    assert copy == list(range(11))
+
+    assert actual + [10, 11] == list(range(12))
+    assert isinstance(actual + [10], ChunkedList)
+    assert [-1] + actual == list(range(-1, 10))
+    assert isinstance([-1] + actual, ChunkedList)
+
+    actual += [10]
+    assert actual == list(range(11))
+
+    assert actual != list(range(10))
+    assert actual != 'not a list'
+    assert ChunkedList([1, 2]) == ChunkedList([1, 2])
+    assert ChunkedList([ChunkedList([1]), ChunkedList([2])]) == [[1], [2]]
+
+    with pytest.raises(TypeError):
+        hash(actual)
+
+
+def test_sort_reverse():
+    actual = ChunkedList([3, 1, 2, 5, 4], load=2)
+    actual.sort()
+    check_equal(actual, [1, 2, 3, 4, 5])
+
+    actual.sort(reverse=True)
+    check_equal(actual, [5, 4, 3, 2, 1])
+
+    actual.reverse()
+    check_equal(actual, [1, 2, 3, 4, 5])
+
+    assert list(reversed(actual)) == [5, 4, 3, 2, 1]
+    assert actual.pop() == 5
+    actual.remove(2)
+    check_equal(actual, [1, 3, 4])
+
+
+def test_pickle_repr():
+    actual = ChunkedList(range(5), load=2)
+    assert repr(actual) == 'ChunkedList([0, 1, 2, 3, 4])'
+    assert str(ChunkedList) == "<class 'raccoon.containers.ChunkedList'>"
+
+    result = pickle.loads(pickle.dumps(actual))
+    check_equal(result, [0, 1, 2, 3, 4])
+    assert result._load == 2
@@ -0,0 +1,238 @@
+from io import StringIO
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+from raccoon.containers import ChunkedList
+
+
+def test_use_chunked_list():
+    def check_chunked_list():
+        assert isinstance(df.index, ChunkedList)
+        assert isinstance(df.columns, ChunkedList)
+        assert isinstance(df.data, ChunkedList)
+        assert all([isinstance(df.data[x], ChunkedList) for x in range(len(df.columns))])
+
+    df = rc.DataFrame(dropin=ChunkedList)
+    assert isinstance(df, rc.DataFrame)
+    assert df.data == []
+    assert df.columns == []
+    assert df.index == []
+    assert df.sort is True
+    check_chunked_list()
+
+    # add a new row and col
+    df.set_cell(1, 'a', 1)
+    check_chunked_list()
+
+    # add a new row
+    df.set_cell(2, 'a', 2)
+    check_chunked_list()
+
+    # add a new col
+    df.set_cell(1, 'b', 3)
+    check_chunked_list()
+
+    # add a complete new row
+    df.set_row(3, {'a': 4, 'b': 5})
+    check_chunked_list()
+
+    # add a complete new col
+    df.set_column([2, 3], 'c', [6, 7])
+    check_chunked_list()
+
+
+def test_assert_frame_equal():
+    df1 = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], index=[1, 2, 3])
+    df2 = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], index=[1, 2, 3], dropin=ChunkedList)
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df1, df2)
+
+
+def test_print():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.55, 3.1], 'c': ['first', 'second', None]}, columns=['b', 'c', 'a'],
+                      index=['row1', 'row2', 'row3'], dropin=ChunkedList)
+
+    # __repr__ produces a simple representation
+    expected = "object id: %s\ncolumns:\nChunkedList(['b', 'c', 'a'])\ndata:\nChunkedList([ChunkedList([1.0, 2.55, " \
+               "3.1]), ChunkedList(['first', 'second', None]), ChunkedList([1, 2, 3])])\nindex:\nChunkedList([" \
+               "'row1', 'row2', 'row3'])\n" % id(df)
+    actual = df.__repr__()
+    assert actual == expected
+
+    # __string__ produces the standard table
+    expected = 'index       b  c         a\n-------  ----  ------  ---\nrow1     1     first     1\n' \
+               'row2     2.55  second    2\nrow3     3.1             3'
+    actual = df.__str__()
+    assert actual == expected
+
+    # print() method will pass along any argument for the tabulate.tabulate function
+    df.print()
+
+
+def test_json():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': [7, 8, 9]}, sort=False, dropin=ChunkedList)
+
+    string = df.to_json()
+    actual = rc.DataFrame.from_json(string, ChunkedList)
+    assert_frame_equal(df, actual)
+
+    # fails with no dropin supplied
+    with pytest.raises(AttributeError) as e:
+        rc.DataFrame.from_json(string)
+        assert e == "AttributeError: the JSON has a dropin : <class 'raccoon.containers.ChunkedList'> : " \
+                    "but the dropin parameter was not supplied"
+
+    # fails with the wrong dropin supplied
+    with pytest.raises(AttributeError) as e:
+        rc.DataFrame.from_json(string, list)
+        assert e == "AttributeError: the supplied dropin parameter: <class 'list'> : does not match the value" \
+                    " in the JSON: <class 'raccoon.containers.ChunkedList'>"
+
+
+def test_json_file():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': [7, 8, 9]}, sort=False, dropin=ChunkedList)
+
+    file = StringIO()
+    df.to_json_file(file)
+    assert_frame_equal(df, rc.DataFrame.from_json_file(StringIO(file.getvalue()), ChunkedList))
+    assert_frame_equal(df, rc.DataFrame.from_json(file.getvalue(), ChunkedList))
+
+    # fails with no dropin supplied
+    with pytest.raises(AttributeError):
+        rc.DataFrame.from_json_file(StringIO(file.getvalue()))
+
+
+def test_json_objects():
+    # test with a compound object returning a representation
+    df = rc.DataFrame({'a': [1, 2], 'b': [4, ChunkedList([5, 6])]})
+
+    string = df.to_json()
+    actual = rc.DataFrame.from_json(string)
+
+    # the DataFrames are not equal because the ChunkedList() was converted to a representation
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df, actual)
+
+    assert actual[1, 'b'] != ChunkedList([5, 6])
+    assert actual[1, 'b'] == 'ChunkedList([5, 6])'
+
+
+def test_select_index():
+    # simple index, not sort, ChunkedList
+    df = rc.DataFrame({'a': [1, 2, 3, 4, 5, 6]}, index=['a', 'b', 'c', 'd', 'e', 'f'], dropin=ChunkedList)
+
+    actual = df.select_index('c', 'value')
+    assert actual == ['c']
+
+    actual = df.select_index('d', 'boolean')
+    assert actual == [False, False, False, True, False, False]
+
+
+def test_columns_chunked_list():
+    actual = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['a', 'b', 'c'], columns=['b', 'a'],
+                          dropin=ChunkedList)
+    names = actual.columns
+    assert names == ['b', 'a']
+    assert isinstance(names, ChunkedList)
+
+    # test that a copy is returned
+    names.append('bad')
+    assert actual.columns == ['b', 'a']
+
+    actual.columns = ['new1', 'new2']
+    assert actual.columns == ['new1', 'new2']
+    assert isinstance(actual.columns, ChunkedList)
+
+    with pytest.raises(ValueError):
+        actual.columns = ['list', 'too', 'long']
+
+
+def test_index_chunked_list():
+    actual = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['a', 'b', 'c'], columns=['b', 'a'],
+                          dropin=ChunkedList)
+    result = actual.index
+    assert result == ['a', 'b', 'c']
+    assert isinstance(result, ChunkedList)
+
+    # test that a view is returned
+    result.append('bad')
+    assert actual.index == ['a', 'b', 'c', 'bad']
+
+    actual.index = [9, 10, 11]
+    assert actual.index == [9, 10, 11]
+    assert isinstance(result, ChunkedList)
+
+    # index too long
+    with pytest.raises(ValueError):
+        actual.index = [1, 3, 4, 5, 6]
+
+
+def test_data_chunked_list():
+    actual = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, index=['a', 'b', 'c'], columns=['b', 'a'],
+                          dropin=ChunkedList)
+    assert actual.data == [[4, 5, 6], [1, 2, 3]]
+    assert all([isinstance(actual.data[x], ChunkedList) for x in range(len(actual.columns))])
+
+
+def test_default_empty_init():
+    actual = rc.DataFrame(index=[1, 2, 3], columns=['a', 'b'], dropin=ChunkedList)
+    assert actual.data == [[None, None, None], [None, None, None]]
+    assert actual.columns == ['a', 'b']
+    assert actual.index == [1, 2, 3]
+    assert actual.sort is False
+    assert isinstance(actual.index, ChunkedList)
+    assert isinstance(actual.columns, ChunkedList)
+    assert isinstance(actual.data, ChunkedList)
+    assert all([isinstance(actual.data[x], ChunkedList) for x in range(len(actual.columns))])
+
+
+def test_sort_index():
+    df = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}, columns=['a', 'b'], index=[10, 8, 9], sort=False,
+                      dropin=ChunkedList)
+
+    df.sort_index()
+    assert isinstance(df.index, ChunkedList)
+    assert_frame_equal(df, rc.DataFrame({'a': [2, 3, 1], 'b': [5, 6, 4]}, columns=['a', 'b'], index=[8, 9, 10],
+                                        sort=False, dropin=ChunkedList))
+
+
+def test_sort_column():
+    df = rc.DataFrame({'a': [2, 1, 3], 'b': ['a', 'c', 'b']}, columns=['a', 'b'], index=[10, 8, 9], dropin=ChunkedList)
+
+    df.sort_columns('a')
+    assert isinstance(df.index, ChunkedList)
+    assert_frame_equal(df, rc.DataFrame({'a': [1, 2, 3], 'b': ['c', 'a', 'b']}, columns=['a', 'b'], index=[8, 10, 9],
+                                        dropin=ChunkedList))
+
+    df.sort_columns('a', reverse=True)
+    assert isinstance(df.index, ChunkedList)
+    assert_frame_equal(df, rc.DataFrame({'a': [3, 2, 1], 'b': ['b', 'a', 'c']}, columns=['a', 'b'], index=[9, 10, 8],
+                                        dropin=ChunkedList))
+
+
+def test_sorted_inserts():
+    class SmallChunkedList(ChunkedList):
+        DEFAULT_LOAD = 4
+
+    df = rc.DataFrame(columns=['a', 'b'], sort=True, dropin=SmallChunkedList)
+    expected = rc.DataFrame(columns=['a', 'b'], sort=True)
+    keys = [(x * 37) % 101 for x in range(101)]
+    for x in keys:
+        df.set_cell(x, 'a', x)
+        df.set_row(-x - 1, {'b': x})
+        expected.set_cell(x, 'a', x)
+        expected.set_row(-x - 1, {'b': x})
+
+    assert df.index == expected.index
+    assert df.data == expected.data
+    assert len(df.index._lists) > 1
+    assert df.get_slice(-5, 5, as_dict=True) == expected.get_slice(-5, 5, as_dict=True)
+
+    df.delete_rows(SmallChunkedList(keys[:50]))
+    expected.delete_rows(keys[:50])
+    assert df.index == expected.index
+    assert df.data == expected.data
+    df.validate_integrity()
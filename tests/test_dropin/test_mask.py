@@ -0,0 +1,99 @@
+"""
+unit tests for the Mask container
+"""
+
+import pytest
+
+from raccoon.containers import Mask, is_bool_list
+
+
+def test_init():
+    actual = Mask()
+    assert len(actual) == 0
+    assert actual == []
+
+    actual = Mask([True, False, True])
+    assert len(actual) == 3
+    assert list(actual) == [True, False, True]
+    assert actual == [True, False, True]
+    assert Mask(actual) == actual
+    assert Mask(actual) is not actual
+
+    assert Mask([1, 0, 'x', None]) == [True, False, True, False]
+    assert Mask(x > 1 for x in range(4)) == [False, False, True, True]
+
+    assert Mask.from_locations(5, [1, 3]) == [False, True, False, True, False]
+    assert Mask.from_locations(2, []) == [False, False]
+
+
+def test_getitem_setitem():
+    actual = Mask([True, False, True, False])
+    assert actual[0] is True
+    assert actual[-1] is False
+    assert isinstance(actual[1:3], Mask)
+    assert actual[1:3] == [False, True]
+
+    with pytest.raises(IndexError):
+        actual[4]
+
+    actual[1] = True
+    actual[2] = 0
+    assert actual == [True, True, False, False]
+
+    actual[2:] = [True, True]
+    assert actual == [True, True, True, True]
+
+
+def test_operators():
+    left = Mask([True, True, False, False])
+    right = Mask([True, False, True, False])
+
+    assert left & right == [True, False, False, False]
+    assert left | right == [True, True, True, False]
+    assert left ^ right == [False, True, True, False]
+    assert ~left == [False, False, True, True]
+    assert ~Mask() == []
+    assert left & [True, False, True, False] == [True, False, False, False]
+    assert [True, False, True, False] | left == [True, True, True, False]
+    assert isinstance(left & right, Mask)
+
+    with pytest.raises(ValueError):
+        left & [True]
+
+    # large masks
+    big = Mask([x % 3 == 0 for x in range(10001)])
+    assert (big | ~big).popcount() == 10001
+    assert (big & ~big).popcount() == 0
+    assert big.popcount() == 3334
+
+
+def test_count_locations():
+    actual = Mask([False, True, True, False, True])
+    assert actual.popcount() == 3
+    assert actual.count(True) == 3
+    assert actual.count(False) == 2
+    assert actual.count('x') == 0
+    assert actual.locations() == [1, 2, 4]
+    assert Mask([False, False]).locations() == []
+    assert actual.to_list() == [False, True, True, False, True]
+    assert all(Mask([True, True]))
+    assert not any(Mask([False]))
+
+
+def test_eq_repr():
+    assert Mask([True]) == Mask([True])
+    assert Mask([True]) != Mask([False])
+    assert Mask([True]) != [True, False]
+    assert Mask([True]) != 'not a list'
+    assert repr(Mask([True, False])) == 'Mask([True, False])'
+
+    with pytest.raises(TypeError):
+        hash(Mask())
+
+
+def test_is_bool_list():
+    assert is_bool_list(Mask([True]))
+    assert is_bool_list([True, False])
+    assert is_bool_list([])
+    assert not is_bool_list([True, 1])
+    assert not is_bool_list(['a', True])
@@ -0,0 +1,155 @@
+"""
+unit tests for the RingBuffer container
+"""
+
+import pickle
+
+import pytest
+
+from raccoon.containers import RingBuffer
+
+
+def check_equal(actual, expected):
+    assert len(actual) == len(expected)
+    assert list(actual) == expected
+    assert actual == expected
+    assert [actual[i] for i in range(len(expected))] == expected
+    assert [actual[-i] for i in range(1, len(expected) + 1)] == [expected[-i] for i in range(1, len(expected) + 1)]
+
+
+def test_init():
+    actual = RingBuffer(capacity=3)
+    assert actual == []
+    assert not actual
+    assert actual.capacity == 3
+    assert not actual.full
+
+    actual = RingBuffer([1, 2, 3])
+    check_equal(actual, [1, 2, 3])
+    assert actual.capacity == 3
+    assert actual.full
+
+    actual = RingBuffer(range(10), 4)
+    check_equal(actual, [6, 7, 8, 9])
+
+    with pytest.raises(ValueError):
+        RingBuffer(capacity=0)
+
+
+def test_append_evicts():
+    actual = RingBuffer(capacity=4)
+    expected = list()
+    for x in range(11):
+        actual.append(x)
+        expected.append(x)
+        expected = expected[-4:]
+        check_equal(actual, expected)
+    assert actual.full
+
+    actual.extend([20, 21])
+    check_equal(actual, [9, 10, 20, 21])
+
+
+def test_getitem_setitem():
+    actual = RingBuffer(range(8), 5)
+    check_equal(actual, [3, 4, 5, 6, 7])
+
+    with pytest.raises(IndexError):
+        actual[5]
+
+    with pytest.raises(IndexError):
+        actual[-6]
+
+    assert actual[1:3] == [4, 5]
+    assert isinstance(actual[1:3], list)
+    assert actual[::-1] == [7, 6, 5, 4, 3]
+
+    # slices that wrap around the end of the buffer
+    expected = [3, 4, 5, 6, 7]
+    for start in range(-7, 7):
+        for stop in list(range(-7, 7)) + [None]:
+            assert actual[start:stop] == expected[start:stop]
+
+    actual[0] = 'a'
+    actual[-1] = 'b'
+    check_equal(actual, ['a', 4, 5, 6, 'b'])
+
+    actual[1:4] = [1, 2]
+    check_equal(actual, ['a', 1, 2, 'b'])
+    assert actual.capacity == 5
+
+    actual[:] = list(range(7))
+    check_equal(actual, [2, 3, 4, 5, 6])
+
+
+def test_delitem():
+    actual = RingBuffer(range(7), 5)
+    expected = [2, 3, 4, 5, 6]
+
+    del actual[0]
+    del expected[0]
+    check_equal(actual, expected)
+
+    actual.append(7)
+    expected.append(7)
+    check_equal(actual, expected)
+
+    del actual[2]
+    del expected[2]
+    check_equal(actual, expected)
+
+    del actual[-1]
+    del expected[-1]
+    check_equal(actual, expected)
+
+    with pytest.raises(IndexError):
+        del actual[5]
+
+    del actual[:]
+    check_equal(actual, [])
+    assert actual.capacity == 5
+
+
+def test_insert():
+    actual = RingBuffer([1, 3], 4)
+    actual.insert(1, 2)
+    actual.insert(-10, 0)
+    check_equal(actual, [0, 1, 2, 3])
+
+    with pytest.raises(IndexError):
+        actual.insert(2, 'x')
+
+    # inserting at the end of a full RingBuffer is an append
+    actual.insert(4, 4)
+    check_equal(actual, [1, 2, 3, 4])
+
+
+def test_search_copy():
+    actual = RingBuffer(['z', 'a', 'b', 'a', 'c'], 4)
+    assert 'c' in actual
+    assert 'z' not in actual
+    assert actual.count('a') == 2
+    assert actual.index('a') == 0
+    assert actual.index('a', 1) == 2
+    with pytest.raises(ValueError):
+        actual.index('c', 0, 3)
+
+    copy = actual.copy()
+    copy.append('d')
+    assert actual == ['a', 'b', 'a', 'c']
+    assert copy == ['b', 'a', 'c', 'd']
+    assert copy.capacity == 4
+    assert RingBuffer([1, 2], 3) == RingBuffer([1, 2], 5)
+    assert actual != 'not a list'
+
+    with pytest.raises(TypeError):
+        hash(actual)
+
+
+def test_pickle_repr():
+    actual = RingBuffer(range(5), 3)
+    assert repr(actual) == 'RingBuffer([2, 3, 4], capacity=3)'
+
+    result = pickle.loads(pickle.dumps(actual))
+    check_equal(result, [2, 3, 4])
+    assert result.capacity == 3
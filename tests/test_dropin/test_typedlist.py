@@ -0,0 +1,183 @@
+"""
+unit tests for the TypedList container
+"""
+
+import pickle
+import random
+from array import array
+
+import pytest
+
+from raccoon.containers import Mask, TypedList
+
+
+def test_init():
+    actual = TypedList('d')
+    assert len(actual) == 0
+    assert actual == []
+    assert actual.typecode == 'd'
+
+    actual = TypedList('q', [1, 2, 3])
+    assert list(actual) == [1, 2, 3]
+    assert actual == [1, 2, 3]
+    assert actual == TypedList('q', [1, 2, 3])
+    assert actual == TypedList('d', [1, 2, 3])
+    assert actual != TypedList('q', [1, 2])
+    assert isinstance(actual.array, array)
+    assert actual.array.itemsize == 8
+
+    with pytest.raises(ValueError):
+        TypedList('x')
+
+    with pytest.raises(TypeError):
+        TypedList('q', [1.5])
+
+    with pytest.raises(OverflowError):
+        TypedList('b', [1000])
+
+
+def test_nulls():
+    actual = TypedList('d', [1.0, None, 3.0])
+    assert actual == [1.0, None, 3.0]
+    assert actual[1] is None
+    assert actual.array.tolist() == [1.0, 0.0, 3.0]
+    assert actual.null_mask() == Mask([False, True, False])
+    assert TypedList('d', [1.0]).null_mask() == Mask([False])
+
+    actual[0] = None
+    actual[1] = 2.0
+    assert actual == [None, 2.0, 3.0]
+    assert actual.count(None) == 1
+    assert actual.index(None) == 0
+
+    actual.append(None)
+    actual.insert(0, 0.5)
+    del actual[1]
+    assert actual == [0.5, 2.0, 3.0, None]
+
+
+def test_getitem_setitem():
+    actual = TypedList('q', [1, 2, 3, 4, 5])
+    assert actual[0] == 1
+    assert actual[-1] == 5
+    assert actual[1:3] == [2, 3]
+    assert isinstance(actual[1:3], list)
+
+    actual[1:3] = [7, None, 9]
+    assert actual == [1, 7, None, 9, 4, 5]
+    assert actual[1:4] == [7, None, 9]
+    assert actual[::-2] == [5, 9, 7]
+
+    with pytest.raises(IndexError):
+        actual[10]
+
+    with pytest.raises(TypeError):
+        actual[0] = 'a'
+    assert actual == [1, 7, None, 9, 4, 5]
+
+    # same length with no None values is set in place
+    values = actual.array
+    actual[1:4] = (6, 8, 10)
+    assert actual == [1, 6, 8, 10, 4, 5]
+    assert actual.array is values
+    assert actual.null_mask() == Mask([False] * 6)
+    actual[-2:] = [0, 0]
+    actual[3:1] = []
+    assert actual == [1, 6, 8, 10, 0, 0]
+
+    with pytest.raises(TypeError):
+        actual[0:2] = ['a', 'b']
+    assert actual == [1, 6, 8, 10, 0, 0]
+
+
+def test_random_operations():
+    random.seed(0)
+    expected = list()
+    actual = TypedList('q')
+    for _ in range(2000):
+        operation = random.random()
+        value = random.choice([None, random.randint(-100, 100)])
+        if operation < 0.3:
+            expected.append(value)
+            actual.append(value)
+        elif operation < 0.6:
+            i = random.randint(-len(expected) - 1, len(expected) + 1)
+            expected.insert(i, value)
+            actual.insert(i, value)
+        elif operation < 0.8 and expected:
+            i = random.randrange(len(expected))
+            del expected[i]
+            del actual[i]
+        elif expected:
+            i = random.randrange(len(expected))
+            expected[i] = value
+            actual[i] = value
+        assert len(actual) == len(expected)
+    assert actual == expected
+
+
+def test_buffer():
+    actual = TypedList('d', [1.0, 2.0, 3.0])
+    view = memoryview(actual.array)
+    assert view.format == 'd'
+    assert view.tolist() == [1.0, 2.0, 3.0]
+    assert actual.__buffer__(0).tolist() == [1.0, 2.0, 3.0]
+
+
+def test_copy_pickle():
+    actual = TypedList('d', [1.0, None])
+    copy = actual.copy()
+    copy[0] = 5.0
+    assert actual == [1.0, None]
+    assert copy == [5.0, None]
+
+    assert pickle.loads(pickle.dumps(actual)) == actual
+    assert repr(actual) == "TypedList('d', [1.0, None])"
+
+
+def test_contains_count():
+    actual = TypedList('q', [1, 2, 0])
+    assert None not in actual
+    assert 2 in actual
+    assert 5 not in actual
+    assert actual.count(None) == 0
+
+    actual[2] = None
+    assert None in actual
+    assert 0 not in actual
+    assert actual.count(None) == 1
+    assert actual.count(1) == 1
+
+
+def test_from_buffer():
+    source = TypedList('q', [1, None, 3])
+    values, nulls = source.buffers()
+    assert bytes(values) == array('q', [1, 0, 3]).tobytes()
+    assert nulls == bytearray([0, 1, 0])
+    assert TypedList('q', [1, 2]).buffers()[1] is None
+
+    buffer = bytes(values)
+    actual = TypedList.from_buffer('q', buffer, bytearray(nulls))
+    assert actual.typecode == 'q'
+    assert isinstance(actual.array, memoryview)
+    assert actual == [1, None, 3]
+    assert actual[0:2] == [1, None]
+    assert actual.copy() == [1, None, 3]
+
+    # the first change copies the values into an array and leaves the buffer unchanged
+    actual[0] = 5
+    assert isinstance(actual.array, array)
+    assert actual == [5, None, 3]
+    assert buffer == array('q', [1, 0, 3]).tobytes()
+
+    for change in [lambda x: x.append(4), lambda x: x.append(None), lambda x: x.insert(0, 4), lambda x: x.extend([4]),
+                   lambda x: x.__delitem__(0), lambda x: x.clear(), lambda x: x.__setitem__(slice(0, 1), [4])]:
+        actual = TypedList.from_buffer('q', buffer)
+        change(actual)
+        assert isinstance(actual.array, array)
+
+    with pytest.raises(ValueError):
+        TypedList.from_buffer('q', b'\x00' * 7)
+
+    with pytest.raises(ValueError):
+        TypedList.from_buffer('q', buffer, bytearray(2))
@@ -70,3 +70,21 @@ def test_delete_sort():
 
     srs.delete([True])
     assert_series_equal(srs, rc.Series(sort=False))
+
+
+def test_delete_many():
+    srs = rc.Series(list(range(10)), index=list(range(100, 110)), hash_index=True)
+    link_index = srs.index
+    link_data = srs.data
+
+    srs.delete([109, 101, 105, 101, 100])
+    assert srs.index == [102, 103, 104, 106, 107, 108]
+    assert srs.data == [2, 3, 4, 6, 7, 8]
+    assert srs.get_cell(106) == 6
+    assert link_index is srs.index
+    assert link_data is srs.data
+
+    srs.delete([False, True, True, False, False, True])
+    assert srs.index == [102, 106, 107]
+    assert srs.data == [2, 6, 7]
+    assert srs.get_cell(107) == 7
@@ -116,6 +116,38 @@ def test_get_locations():
     assert srs.get_locations([0, 2], as_list=True) == [5, 7]
     assert_series_equal(srs.get_locations([2]), rc.Series([7], index=[6]))
 
+    # slices and negative locations
+    assert_series_equal(srs.get_locations(slice(1, 3)), rc.Series([6, 7], index=[4, 6]))
+    assert srs.get_locations(slice(None, None, -2), as_list=True) == [8, 6]
+    assert srs.get_locations([-1, 0], as_list=True) == [8, 5]
+
+    with pytest.raises(IndexError):
+        srs.get_locations([0, 9])
+
+
+def test_iloc():
+    srs = rc.Series([5, 6, 7, 8], index=[2, 4, 6, 8], sort=True)
+
+    assert srs.iloc[1] == 6
+    assert srs.iloc[-1] == 8
+    assert_series_equal(srs.iloc[1:3], rc.Series([6, 7], index=[4, 6], sort=True))
+    assert_series_equal(srs.iloc[[3, 0]], rc.Series([8, 5], index=[8, 2], sort=True))
+
+    srs.iloc[0] = 50
+    srs.iloc[-2:] = [70, 80]
+    srs.iloc[[1]] = 60
+    assert srs.data == [50, 60, 70, 80]
+
+
+def test_iloc_numpy():
+    np = pytest.importorskip('numpy')
+    srs = rc.Series([5, 6, 7], index=[2, 4, 6], sort=True)
+
+    assert srs.iloc[np.int64(1)] == 6
+    assert srs.iloc[np.int32(-1)] == 7
+    srs.iloc[np.int64(0)] = 50
+    assert srs.data == [50, 6, 7]
+
 
 def test_get_slice():
     srs = rc.Series([5, 6, 7, 8], index=[2, 4, 6, 8], sort=True)
@@ -256,3 +288,37 @@ def test_tail():
     assert_series_equal(srs.tail(2), rc.Series([4, 5], index=[1, 2], sort=False))
     assert_series_equal(srs.tail(3), rc.Series([3, 4, 5], sort=False))
     assert_series_equal(srs.tail(999), rc.Series([3, 4, 5], sort=False))
+
+
+def test_get_asof():
+    srs = rc.Series([5, 6, 7, 8], index=[2, 4, 6, 8], sort=True)
+
+    assert srs.get_asof(2) == 5
+    assert srs.get_asof(5) == 6
+    assert srs.get_asof(100) == 8
+
+    with pytest.raises(ValueError):
+        srs.get_asof(1)
+
+    # Only works with sort=True
+    with pytest.raises(RuntimeError):
+        rc.Series([4, 5], [6, 7], sort=False).get_asof(6)
+
+    view = rc.ViewSeries([5, 6, 7, 8], index=[2, 4, 6, 8], sort=True)
+    assert view.get_asof(7) == 7
+
+
+def test_get_asof_many():
+    srs = rc.Series([5, 6, 7, 8], index=[2, 4, 6, 8], data_name='price', index_name='time', sort=True)
+
+    assert srs.get_asof_many([1, 2, 3, 9], as_list=True) == [None, 5, 5, 8]
+    assert srs.get_asof_many([9, 3, 1], as_list=True) == [8, 5, None]
+    assert_series_equal(srs.get_asof_many([7, 3]), rc.Series([5, 7], index=[3, 7], data_name='price',
+                                                             index_name='time', sort=True))
+
+    # Only works with sort=True
+    with pytest.raises(RuntimeError):
+        rc.Series([4, 5], [6, 7], sort=False).get_asof_many([6])
+
+    view = rc.ViewSeries([5, 6, 7, 8], index=[2, 4, 6, 8], sort=True)
+    assert view.get_asof_many([3, 100], as_list=True) == [5, 8]
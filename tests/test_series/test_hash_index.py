@@ -0,0 +1,67 @@
+import pytest
+
+import raccoon as rc
+
+
+def check_map(srs):
+    assert srs.hash_index
+    assert srs._index_map == {x: i for i, x in enumerate(srs.index)}
+
+
+def test_default():
+    srs = rc.Series([1, 2, 3], index=['x', 'y', 'z'])
+    assert srs.hash_index is False
+
+    srs.hash_index = True
+    check_map(srs)
+
+    srs.hash_index = False
+    assert srs._index_map is None
+
+    view = rc.ViewSeries([1, 2, 3], index=['x', 'y', 'z'])
+    assert view._index_map is None
+    assert view.get_cell('y') == 2
+
+
+def test_get_set():
+    srs = rc.Series([1, 2, 3], index=['x', 'y', 'z'], hash_index=True)
+    check_map(srs)
+
+    assert srs.get_cell('y') == 2
+    assert srs.get_rows(['z', 'x'], as_list=True) == [3, 1]
+    assert srs.select_index('z') == [False, False, True]
+
+    with pytest.raises(ValueError):
+        srs.get_cell('bad')
+
+    srs.set_cell('w', 4)
+    srs.set_rows(['x', 'v', 'u'], [11, 5, 6])
+    srs.append_row('t', 7)
+    srs.append_rows(['s', 'r'], [8, 9])
+    check_map(srs)
+    assert srs.get_rows(['x', 'v', 'r'], as_list=True) == [11, 5, 9]
+
+
+def test_sorted():
+    srs = rc.Series([1, 2, 3], index=[2, 4, 6], sort=True, hash_index=True)
+    srs.set_cell(3, 33)
+    srs.set_rows([0, 5], [10, 50])
+    check_map(srs)
+    assert srs.index == [0, 2, 3, 4, 5, 6]
+    assert srs.get_cell(5) == 50
+
+
+def test_delete_and_sort():
+    srs = rc.Series([1, 2, 3, 4], index=['d', 'b', 'a', 'c'], hash_index=True)
+
+    srs.delete(['b', 'd'])
+    check_map(srs)
+    assert srs.get_cell('c') == 4
+
+    srs.sort_index()
+    check_map(srs)
+    assert srs.index == ['a', 'c']
+
+    srs.reset_index()
+    check_map(srs)
+    assert srs.get_cell(1) == 4
@@ -0,0 +1,91 @@
+import pytest
+
+import raccoon as rc
+
+
+def check_map(srs):
+    assert srs.level_index
+    srs._level_locations(())  # an insert before the end rebuilds the level maps on the next lookup
+    expected = list()
+    for i, index in enumerate(srs.index):
+        for level, value in enumerate(index):
+            if level == len(expected):
+                expected.append(dict())
+            expected[level].setdefault(value, set()).add(i)
+    assert srs._level_map == expected
+
+
+def test_default():
+    srs = rc.Series([1, 2], index=[('x', 1), ('y', 2)])
+    assert srs.level_index is False
+
+    srs.level_index = True
+    check_map(srs)
+
+    srs.level_index = False
+    assert srs._level_map is None
+
+    view = rc.ViewSeries([1, 2], index=[('x', 1), ('y', 2)])
+    assert view._level_map is None
+    assert view.select_index(('y', None), 'value') == [('y', 2)]
+
+    with pytest.raises(TypeError):
+        rc.Series([1, 2], level_index=True)
+
+
+def test_select_index():
+    index = [(s, d) for s in ['a', 'b', 'c'] for d in [1, 2, 3]]
+    srs = rc.Series(list(range(9)), index=index, level_index=True)
+    check_map(srs)
+
+    assert srs.select_index(('b', None), 'value') == [('b', 1), ('b', 2), ('b', 3)]
+    assert srs.select_index((None, 2), 'value') == [('a', 2), ('b', 2), ('c', 2)]
+    assert srs.select_index(('c', 3)) == [False] * 8 + [True]
+    assert srs.select_index(('d', None), 'value') == []
+    assert srs.select_index((None, None), 'value') == index
+
+
+def test_sync():
+    srs = rc.Series([1, 2, 3], index=[('b', 2), ('d', 1), ('f', 3)], sort=True, level_index=True)
+
+    srs.set_cell(('c', 1), 4)
+    srs.set_rows([('e', 3), ('g', 2), ('a', 0)], [6, 7, 8])
+    srs.append_row(('h', 1), 9)
+    srs.append_rows([('i', 3), ('j', 2)], [10, 11])
+    check_map(srs)
+    assert srs.select_index((None, 1), 'value') == [('c', 1), ('d', 1), ('h', 1)]
+
+    srs.delete([('c', 1), ('j', 2)])
+    check_map(srs)
+    assert srs.select_index((None, 2), 'value') == [('b', 2), ('g', 2)]
+
+    srs.sort_index()
+    check_map(srs)
+
+    # inserts before the end only mark the level maps to be rebuilt, appends after that wait for the rebuild
+    srs.set_cell(('b', 4), 12)
+    srs.set_cell(('c', 4), 13)
+    assert srs._level_stale is True
+    srs.append_row(('k', 4), 14)
+    assert srs.select_index((None, 4), 'value') == [('b', 4), ('c', 4), ('k', 4)]
+    assert srs._level_stale is False
+    check_map(srs)
+
+    srs.reset_index()
+    assert srs.level_index is False
+    assert srs.index == list(range(len(srs)))
+
+
+def test_not_tuple():
+    # an index value that is not a tuple is rejected before any change
+    srs = rc.Series([1, 2], index=[('a', 1), ('b', 2)], level_index=True, hash_index=True)
+    with pytest.raises(TypeError):
+        srs.append_row('c', 3)
+    with pytest.raises(TypeError):
+        srs.append_rows([('c', 3), 'd'], [3, 4])
+    with pytest.raises(TypeError):
+        srs.set_cell('c', 3)
+    assert srs.index == [('a', 1), ('b', 2)]
+    assert srs.data == [1, 2]
+    assert srs._index_map == {('a', 1): 0, ('b', 2): 1}
+    check_map(srs)
@@ -0,0 +1,144 @@
+import random
+from datetime import datetime, timedelta
+from statistics import stdev
+
+import pytest
+
+import raccoon as rc
+
+
+def brute_force(values, index, window, by_index, min_periods, name):
+    # recalculate each window from a copy of the values in the window
+    result = list()
+    for i in range(len(values)):
+        if by_index:
+            window_values = [values[j] for j in range(i + 1) if index[j] > index[i] - window]
+        else:
+            window_values = values[max(0, i - window + 1):i + 1]
+        window_values = [x for x in window_values if x is not None]
+        if name == 'count':
+            result.append(len(window_values))
+        elif len(window_values) < min_periods or (name == 'std' and len(window_values) < 2):
+            result.append(None)
+        elif name == 'sum':
+            result.append(sum(window_values))
+        elif name == 'mean':
+            result.append(sum(window_values) / len(window_values))
+        elif name == 'std':
+            result.append(stdev(window_values))
+        elif name == 'min':
+            result.append(min(window_values))
+        else:
+            result.append(max(window_values))
+    return result
+
+
+def check(srs, window, by_index=None, min_periods=None):
+    rolling = srs.rolling(window, by_index, min_periods)
+    by_index = rolling.by_index
+    min_periods = min_periods if min_periods is not None else (1 if by_index else window)
+    for name in ['count', 'sum', 'mean', 'min', 'max', 'std']:
+        expected = brute_force(srs.data, srs.index, window, by_index, min_periods, name)
+        assert getattr(rolling, name)() == pytest.approx(expected, abs=1e-6), name
+
+
+def test_window():
+    srs = rc.Series([1, 5, 2, 4, 3, 6], sort=True)
+    rolling = srs.rolling(3)
+    assert rolling.by_index is False
+    assert rolling.sum() == [None, None, 8, 11, 9, 13]
+    assert rolling.mean() == [None, None, 8 / 3, 11 / 3, 3, 13 / 3]
+    assert rolling.min() == [None, None, 1, 2, 2, 3]
+    assert rolling.max() == [None, None, 5, 5, 4, 6]
+    assert rolling.count() == [1, 2, 3, 3, 3, 3]
+    assert rolling.std() == pytest.approx([None, None, stdev([1, 5, 2]), stdev([5, 2, 4]), 1.0, stdev([4, 3, 6])])
+
+    assert srs.rolling(2, min_periods=1).sum() == [1, 6, 7, 6, 7, 9]
+    assert srs.rolling(1).max() == [1, 5, 2, 4, 3, 6]
+
+    # None values
+    srs = rc.Series([1, None, 2, 4], sort=True)
+    assert srs.rolling(2).sum() == [None, None, None, 6]
+    assert srs.rolling(2, min_periods=1).min() == [1, 1, 2, 2]
+
+    for window in [0, -1, 1.5]:
+        with pytest.raises(ValueError):
+            srs.rolling(window, by_index=False)
+
+
+def test_window_by_index():
+    index = [datetime(2020, 1, 1, 0, m) for m in [0, 1, 2, 5, 6, 10]]
+    srs = rc.Series([1, 2, 3, 4, 5, 6], index=index, sort=True)
+    rolling = srs.rolling(timedelta(minutes=3))
+    assert rolling.by_index is True
+    assert rolling.sum() == [1, 3, 6, 4, 9, 6]
+    assert rolling.max() == [1, 2, 3, 4, 5, 6]
+    assert rolling.min() == [1, 1, 1, 4, 4, 6]
+    assert rolling.count() == [1, 2, 3, 1, 2, 1]
+    assert srs.rolling(timedelta(minutes=3), min_periods=2).mean() == [None, 1.5, 2, None, 4.5, None]
+
+    srs = rc.Series([1, 2, 3], index=[0, 2, 3], sort=True)
+    assert srs.rolling(2, by_index=True).sum() == [1, 2, 5]
+
+    srs = rc.Series([1, 2, 3], index=[3, 0, 2], sort=False)
+    with pytest.raises(ValueError):
+        srs.rolling(2, by_index=True)
+
+    srs = rc.Series([1, 2, 3], index=[1, 2, 3], sort=True)
+    for window in [0, -1, 0.0]:
+        with pytest.raises(ValueError):
+            srs.rolling(window, by_index=True)
+
+    srs = rc.Series([1, 2, 3], index=index[:3], sort=True)
+    for window in [timedelta(0), timedelta(minutes=-1)]:
+        with pytest.raises(ValueError):
+            srs.rolling(window)
+
+
+def test_std_after_large_values():
+    # the rounding error of the large values that have left the window is not in the std of a constant window
+    values = [-51.89292690574689, 161.70416870011172, 211.19906027865386, 817.6368003706496, -61.53532476195676]
+    srs = rc.Series(values + [5.0] * 4 + [6.0, 1e-3, 2e-3, 3e-3, 4e-3], sort=True)
+    actual = srs.rolling(4).std()
+    assert actual[8] == 0.0
+    for i in range(3, len(srs)):
+        assert actual[i] == pytest.approx(stdev(srs.data[i - 3:i + 1]), rel=1e-9, abs=1e-12)
+
+    random.seed(0)
+    for _ in range(200):
+        values = [random.choice([random.uniform(-1e3, 1e3), 5.0, random.randint(-3, 3), random.random() / 1000])
+                  for _ in range(30)]
+        actual = rc.Series(values).rolling(4).std()
+        for i in range(3, len(values)):
+            assert actual[i] == pytest.approx(stdev(values[i - 3:i + 1]), rel=1e-9, abs=1e-12)
+
+
+def test_window_random():
+    random.seed(0)
+    values = [random.choice([None, random.randint(-20, 20), random.random()]) for _ in range(200)]
+    index = sorted(random.sample(range(1000), 200))
+    srs = rc.Series(values, index=index, sort=True)
+    for window in [1, 2, 5, 17]:
+        check(srs, window)
+        check(srs, window, min_periods=1)
+    for window in [1, 10, 33.5, 200]:
+        check(srs, window, by_index=True)
+        check(srs, window, by_index=True, min_periods=3)
+
+
+def test_dataframe():
+    df = rc.DataFrame({'a': [1, 5, 2, 4], 'b': [1.0, 2.0, 3.0, 4.0]}, index=[0, 1, 5, 6], columns=['a', 'b'],
+                      sort=True)
+    assert df.rolling('a', 2).sum() == [None, 6, 7, 6]
+    assert df.rolling('b', 2, by_index=True).mean() == [1.0, 1.5, 3.0, 3.5]
+
+    df['c'] = df.rolling('a', 3, min_periods=1).max()
+    assert df.data[2] == [1, 5, 5, 5]
+
+    with pytest.raises(ValueError):
+        df.rolling('bad', 2)
+
+    df = rc.DataFrame({'a': [1, 2]}, index=[1, 0], sort=False)
+    assert df.rolling('a', 2, min_periods=1).sum() == [1, 3]
+    with pytest.raises(ValueError):
+        df.rolling('a', 1.0)
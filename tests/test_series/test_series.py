@@ -4,6 +4,7 @@ from copy import deepcopy
 import pytest
 
 import raccoon as rc
+from raccoon.containers import Mask
 from raccoon.utils import assert_series_equal
 
 
@@ -234,6 +235,30 @@ def test_isin():
     assert srs.isin([6, 7]) == [False, False, False, False, False]
 
 
+def test_mask():
+    srs = rc.Series([1, 2, 3, 4, 5], index=[10, 11, 12, 13, 14], sort=False)
+
+    mask = srs.equality(value=1) | srs.isin([4, 5])
+    assert isinstance(mask, Mask)
+    assert mask == [True, False, False, True, True]
+    assert isinstance(srs.select_index(12), Mask)
+
+    assert srs.get(mask, as_list=True) == [1, 4, 5]
+    assert srs[~mask].index == [11, 12]
+
+    srs.set(mask, 0)
+    assert srs.data == [0, 2, 3, 0, 0]
+    srs[srs.equality(value=0)] = [7, 8, 9]
+    assert srs.data == [7, 2, 3, 8, 9]
+
+    srs.delete(srs.isin([2, 3]))
+    assert srs.index == [10, 13, 14]
+
+    view = rc.ViewSeries([1, 2, 3], index=[1, 2, 3])
+    assert view.value(view.equality(value=2)) == [2]
+    assert view[Mask([True, False, True])] == [1, 3]
+
+
 def test_reset_index():
     # no index defined
     srs = rc.Series([4, 5, 6])
@@ -246,3 +271,53 @@ def test_reset_index():
     srs.reset_index()
     expected = rc.Series([1, 2, 3], [0, 1, 2], sort=False)
     assert_series_equal(srs, expected)
+
+
+def test_aggregate():
+    srs = rc.Series([1, 2, None, 3])
+    assert srs.count() == 3
+    assert srs.sum() == 6
+    assert srs.mean() == 2
+    assert srs.min() == 1
+    assert srs.max() == 3
+    assert srs.std() == 1.0
+
+    srs = rc.Series()
+    assert srs.count() == 0
+    assert srs.sum() == 0
+    assert srs.mean() is None
+    assert srs.std() is None
+
+    df = rc.DataFrame({'a': [4, 5, 6]})
+    srs = rc.ViewSeries.from_dataframe(df, 'a')
+    assert srs.sum() == 15
+    df.set_cell(1, 'a', 10)
+    assert srs.max() == 10
+
+
+def test_bars():
+    srs = rc.Series([1, 2, 3], index=[1, 2, 3], sort=True)
+    bars = srs.bars(2)
+    assert bars.output.to_dict(index=False) == {'open': [1], 'high': [1], 'low': [1], 'close': [1], 'count': [1]}
+    assert bars.current == {'start': 2, 'open': 2, 'high': 3, 'low': 2, 'close': 3, 'count': 2}
+
+    srs.append_row(4, 0)
+    srs.append_rows([5, 6], [7, None])
+    assert bars.output.index == [0, 2]
+    assert bars.output.get_location(1, as_dict=True) == {'index': 2, 'open': 2, 'high': 3, 'low': 2, 'close': 3,
+                                                         'count': 2}
+    assert bars.current == {'start': 4, 'open': 0, 'high': 7, 'low': 0, 'close': 7, 'count': 2}
+
+    # a rejected row leaves the Series and the bars unchanged
+    with pytest.raises(ValueError):
+        srs.append_row(3.5, 1)
+    with pytest.raises(ValueError):
+        srs.append_rows([7, 0], [1, 2])
+    assert srs.index == [1, 2, 3, 4, 5, 6]
+    assert srs.data == [1, 2, 3, 0, 7, None]
+    assert bars.current == {'start': 4, 'open': 0, 'high': 7, 'low': 0, 'close': 7, 'count': 2}
+    assert bars.output.index == [0, 2]
+
+    srs = rc.Series([1, 2], index=[2, 1], sort=False)
+    with pytest.raises(ValueError):
+        srs.bars(2)
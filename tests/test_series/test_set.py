@@ -213,6 +213,19 @@ def test_set_index_subset_sort():
         actual.set(indexes=[True, True, False], values=[4])
 
 
+def test_set_rows_sorted_bulk_insert():
+    actual = rc.Series([1, 2, 3], index=[10, 20, 30], sort=True)
+    link_index = actual.index
+    link_data = actual.data
+
+    actual.set(indexes=[35, 5, 15, 20, 25, 16, 5], values=[350, 50, 150, 200, 250, 160, 51])
+    assert actual.index == [5, 10, 15, 16, 20, 25, 30, 35]
+    assert actual.data == [51, 1, 150, 160, 200, 250, 3, 350]
+    assert link_index is actual.index
+    assert link_data is actual.data
+    actual.validate_integrity()
+
+
 def test_set_single_value():
     srs = rc.Series([4, 5, 6], index=[10, 11, 12], sort=False)
 
@@ -245,6 +258,18 @@ def test_set_locations():
 
     with pytest.raises(IndexError):
         srs.set_locations([1, 10], [9, 99])
+    assert srs.data == [-1, -10, -3, -10]
+
+    srs.set_locations(slice(1, 3), [6, 7])
+    srs.set_locations(slice(None, None, 3), 0)
+    assert_series_equal(srs, rc.Series([0, 6, 7, 0], index=[2, 4, 6, 8]))
+
+    with pytest.raises(ValueError):
+        srs.set_locations(slice(0, 2), [1, 2, 3])
+
+    # a range of negative locations
+    srs.set_locations(range(-2, 0), [-7, -8])
+    assert srs.data == [0, 6, -7, -8]
 
 
 def test_set_from_blank_srs():
@@ -334,3 +359,53 @@ def test_append_rows():
 
     with pytest.raises(ValueError):
         actual.append_rows([1, 10], [100, 110, 120])
+
+
+def test_append_duplicates():
+    for sort, hash_index in [(False, False), (False, True), (True, False), (True, True)]:
+        actual = rc.Series([1, 3], index=[10, 12], sort=sort, hash_index=hash_index)
+
+        actual.append_row(14, 5)
+        actual.append_rows([20, 22], [7, 6])
+        if not sort:  # new index in the middle of the existing index
+            actual.append_row(11, 2)
+
+        for index in [10, 12, 14, 20, 22]:
+            with pytest.raises(IndexError):
+                actual.append_row(index, 0)
+
+        with pytest.raises(IndexError):
+            actual.append_rows([30, 12], [0, 0])
+        with pytest.raises(IndexError):
+            actual.append_rows([30, 30], [0, 0])
+
+        assert actual.index == ([10, 12, 14, 20, 22] if sort else [10, 12, 14, 20, 22, 11])
+        actual.validate_integrity()
+
+
+def test_append_duplicates_out_of_order():
+    # append_row leaves a sorted object out of order, so the last index value is not the largest
+    actual = rc.Series([1, 2], index=[1, 5], sort=True)
+    actual.append_row(3, 3)
+    assert actual.index == [1, 5, 3]
+
+    with pytest.raises(IndexError):
+        actual.append_row(5, 3)
+
+    with pytest.raises(IndexError):
+        actual.append_rows([4, 5], [4, 6])
+    assert actual.index == [1, 5, 3]
+
+    # sorting puts the object back in order
+    actual.sort_index()
+    actual.append_row(6, 3)
+    assert actual.index == [1, 3, 5, 6]
+    with pytest.raises(IndexError):
+        actual.append_row(5, 3)
+
+    # append_rows leaves a sorted object out of order
+    actual = rc.Series([1, 2], index=[1, 5], sort=True)
+    actual.append_rows([2, 3], [2, 3])
+    assert actual.index == [1, 5, 2, 3]
+    with pytest.raises(IndexError):
+        actual.append_row(5, 3)